@@ -50,6 +50,7 @@ import {
   AddOverlaySnapshotCommand,
   RemoveOverlayCommand,
   UpdateOverlayCommand,
+  UpdateVectorFieldCommand,
 } from "./overlays";
 import { SetRepresentationCommand } from "./representation";
 import { getSelectedCommand, SelectAtomByIdCommand } from "./selection";
@@ -80,6 +81,7 @@ export {
   TakeSnapshotCommand,
   UnmarkAtomCommand,
   UpdateOverlayCommand,
+  UpdateVectorFieldCommand,
 };
 
 /**
@@ -108,6 +110,7 @@ const REGISTERED_COMMAND_CLASSES = [
   AddOverlayCommand,
   RemoveOverlayCommand,
   UpdateOverlayCommand,
+  UpdateVectorFieldCommand,
   AddOverlaySnapshotCommand,
   MarkAtomCommand,
   UnmarkAtomCommand,
@@ -205,3 +205,44 @@ export class UpdateOverlayCommand extends Command<void> {
     });
   }
 }
+
+// ── UpdateVectorFieldCommand ──────────────────────────────────────────────────
+
+/**
+ * Replace the vectors of a vector field in place (same arrow count).
+ * Cheaper than `update_overlay`, which rebuilds the arrow meshes; meant for
+ * per-frame force or velocity fields. Undo restores the previous vectors.
+ * Usage: app.execute("update_vector_field", { id: "vfield_1", vectors })
+ */
+@command("update_vector_field")
+export class UpdateVectorFieldCommand extends Command<void> {
+  private readonly _id: string;
+  private readonly _vectors: Float32Array;
+  private _prevVectors: Float32Array | null = null;
+
+  constructor(app: MolvisApp, args: { id: string; vectors: Float32Array }) {
+    super(app);
+    this._id = args.id;
+    this._vectors = args.vectors;
+  }
+
+  do(): void {
+    const overlay = this.app.overlayManager.get(this._id);
+    if (!(overlay instanceof VectorFieldOverlay)) {
+      throw new Error(`No vector field overlay with id '${this._id}'`);
+    }
+    this._prevVectors = overlay.props.vectors;
+    overlay.setVectors(this._vectors);
+    this.app.events.emit("overlay-changed", { overlay });
+  }
+
+  undo(): UpdateVectorFieldCommand {
+    if (!this._prevVectors) {
+      throw new Error("Cannot undo update_vector_field before it has run");
+    }
+    return new UpdateVectorFieldCommand(this.app, {
+      id: this._id,
+      vectors: this._prevVectors,
+    });
+  }
+}
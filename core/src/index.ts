@@ -214,6 +214,7 @@ export {
   AddOverlayCommand,
   RemoveOverlayCommand,
   UpdateOverlayCommand,
+  UpdateVectorFieldCommand,
 } from "./commands/overlays";
 export type { ContextMenuBuildContext, ContextMenuConfig } from "./config";
 export {
@@ -7,6 +7,7 @@ export {
 } from "./molidx_codec";
 export { OpfsBlobCache } from "./opfs_blob_cache";
 export { OpfsIndexCache } from "./opfs_index_cache";
+export { OpfsSyncCache } from "./opfs_sync_cache";
 export {
   getFileIfExists,
   getOpfsBucket,
@@ -16,3 +17,8 @@ export {
   removeEntryIfExists,
   safeKey,
 } from "./opfs_root";
+export {
+  decodeSyncRecord,
+  encodeSyncRecord,
+  type SyncRecord,
+} from "./sync_record_codec";
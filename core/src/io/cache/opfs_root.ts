@@ -16,7 +16,7 @@ import { logger } from "../../utils/logger";
 const ROOT_DIR = "molvis";
 const VERSION_DIR = "v1";
 
-export type OpfsBucket = "idx" | "blob";
+export type OpfsBucket = "idx" | "blob" | "sync";
 
 export async function getOpfsRoot(): Promise<FileSystemDirectoryHandle | null> {
   if (typeof navigator === "undefined") return null;
@@ -0,0 +1,110 @@
+/**
+ * `OpfsSyncCache` — controller state the page has already received,
+ * kept across reloads so a resumable state sync only carries what is
+ * missing.
+ *
+ * The Python controller cuts its mirror into content-addressed pieces
+ * (chunks of frames, pipeline entries) and names each by a hash. On
+ * reconnect it sends the list of hashes (`scene.state_manifest`), the
+ * page answers with the ones it lacks, and `scene.apply_state` carries
+ * only those in full; every other piece is read back from here. Layout:
+ *
+ *   /molvis/v1/sync/<hash>.<scope>      # binary, see sync_record_codec
+ *
+ * `scope` is the controller's scene name. After every applied sync the
+ * scope is trimmed to the hashes that sync referenced, so the cache
+ * holds one scene state per scope. Best-effort: I/O errors degrade to a
+ * miss, and a miss only means the controller sends that piece again.
+ */
+
+import { logger } from "../../utils/logger";
+import {
+  getFileIfExists,
+  getOpfsBucket,
+  removeEntryIfExists,
+  safeKey,
+} from "./opfs_root";
+import {
+  decodeSyncRecord,
+  encodeSyncRecord,
+  type SyncRecord,
+} from "./sync_record_codec";
+
+export const OpfsSyncCache = {
+  async get(scope: string, key: string): Promise<SyncRecord | null> {
+    const handle = await getFileIfExists("sync", filenameFor(scope, key));
+    if (!handle) return null;
+    try {
+      const file = await handle.getFile();
+      return decodeSyncRecord(await file.arrayBuffer());
+    } catch (err) {
+      logger.warn(`[opfs-sync] read failed for '${key}': ${describeErr(err)}`);
+      return null;
+    }
+  },
+
+  async set(scope: string, key: string, record: SyncRecord): Promise<void> {
+    const dir = await getOpfsBucket("sync");
+    if (!dir) return;
+    try {
+      const handle = await dir.getFileHandle(filenameFor(scope, key), {
+        create: true,
+      });
+      const writable = await handle.createWritable();
+      await writable.write(encodeSyncRecord(record.json, record.buffers));
+      await writable.close();
+    } catch (err) {
+      logger.warn(`[opfs-sync] write failed for '${key}': ${describeErr(err)}`);
+    }
+  },
+
+  /** Hashes cached for `scope`. */
+  async keys(scope: string): Promise<Set<string>> {
+    const out = new Set<string>();
+    for (const name of await listNames()) {
+      const parsed = parseFilename(name);
+      if (parsed && parsed.scope === safeKey(scope)) out.add(parsed.key);
+    }
+    return out;
+  },
+
+  /** Drop every entry of `scope` whose hash is not in `keep`. */
+  async retain(scope: string, keep: ReadonlySet<string>): Promise<void> {
+    for (const name of await listNames()) {
+      const parsed = parseFilename(name);
+      if (parsed && parsed.scope === safeKey(scope) && !keep.has(parsed.key)) {
+        await removeEntryIfExists("sync", name);
+      }
+    }
+  },
+};
+
+function filenameFor(scope: string, key: string): string {
+  return `${safeKey(key).replace(/\./g, "_")}.${safeKey(scope)}`;
+}
+
+function parseFilename(name: string): { key: string; scope: string } | null {
+  const dot = name.indexOf(".");
+  if (dot <= 0) return null;
+  return { key: name.slice(0, dot), scope: name.slice(dot + 1) };
+}
+
+async function listNames(): Promise<string[]> {
+  const dir = await getOpfsBucket("sync");
+  if (!dir) return [];
+  const out: string[] = [];
+  try {
+    const iter = dir as unknown as AsyncIterable<[string, FileSystemHandle]> & {
+      entries?: () => AsyncIterable<[string, FileSystemHandle]>;
+    };
+    const entries = iter.entries ? iter.entries() : iter;
+    for await (const [name] of entries) out.push(name);
+  } catch (err) {
+    logger.warn(`[opfs-sync] list failed: ${describeErr(err)}`);
+  }
+  return out;
+}
+
+function describeErr(err: unknown): string {
+  return err instanceof Error ? err.message : String(err);
+}
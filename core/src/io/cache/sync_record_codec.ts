@@ -0,0 +1,110 @@
+/**
+ * Sync record codec — one content-addressed piece of controller state
+ * (a chunk of frames, a pipeline entry) as stored by `OpfsSyncCache`.
+ * A record is the JSON-RPC payload for that piece with its binary
+ * buffers renumbered from zero, so it decodes with the same
+ * `decodeBinaryPayload` as a live message.
+ *
+ * Layout (all little-endian):
+ *
+ *   magic      u32   "MVSR" (0x5253564D LE)
+ *   version    u32   format version, currently 1
+ *   jsonBytes  u32   UTF-8 length of the JSON payload
+ *   nbuffers   u32   buffer count
+ *   lengths    nbuffers × u64 byte length
+ *   json       UTF-8, zero-padded to 8 bytes
+ *   buffers    each zero-padded to 8 bytes
+ *
+ * Padding keeps every buffer 8-byte aligned, so decoded typed arrays are
+ * views into the record instead of copies. Decoders that see anything
+ * unexpected return null so the caller treats the record as missing.
+ */
+
+export interface SyncRecord {
+  json: unknown;
+  buffers: DataView[];
+}
+
+const MAGIC = 0x5253564d;
+const VERSION = 1;
+const HEADER_BYTES = 4 + 4 + 4 + 4;
+const ALIGN = 8;
+
+function padded(n: number): number {
+  return Math.ceil(n / ALIGN) * ALIGN;
+}
+
+export function encodeSyncRecord(
+  json: unknown,
+  buffers: readonly ArrayBufferView[],
+): ArrayBuffer {
+  const jsonBytes = new TextEncoder().encode(JSON.stringify(json));
+  let total = HEADER_BYTES + buffers.length * 8 + padded(jsonBytes.byteLength);
+  for (const buf of buffers) total += padded(buf.byteLength);
+
+  const out = new ArrayBuffer(total);
+  const dv = new DataView(out);
+  const bytes = new Uint8Array(out);
+  let p = 0;
+  dv.setUint32(p, MAGIC, true);
+  p += 4;
+  dv.setUint32(p, VERSION, true);
+  p += 4;
+  dv.setUint32(p, jsonBytes.byteLength, true);
+  p += 4;
+  dv.setUint32(p, buffers.length, true);
+  p += 4;
+  for (const buf of buffers) {
+    dv.setBigUint64(p, BigInt(buf.byteLength), true);
+    p += 8;
+  }
+  bytes.set(jsonBytes, p);
+  p += padded(jsonBytes.byteLength);
+  for (const buf of buffers) {
+    bytes.set(new Uint8Array(buf.buffer, buf.byteOffset, buf.byteLength), p);
+    p += padded(buf.byteLength);
+  }
+  return out;
+}
+
+export function decodeSyncRecord(buf: ArrayBuffer): SyncRecord | null {
+  if (buf.byteLength < HEADER_BYTES) return null;
+  const dv = new DataView(buf);
+  let p = 0;
+  if (dv.getUint32(p, true) !== MAGIC) return null;
+  p += 4;
+  if (dv.getUint32(p, true) !== VERSION) return null;
+  p += 4;
+  const jsonLength = dv.getUint32(p, true);
+  p += 4;
+  const nbuffers = dv.getUint32(p, true);
+  p += 4;
+  if (p + nbuffers * 8 > buf.byteLength) return null;
+
+  const lengths: number[] = new Array(nbuffers);
+  let expected = p + nbuffers * 8 + padded(jsonLength);
+  for (let i = 0; i < nbuffers; i++) {
+    const length = dv.getBigUint64(p, true);
+    p += 8;
+    if (length > BigInt(buf.byteLength)) return null;
+    lengths[i] = Number(length);
+    expected += padded(lengths[i]);
+  }
+  if (expected !== buf.byteLength) return null;
+
+  let json: unknown;
+  try {
+    const text = new TextDecoder().decode(new Uint8Array(buf, p, jsonLength));
+    json = JSON.parse(text);
+  } catch {
+    return null;
+  }
+  p += padded(jsonLength);
+
+  const buffers: DataView[] = new Array(nbuffers);
+  for (let i = 0; i < nbuffers; i++) {
+    buffers[i] = new DataView(buf, p, lengths[i]);
+    p += padded(lengths[i]);
+  }
+  return { json, buffers };
+}
@@ -3,6 +3,8 @@
  *
  * Uses two base meshes (shaft cylinder + head cone) with thin instance buffers
  * for GPU-efficient rendering of large vector fields (e.g. atomic forces).
+ * `setVectors` rewrites those buffers in place, so a per-frame force or
+ * velocity field animates without rebuilding any mesh.
  */
 
 import type { Scene } from "@babylonjs/core";
@@ -76,6 +78,10 @@ export class VectorFieldOverlay implements Overlay {
   private _shaftMat: StandardMaterial;
   private _coneMat: StandardMaterial;
   private _visible = true;
+  private _shaftMatrices = new Float32Array(0);
+  private _coneMatrices = new Float32Array(0);
+  private _shaftColors = new Float32Array(0);
+  private _coneColors = new Float32Array(0);
 
   private constructor(
     id: string,
@@ -115,6 +121,32 @@ export class VectorFieldOverlay implements Overlay {
     return this;
   }
 
+  /**
+   * Replace the vectors of an existing field (same arrow count), keeping
+   * positions and style. Rewrites the thin-instance buffers in place.
+   */
+  setVectors(vectors: Float32Array): this {
+    if (vectors.length !== this._props.positions.length) {
+      throw new Error(
+        `vector field ${this.id} has ${this._props.positions.length / 3} ` +
+          `arrows, got ${vectors.length / 3} vectors`,
+      );
+    }
+    this._props = { ...this._props, vectors };
+    const shaft = this._shaftMesh;
+    const cone = this._coneMesh;
+    if (!shaft || !cone) {
+      this._build();
+      return this;
+    }
+    this._writeInstances(this._shaftMatrices.length / 16);
+    shaft.thinInstanceBufferUpdated("matrix");
+    shaft.thinInstanceBufferUpdated("color");
+    cone.thinInstanceBufferUpdated("matrix");
+    cone.thinInstanceBufferUpdated("color");
+    return this;
+  }
+
   dispose(): void {
     this._disposeMeshes();
     this._shaftMat.dispose();
@@ -143,34 +175,11 @@ export class VectorFieldOverlay implements Overlay {
   }
 
   private _build(): void {
-    const {
-      positions,
-      vectors,
-      scale,
-      maxArrows,
-      shaftRadius,
-      headRatio,
-      colorMode,
-      color,
-    } = this._props;
+    const { positions, vectors, maxArrows, shaftRadius } = this._props;
 
     const n = Math.min(positions.length / 3, vectors.length / 3, maxArrows);
     if (n === 0) return;
 
-    // Pre-compute max magnitude for color mapping
-    let maxMag = 0;
-    if (colorMode === "magnitude") {
-      for (let i = 0; i < n; i++) {
-        const vx = vectors[i * 3];
-        const vy = vectors[i * 3 + 1];
-        const vz = vectors[i * 3 + 2];
-        const mag = Math.sqrt(vx * vx + vy * vy + vz * vz);
-        if (mag > maxMag) maxMag = mag;
-      }
-    }
-
-    const uniformColor = hexToColor3(color);
-
     // Base meshes (1 instance to start, will be replaced by thin instances)
     const shaftBase = MeshBuilder.CreateCylinder(
       `${this.id}_shaft_base`,
@@ -199,11 +208,48 @@ export class VectorFieldOverlay implements Overlay {
     coneBase.material = this._coneMat;
     coneBase.isPickable = false;
 
-    // Build thin instance matrices + colors
-    const shaftMatrices = new Float32Array(n * 16);
-    const coneMatrices = new Float32Array(n * 16);
-    const shaftColors = new Float32Array(n * 4);
-    const coneColors = new Float32Array(n * 4);
+    this._shaftMatrices = new Float32Array(n * 16);
+    this._coneMatrices = new Float32Array(n * 16);
+    this._shaftColors = new Float32Array(n * 4);
+    this._coneColors = new Float32Array(n * 4);
+    this._writeInstances(n);
+
+    shaftBase.thinInstanceSetBuffer("matrix", this._shaftMatrices, 16);
+    shaftBase.thinInstanceSetBuffer("color", this._shaftColors, 4);
+    coneBase.thinInstanceSetBuffer("matrix", this._coneMatrices, 16);
+    coneBase.thinInstanceSetBuffer("color", this._coneColors, 4);
+
+    this._shaftMesh = shaftBase;
+    this._coneMesh = coneBase;
+
+    if (!this._visible) {
+      shaftBase.setEnabled(false);
+      coneBase.setEnabled(false);
+    }
+  }
+
+  /** Fill the first `n` thin-instance matrices + colors from the props. */
+  private _writeInstances(n: number): void {
+    const { positions, vectors, scale, headRatio, colorMode, color } =
+      this._props;
+    const shaftMatrices = this._shaftMatrices;
+    const coneMatrices = this._coneMatrices;
+    const shaftColors = this._shaftColors;
+    const coneColors = this._coneColors;
+
+    // Pre-compute max magnitude for color mapping
+    let maxMag = 0;
+    if (colorMode === "magnitude") {
+      for (let i = 0; i < n; i++) {
+        const vx = vectors[i * 3];
+        const vy = vectors[i * 3 + 1];
+        const vz = vectors[i * 3 + 2];
+        const mag = Math.sqrt(vx * vx + vy * vy + vz * vz);
+        if (mag > maxMag) maxMag = mag;
+      }
+    }
+
+    const uniformColor = hexToColor3(color);
 
     const pos = new Vector3();
     const vecV = new Vector3();
@@ -281,19 +327,6 @@ export class VectorFieldOverlay implements Overlay {
       coneColors[i * 4 + 2] = c.b;
       coneColors[i * 4 + 3] = 1;
     }
-
-    shaftBase.thinInstanceSetBuffer("matrix", shaftMatrices, 16);
-    shaftBase.thinInstanceSetBuffer("color", shaftColors, 4);
-    coneBase.thinInstanceSetBuffer("matrix", coneMatrices, 16);
-    coneBase.thinInstanceSetBuffer("color", coneColors, 4);
-
-    this._shaftMesh = shaftBase;
-    this._coneMesh = coneBase;
-
-    if (!this._visible) {
-      shaftBase.setEnabled(false);
-      coneBase.setEnabled(false);
-    }
   }
 }
 
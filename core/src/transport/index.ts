@@ -71,8 +71,9 @@ export function attachWebSocketBridge(
       opts.onConnected?.();
       // Ask the controller for whatever it last pushed — the reply
       // arrives as a ``scene.apply_state`` RPC which the router turns
-      // into a ``backend-state-sync`` event on the app bus.
-      bridge.sendEvent("event.request_state_sync", {});
+      // into a ``backend-state-sync`` event on the app bus. ``resume``
+      // lets the controller skip pieces already in the OPFS sync cache.
+      bridge.sendEvent("event.request_state_sync", { resume: true });
     })
     .catch((err) => {
       if (opts.onError) {
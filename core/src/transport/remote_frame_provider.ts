@@ -0,0 +1,68 @@
+/**
+ * Async frame provider backed by the Python controller.
+ *
+ * Used by ``scene.attach_trajectory``: the controller only announces the
+ * frame count, and every frame the timeline needs is requested on demand
+ * with an ``event.request_frame`` notification. The controller answers
+ * with a ``scene.provide_frame`` RPC, which the router hands to
+ * {@link RemoteFrameProvider.fulfil}. Concurrent requests for the same
+ * index share one round trip; the trajectory's LRU keeps recently viewed
+ * frames so scrubbing back and forth does not re-fetch them.
+ */
+
+import type { Frame } from "@molcrafts/molrs";
+import type { AsyncFrameProvider } from "../system/trajectory";
+
+interface PendingFrame {
+  resolve: (frame: Frame) => void;
+  reject: (error: Error) => void;
+}
+
+export class RemoteFrameProvider implements AsyncFrameProvider {
+  private readonly pending = new Map<number, PendingFrame[]>();
+  private disposed = false;
+
+  constructor(
+    readonly length: number,
+    private readonly request: (index: number) => void,
+  ) {}
+
+  get(index: number): Promise<Frame> {
+    if (this.disposed) {
+      return Promise.reject(new Error("Remote trajectory was detached"));
+    }
+    return new Promise<Frame>((resolve, reject) => {
+      const waiters = this.pending.get(index);
+      if (waiters) {
+        waiters.push({ resolve, reject });
+        return;
+      }
+      this.pending.set(index, [{ resolve, reject }]);
+      this.request(index);
+    });
+  }
+
+  /** Resolve every outstanding request for `index`. Returns false if none. */
+  fulfil(index: number, frame: Frame): boolean {
+    const waiters = this.pending.get(index);
+    if (!waiters) return false;
+    this.pending.delete(index);
+    for (const waiter of waiters) waiter.resolve(frame);
+    return true;
+  }
+
+  /** Reject every outstanding request for `index` with `message`. */
+  fail(index: number, message: string): void {
+    const waiters = this.pending.get(index);
+    if (!waiters) return;
+    this.pending.delete(index);
+    for (const waiter of waiters) waiter.reject(new Error(message));
+  }
+
+  dispose(): void {
+    this.disposed = true;
+    for (const index of [...this.pending.keys()]) {
+      this.fail(index, "Remote trajectory was detached");
+    }
+  }
+}
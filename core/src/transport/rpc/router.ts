@@ -14,7 +14,12 @@ import {
   type RepresentationId,
 } from "../../artist/representation";
 import type { MarkAtomOverlay } from "../../overlays/mark_atom";
-import type { MarkAtomProps } from "../../overlays/types";
+import type {
+  MarkAtomProps,
+  MarkLabel,
+  MarkShape,
+  Overlay,
+} from "../../overlays/types";
 import {
   DATA_SOURCE_CATEGORY,
   DataSourceModifier,
@@ -22,8 +27,17 @@ import {
 } from "../../pipeline/data_source_modifier";
 import type { Modifier } from "../../pipeline/modifier";
 import { ModifierRegistry } from "../../pipeline/modifier_registry";
+import { OpfsSyncCache } from "../../io/cache/opfs_sync_cache";
 import { Trajectory } from "../../system/trajectory";
-import { buildBox, buildFrame, decodeBinaryPayload } from "./serialization";
+import { logger } from "../../utils/logger";
+import { RemoteFrameProvider } from "../remote_frame_provider";
+import {
+  buildBox,
+  buildFrame,
+  decodeBinaryPayload,
+  detachBinaryPayload,
+  resolveFrameDeltas,
+} from "./serialization";
 import type {
   JsonRPCRequest,
   RPCResponseEnvelope,
@@ -57,6 +71,12 @@ type RPCHandler = (
   buffers: DataView[],
 ) => Promise<unknown> | unknown;
 
+/** Push a JSON-RPC notification back to the controller. */
+export type RPCNotify = (
+  method: string,
+  params: Record<string, unknown>,
+) => void;
+
 function asRecord(value: unknown): Record<string, unknown> {
   return typeof value === "object" && value !== null
     ? (value as Record<string, unknown>)
@@ -218,12 +238,64 @@ function requireInteger(value: unknown, label: string): number {
   return value;
 }
 
+/**
+ * Decode the ``frames`` / ``boxes`` arrays shared by ``scene.set_trajectory``
+ * and ``scene.append_frames``.
+ */
+function decodeFrameChunk(
+  method: string,
+  params: Record<string, unknown>,
+  buffers: DataView[],
+): { frames: Frame[]; boxes: (Box | undefined)[] } {
+  const decoded = decodeBinaryPayload(params, buffers) as Record<
+    string,
+    unknown
+  >;
+  const rawFrames = decoded.frames;
+  if (!Array.isArray(rawFrames) || rawFrames.length === 0) {
+    throw invalidParams(`${method} requires a non-empty 'frames' array`);
+  }
+  const rawBoxes = Array.isArray(decoded.boxes) ? decoded.boxes : [];
+
+  let frameData: SerializedFrameData[];
+  try {
+    frameData = resolveFrameDeltas(rawFrames);
+  } catch (error) {
+    const message = error instanceof Error ? error.message : String(error);
+    throw invalidParams(`${method}: ${message}`);
+  }
+  const frames: Frame[] = frameData.map((data, i) => {
+    try {
+      return buildFrame(data);
+    } catch (error) {
+      const message = error instanceof Error ? error.message : String(error);
+      throw invalidParams(`frames[${i}]: ${message}`);
+    }
+  });
+
+  const boxes: (Box | undefined)[] = rawBoxes.map((raw, i) => {
+    if (raw == null) return undefined;
+    try {
+      return buildBox(asRecord(raw) as unknown as SerializedBoxData);
+    } catch (error) {
+      const message = error instanceof Error ? error.message : String(error);
+      throw invalidParams(`boxes[${i}]: ${message}`);
+    }
+  });
+
+  return { frames, boxes };
+}
+
 export class RPCRouter {
   private readonly app: MolvisApp;
   private readonly handlers: Map<string, RPCHandler>;
+  private readonly notify: RPCNotify;
+  private remoteFrames: RemoteFrameProvider | null = null;
+  private remoteTrajectory: Trajectory | null = null;
 
-  constructor(app: MolvisApp) {
+  constructor(app: MolvisApp, notify: RPCNotify = () => {}) {
     this.app = app;
+    this.notify = notify;
     this.handlers = new Map<string, RPCHandler>([
       ["scene.new_frame", this.handleNewFrame],
       ["scene.draw_frame", this.handleDrawFrame],
@@ -231,8 +303,12 @@ export class RPCRouter {
       ["scene.clear", this.handleClear],
       ["scene.export_frame", this.handleExportFrame],
       ["scene.set_trajectory", this.handleSetTrajectory],
+      ["scene.append_frames", this.handleAppendFrames],
+      ["scene.attach_trajectory", this.handleAttachTrajectory],
+      ["scene.provide_frame", this.handleProvideFrame],
       ["scene.set_frame_labels", this.handleSetFrameLabels],
       ["scene.apply_state", this.handleApplyState],
+      ["scene.state_manifest", this.handleStateManifest],
       ["selection.get", this.handleSelectionGet],
       ["selection.select_atoms", this.handleSelectionSelectAtoms],
       ["selection.clear", this.handleSelectionClear],
@@ -249,11 +325,17 @@ export class RPCRouter {
       ["pipeline.set_selection_scope", this.handlePipelineSetSelectionScope],
       ["pipeline.set_source_owner", this.handlePipelineSetSourceOwner],
       ["pipeline.clear", this.handlePipelineClear],
+      ["pipeline.set", this.handlePipelineSet],
       ["scene.add_data_source", this.handleAddDataSource],
       ["scene.remove_data_source", this.handleRemoveDataSource],
       ["scene.list_data_sources", this.handleListDataSources],
       ["snapshot.take", this.handleSnapshotTake],
+      ["overlay.add", this.handleOverlayAdd],
+      ["overlay.update", this.handleOverlayUpdate],
+      ["overlay.update_vectors", this.handleOverlayUpdateVectors],
+      ["overlay.remove", this.handleOverlayRemove],
       ["overlay.mark_atom", this.handleOverlayMarkAtom],
+      ["overlay.mark_atoms", this.handleOverlayMarkAtoms],
       ["overlay.unmark_atom", this.handleOverlayUnmarkAtom],
       ["view.set_style", this.handleSetStyle],
       ["view.set_theme", this.handleSetTheme],
@@ -370,7 +452,7 @@ export class RPCRouter {
 
   private handleNewFrame: RPCHandler = async (params) => {
     if (params.clear === false) {
-      return { success: true };
+      return { success: true, pipeline: this.pipelineSnapshot() };
     }
     const frame = new Frame();
     await this.app.setTrajectory(new Trajectory([frame]), {
@@ -379,7 +461,7 @@ export class RPCRouter {
     });
     await this.app.applyPipeline({ fullRebuild: true });
     this.app.world.resetCamera();
-    return { success: true };
+    return { success: true, pipeline: this.pipelineSnapshot() };
   };
 
   private handleDrawFrame: RPCHandler = async (params, buffers) => {
@@ -427,7 +509,7 @@ export class RPCRouter {
     await this.app.applyPipeline({ fullRebuild: true });
     this.app.world.resetCamera();
 
-    return { success: true };
+    return { success: true, pipeline: this.pipelineSnapshot() };
   };
 
   private handleDrawBox: RPCHandler = (params, buffers) => {
@@ -473,27 +555,69 @@ export class RPCRouter {
   };
 
   private handleSetTrajectory: RPCHandler = async (params, buffers) => {
+    const { frames, boxes } = decodeFrameChunk(
+      "scene.set_trajectory",
+      params,
+      buffers,
+    );
+
+    const sessionLabel = this.sessionLabel(frames.length);
+    await this.app.setTrajectory(new Trajectory(frames, boxes), {
+      sourceType: "backend",
+      filename: sessionLabel,
+    });
+    await this.app.applyPipeline({ fullRebuild: true });
+    this.app.world.resetCamera();
+    return {
+      success: true,
+      nFrames: frames.length,
+      pipeline: this.pipelineSnapshot(),
+    };
+  };
+
+  /**
+   * Append a chunk of frames to the active trajectory. Python streams
+   * long trajectories as one ``scene.set_trajectory`` (first chunk) plus
+   * a series of these, so the viewer is interactive after the first
+   * chunk instead of after the whole upload.
+   */
+  private handleAppendFrames: RPCHandler = (params, buffers) => {
+    const { frames, boxes } = decodeFrameChunk(
+      "scene.append_frames",
+      params,
+      buffers,
+    );
+    const trajectory = this.app.system.trajectory;
+    if (trajectory.isLazy || trajectory === this.remoteTrajectory) {
+      throw invalidParams(
+        "scene.append_frames cannot extend a lazily loaded trajectory",
+      );
+    }
+    frames.forEach((frame, i) => {
+      trajectory.addFrame(frame, boxes[i]);
+    });
+    this.app.events.emit("trajectory-change", trajectory);
+    return { success: true, nFrames: trajectory.length };
+  };
+
+  /**
+   * Install a trajectory whose frames stay on the controller. Only the
+   * frame count (and optional per-frame boxes) arrive here; frames are
+   * requested one at a time via ``event.request_frame`` as the timeline
+   * seeks, and delivered through ``scene.provide_frame``.
+   */
+  private handleAttachTrajectory: RPCHandler = async (params, buffers) => {
     const decoded = decodeBinaryPayload(params, buffers) as Record<
       string,
       unknown
     >;
-    const rawFrames = decoded.frames;
-    if (!Array.isArray(rawFrames) || rawFrames.length === 0) {
+    const nFrames = decoded.n_frames;
+    if (typeof nFrames !== "number" || !Number.isInteger(nFrames) || nFrames < 1) {
       throw invalidParams(
-        "scene.set_trajectory requires a non-empty 'frames' array",
+        "scene.attach_trajectory requires 'n_frames' as a positive integer",
       );
     }
     const rawBoxes = Array.isArray(decoded.boxes) ? decoded.boxes : [];
-
-    const frames: Frame[] = rawFrames.map((raw, i) => {
-      try {
-        return buildFrame(asRecord(raw) as unknown as SerializedFrameData);
-      } catch (error) {
-        const message = error instanceof Error ? error.message : String(error);
-        throw invalidParams(`frames[${i}]: ${message}`);
-      }
-    });
-
     const boxes: (Box | undefined)[] = rawBoxes.map((raw, i) => {
       if (raw == null) return undefined;
       try {
@@ -504,14 +628,64 @@ export class RPCRouter {
       }
     });
 
-    const sessionLabel = this.sessionLabel(frames.length);
-    await this.app.setTrajectory(new Trajectory(frames, boxes), {
+    const provider = new RemoteFrameProvider(nFrames, (index) => {
+      this.notify("event.request_frame", { index });
+    });
+    const trajectory = Trajectory.fromAsyncProvider(provider, boxes);
+    this.remoteFrames = provider;
+    this.remoteTrajectory = trajectory;
+    await this.app.setTrajectory(trajectory, {
       sourceType: "backend",
-      filename: sessionLabel,
+      filename: this.sessionLabel(nFrames),
     });
     await this.app.applyPipeline({ fullRebuild: true });
     this.app.world.resetCamera();
-    return { success: true, nFrames: frames.length };
+    return { success: true, nFrames, pipeline: this.pipelineSnapshot() };
+  };
+
+  private handleProvideFrame: RPCHandler = (params, buffers) => {
+    const index = requireInteger(params.index, "index");
+    const provider = this.remoteFrames;
+    if (!provider) {
+      throw invalidRequest("No remote trajectory is attached");
+    }
+    if (typeof params.error === "string") {
+      provider.fail(index, params.error);
+      return { success: true };
+    }
+    let frame: Frame;
+    try {
+      const decoded = decodeBinaryPayload(params, buffers) as Record<
+        string,
+        unknown
+      >;
+      frame = buildFrame(asRecord(decoded.frame) as unknown as SerializedFrameData);
+    } catch (error) {
+      const message = error instanceof Error ? error.message : String(error);
+      provider.fail(index, message);
+      throw invalidParams(`frame ${index}: ${message}`);
+    }
+    return { success: true, delivered: provider.fulfil(index, frame) };
+  };
+
+  /**
+   * First half of a resumable state sync: report which of the
+   * controller's chunk / modifier hashes are not in the OPFS sync cache
+   * for ``scope``. The following ``scene.apply_state`` carries those in
+   * full and the rest as bare ``{hash}`` references.
+   */
+  private handleStateManifest: RPCHandler = async (params) => {
+    const scope = requireString(params.scope, "scope") as string;
+    const keys = [params.chunks, params.modifiers].flatMap((list, i) => {
+      if (!Array.isArray(list) || list.some((k) => typeof k !== "string")) {
+        throw invalidParams(
+          `${i === 0 ? "chunks" : "modifiers"} must be an array of strings`,
+        );
+      }
+      return list as string[];
+    });
+    const held = await OpfsSyncCache.keys(scope);
+    return { missing: keys.filter((key) => !held.has(key)) };
   };
 
   /**
@@ -521,12 +695,14 @@ export class RPCRouter {
    * ``backend-state-sync`` event so the React layer can compare against
    * the local pipeline and either auto-apply (local is empty) or prompt
    * the user to choose between the two.
+   *
+   * A resumable snapshot (``chunks`` present) is first expanded into the
+   * plain form by ``resolveSyncState``.
    */
-  private handleApplyState: RPCHandler = (params, buffers) => {
-    const decoded = decodeBinaryPayload(params, buffers) as Record<
-      string,
-      unknown
-    >;
+  private handleApplyState: RPCHandler = async (params, buffers) => {
+    const decoded = Array.isArray(params.chunks)
+      ? await this.resolveSyncState(params, buffers)
+      : (decodeBinaryPayload(params, buffers) as Record<string, unknown>);
 
     const rawPipeline = Array.isArray(decoded.pipeline) ? decoded.pipeline : [];
     const pipeline = rawPipeline.map((raw, i) => {
@@ -585,9 +761,16 @@ export class RPCRouter {
     });
 
     const rawFrames = Array.isArray(decoded.frames) ? decoded.frames : [];
-    const frames: Frame[] = rawFrames.map((raw, i) => {
+    let frameData: SerializedFrameData[];
+    try {
+      frameData = resolveFrameDeltas(rawFrames);
+    } catch (error) {
+      const message = error instanceof Error ? error.message : String(error);
+      throw invalidParams(`scene.apply_state ${message}`);
+    }
+    const frames: Frame[] = frameData.map((data, i) => {
       try {
-        return buildFrame(asRecord(raw) as unknown as SerializedFrameData);
+        return buildFrame(data);
       } catch (error) {
         const message = error instanceof Error ? error.message : String(error);
         throw invalidParams(`scene.apply_state frames[${i}]: ${message}`);
@@ -614,6 +797,79 @@ export class RPCRouter {
     return { success: true };
   };
 
+  /**
+   * Expand a resumable ``scene.apply_state`` into ``{pipeline, frames,
+   * boxes}``. Entries sent in full are decoded and written to the OPFS
+   * sync cache; bare ``{hash}`` entries are read back from it. Chunks
+   * are concatenated in order, which rebuilds the controller's
+   * delta-encoded frame list. Once applied, the scope is trimmed to the
+   * hashes this sync referenced.
+   */
+  private async resolveSyncState(
+    params: Record<string, unknown>,
+    buffers: DataView[],
+  ): Promise<Record<string, unknown>> {
+    const scope = requireString(params.scope, "scope") as string;
+    const referenced = new Set<string>();
+    const writes: Promise<void>[] = [];
+
+    const expand = async (
+      raw: unknown,
+      label: string,
+    ): Promise<Record<string, unknown>> => {
+      const { hash, ...content } = asRecord(raw);
+      if (typeof hash !== "string" || hash.length === 0) {
+        throw invalidParams(`scene.apply_state ${label} missing hash`);
+      }
+      referenced.add(hash);
+      if (Object.keys(content).length > 0) {
+        const detached = detachBinaryPayload(content, buffers);
+        writes.push(
+          OpfsSyncCache.set(scope, hash, {
+            json: detached.value,
+            buffers: detached.buffers,
+          }),
+        );
+        return decodeBinaryPayload(content, buffers) as Record<string, unknown>;
+      }
+      const record = await OpfsSyncCache.get(scope, hash);
+      if (!record) {
+        throw invalidParams(
+          `scene.apply_state ${label} '${hash}' is not in the sync cache`,
+        );
+      }
+      return decodeBinaryPayload(record.json, record.buffers) as Record<
+        string,
+        unknown
+      >;
+    };
+
+    const rawPipeline = Array.isArray(params.pipeline) ? params.pipeline : [];
+    const pipeline: unknown[] = [];
+    for (const [i, raw] of rawPipeline.entries()) {
+      pipeline.push(await expand(raw, `pipeline[${i}]`));
+    }
+
+    const frames: unknown[] = [];
+    let boxes: unknown[] | undefined;
+    for (const [i, raw] of (params.chunks as unknown[]).entries()) {
+      const chunk = await expand(raw, `chunks[${i}]`);
+      const chunkFrames = Array.isArray(chunk.frames) ? chunk.frames : [];
+      if (Array.isArray(chunk.boxes)) {
+        boxes ??= new Array(frames.length).fill(null);
+        boxes.push(...chunk.boxes);
+      } else if (boxes) {
+        boxes.push(...new Array(chunkFrames.length).fill(null));
+      }
+      frames.push(...chunkFrames);
+    }
+
+    void Promise.all(writes)
+      .then(() => OpfsSyncCache.retain(scope, referenced))
+      .catch((err) => logger.warn(`[state-sync] cache update failed: ${err}`));
+    return { pipeline, frames, boxes };
+  }
+
   private handleSetFrameLabels: RPCHandler = (params, buffers) => {
     const decoded = decodeBinaryPayload(params, buffers) as Record<
       string,
@@ -732,6 +988,54 @@ export class RPCRouter {
   private handleSnapshotTake: RPCHandler = () =>
     this.app.execute("take_snapshot", {});
 
+  private handleOverlayAdd: RPCHandler = async (params, buffers) => {
+    // Vector fields carry `positions` / `vectors` as binary buffers.
+    const spec = decodeBinaryPayload(params, buffers) as Record<
+      string,
+      unknown
+    >;
+    if (typeof spec.type !== "string") {
+      throw invalidParams("overlay.add requires a 'type'");
+    }
+    const overlay = (await Promise.resolve(
+      this.app.execute<Record<string, unknown>, Overlay>("add_overlay", spec),
+    )) as Overlay;
+    return { id: overlay.id };
+  };
+
+  private handleOverlayUpdate: RPCHandler = async (params, buffers) => {
+    const id = requireString(params.id, "id");
+    const patch = decodeBinaryPayload(params.patch ?? {}, buffers);
+    await Promise.resolve(this.app.execute("update_overlay", { id, patch }));
+    return { success: true };
+  };
+
+  private handleOverlayUpdateVectors: RPCHandler = async (params, buffers) => {
+    const id = requireString(params.id, "id");
+    const vectors = decodeBinaryPayload(params.vectors, buffers);
+    if (!(vectors instanceof Float32Array)) {
+      throw invalidParams(
+        "overlay.update_vectors requires 'vectors' as a float32 buffer",
+      );
+    }
+    try {
+      await Promise.resolve(
+        this.app.execute("update_vector_field", { id, vectors }),
+      );
+    } catch (error) {
+      throw invalidParams(
+        error instanceof Error ? error.message : String(error),
+      );
+    }
+    return { success: true };
+  };
+
+  private handleOverlayRemove: RPCHandler = async (params) => {
+    const id = requireString(params.id, "id");
+    await Promise.resolve(this.app.execute("remove_overlay", { id }));
+    return { success: true };
+  };
+
   private handleOverlayMarkAtom: RPCHandler = async (params) => {
     const rawId = params.anchorAtomId;
     if (typeof rawId !== "number" || !Number.isInteger(rawId) || rawId < 0) {
@@ -753,6 +1057,79 @@ export class RPCRouter {
     return { id: overlay.id };
   };
 
+  /**
+   * Bulk `mark_atom`: one request carries the anchor ids as a binary buffer,
+   * optional per-atom `labels` / `colors`, and a shared `shape` / `label`
+   * style. All-or-nothing — if any atom cannot be marked, the marks created
+   * so far are removed again.
+   */
+  private handleOverlayMarkAtoms: RPCHandler = async (params, buffers) => {
+    const decoded = decodeBinaryPayload(params, buffers) as Record<
+      string,
+      unknown
+    >;
+    const rawIds = decoded.anchorAtomIds;
+    if (!ArrayBuffer.isView(rawIds) && !Array.isArray(rawIds)) {
+      throw invalidParams("overlay.mark_atoms requires 'anchorAtomIds'");
+    }
+    const anchorIds = Array.from(rawIds as ArrayLike<number>, Number);
+    if (anchorIds.some((id) => !Number.isInteger(id) || id < 0)) {
+      throw invalidParams(
+        "overlay.mark_atoms requires non-negative integer 'anchorAtomIds'",
+      );
+    }
+    const perAtom = (key: string): unknown[] | null => {
+      const value = decoded[key];
+      if (value === undefined || value === null) return null;
+      if (!Array.isArray(value) || value.length !== anchorIds.length) {
+        throw invalidParams(
+          `overlay.mark_atoms '${key}' must have one entry per atom`,
+        );
+      }
+      return value;
+    };
+    const labels = perAtom("labels");
+    const colors = perAtom("colors");
+    const shape = decoded.shape as MarkShape | null | undefined;
+    const labelStyle = (decoded.label ?? {}) as Omit<MarkLabel, "text">;
+    const name = typeof decoded.name === "string" ? decoded.name : undefined;
+
+    const created: string[] = [];
+    try {
+      for (let i = 0; i < anchorIds.length; i++) {
+        const props: MarkAtomProps = { anchorAtomId: anchorIds[i] };
+        const color = colors?.[i];
+        if (shape === null) {
+          props.shape = null;
+        } else if (shape !== undefined || typeof color === "string") {
+          props.shape = {
+            ...shape,
+            ...(typeof color === "string" ? { color } : {}),
+          };
+        }
+        const text = labels?.[i];
+        if (typeof text === "string") {
+          props.label = { ...labelStyle, text };
+        }
+        if (name !== undefined) {
+          props.name = name;
+        }
+        const overlay = (await Promise.resolve(
+          this.app.execute<MarkAtomProps, MarkAtomOverlay>("mark_atom", props),
+        )) as MarkAtomOverlay;
+        created.push(overlay.id);
+      }
+    } catch (error) {
+      for (const id of created) {
+        await Promise.resolve(this.app.execute("unmark_atom", { id }));
+      }
+      throw invalidParams(
+        error instanceof Error ? error.message : String(error),
+      );
+    }
+    return { ids: created };
+  };
+
   private handleOverlayUnmarkAtom: RPCHandler = async (params) => {
     const id = requireString(params.id, "id");
     if (!id) {
@@ -825,13 +1202,18 @@ export class RPCRouter {
   // ---------------------------------------------------------------------
 
   private handlePipelineList: RPCHandler = () => {
-    return {
-      modifiers: this.app.modifierPipeline
-        .getModifiers()
-        .map(serializeModifier),
-    };
+    return { modifiers: this.pipelineSnapshot() };
   };
 
+  /**
+   * The pipeline as ``pipeline.list`` reports it. Every mutation returns
+   * it as ``pipeline`` so the controller can refresh its mirror without
+   * a follow-up ``pipeline.list`` round trip.
+   */
+  private pipelineSnapshot(): Record<string, unknown>[] {
+    return this.app.modifierPipeline.getModifiers().map(serializeModifier);
+  }
+
   private handlePipelineAvailableModifiers: RPCHandler = () => {
     return {
       modifiers: ModifierRegistry.getAvailableModifiers().map((entry) => ({
@@ -890,7 +1272,11 @@ export class RPCRouter {
     }
 
     await this.app.applyPipeline({ fullRebuild: true });
-    return { id: modifier.id, modifier: serializeModifier(modifier) };
+    return {
+      id: modifier.id,
+      modifier: serializeModifier(modifier),
+      pipeline: this.pipelineSnapshot(),
+    };
   };
 
   private handlePipelineRemoveModifier: RPCHandler = async (params) => {
@@ -903,7 +1289,10 @@ export class RPCRouter {
       throw invalidParams(`No modifier with id '${id}'`);
     }
     await this.app.applyPipeline({ fullRebuild: true });
-    return { removed_ids: removed.map((m) => m.id) };
+    return {
+      removed_ids: removed.map((m) => m.id),
+      pipeline: this.pipelineSnapshot(),
+    };
   };
 
   private handlePipelineReorderModifier: RPCHandler = async (params) => {
@@ -921,7 +1310,7 @@ export class RPCRouter {
       );
     }
     await this.app.applyPipeline({ fullRebuild: true });
-    return { success: true };
+    return { success: true, pipeline: this.pipelineSnapshot() };
   };
 
   private handlePipelineSetEnabled: RPCHandler = async (params) => {
@@ -938,7 +1327,7 @@ export class RPCRouter {
     }
     modifier.enabled = enabled;
     await this.app.applyPipeline({ fullRebuild: true });
-    return { success: true };
+    return { success: true, pipeline: this.pipelineSnapshot() };
   };
 
   private handlePipelineSetSelectionScope: RPCHandler = async (params) => {
@@ -956,7 +1345,7 @@ export class RPCRouter {
       );
     }
     await this.app.applyPipeline({ fullRebuild: true });
-    return { success: true };
+    return { success: true, pipeline: this.pipelineSnapshot() };
   };
 
   private handlePipelineSetSourceOwner: RPCHandler = async (params) => {
@@ -974,13 +1363,134 @@ export class RPCRouter {
       );
     }
     await this.app.applyPipeline({ fullRebuild: true });
-    return { success: true };
+    return { success: true, pipeline: this.pipelineSnapshot() };
   };
 
   private handlePipelineClear: RPCHandler = async () => {
     this.app.modifierPipeline.clear();
     await this.app.applyPipeline({ fullRebuild: true });
-    return { success: true };
+    return { success: true, pipeline: this.pipelineSnapshot() };
+  };
+
+  /**
+   * Apply a whole modifier graph at once. ``modifiers`` is a list of
+   * ``{ref?, name, enabled?, selection_scope?, source_owner?}`` in
+   * pipeline order; a link names either the ``ref`` of another entry or
+   * the id of a modifier already in the pipeline. With ``replace`` (the
+   * default) every existing modifier other than the data sources is
+   * dropped, so links may only reach data sources outside the list.
+   *
+   * Either every entry is applied or none is: a rejected link removes
+   * the entries added so far and leaves the pipeline as it was. The
+   * pipeline is evaluated once, after the last entry.
+   */
+  private handlePipelineSet: RPCHandler = async (params) => {
+    if (!Array.isArray(params.modifiers)) {
+      throw invalidParams("pipeline.set requires a 'modifiers' list");
+    }
+    const replace =
+      params.replace === undefined
+        ? true
+        : requireBoolean(params.replace, "replace");
+    const pipeline = this.app.modifierPipeline;
+    const available = ModifierRegistry.getAvailableModifiers();
+    const specs = params.modifiers.map((raw, i) => {
+      const spec = asRecord(raw);
+      const name = requireString(spec.name, `modifiers[${i}].name`) as string;
+      const entry = available.find((e) => e.name === name);
+      if (!entry) {
+        throw invalidParams(`modifiers[${i}]: unknown modifier '${name}'`);
+      }
+      return {
+        entry,
+        ref: requireString(spec.ref ?? null, `modifiers[${i}].ref`, {
+          allowNull: true,
+        }),
+        enabled:
+          spec.enabled === undefined || spec.enabled === null
+            ? null
+            : requireBoolean(spec.enabled, `modifiers[${i}].enabled`),
+        selectionScope: requireString(
+          spec.selection_scope ?? null,
+          `modifiers[${i}].selection_scope`,
+          { allowNull: true },
+        ),
+        sourceOwner: requireString(
+          spec.source_owner ?? null,
+          `modifiers[${i}].source_owner`,
+          { allowNull: true },
+        ),
+      };
+    });
+
+    const previous = replace
+      ? pipeline
+          .getModifiers()
+          .filter((m) => !(m instanceof DataSourceModifier))
+      : [];
+    const kept = new Set(
+      pipeline
+        .getModifiers()
+        .filter((m) => !previous.includes(m))
+        .map((m) => m.id),
+    );
+    const refs = new Map<string, number>();
+    specs.forEach((spec, i) => {
+      if (spec.ref === null) return;
+      if (refs.has(spec.ref)) {
+        throw invalidParams(`modifiers[${i}]: duplicate ref '${spec.ref}'`);
+      }
+      refs.set(spec.ref, i);
+    });
+    specs.forEach((spec, i) => {
+      for (const link of [spec.selectionScope, spec.sourceOwner]) {
+        if (link !== null && !refs.has(link) && !kept.has(link)) {
+          throw invalidParams(
+            `modifiers[${i}]: '${link}' is neither a ref nor a kept modifier id`,
+          );
+        }
+      }
+    });
+
+    const added: Modifier[] = [];
+    const resolve = (link: string | null): string | null => {
+      if (link === null) return null;
+      const index = refs.get(link);
+      return index === undefined ? link : added[index].id;
+    };
+    try {
+      for (const spec of specs) {
+        const modifier = spec.entry.factory();
+        pipeline.addModifier(modifier);
+        added.push(modifier);
+        if (spec.enabled !== null) modifier.enabled = spec.enabled;
+      }
+      specs.forEach((spec, i) => {
+        const id = added[i].id;
+        const scope = resolve(spec.selectionScope);
+        if (scope !== null && !pipeline.setSelectionScope(id, scope)) {
+          throw invalidParams(
+            `modifiers[${i}]: cannot scope '${spec.entry.name}' to '${spec.selectionScope}' — rejected by pipeline`,
+          );
+        }
+        const owner = resolve(spec.sourceOwner);
+        if (owner !== null && !pipeline.setSourceOwner(id, owner)) {
+          throw invalidParams(
+            `modifiers[${i}]: cannot attach '${spec.entry.name}' to '${spec.sourceOwner}' — rejected by pipeline`,
+          );
+        }
+      });
+    } catch (error) {
+      for (const modifier of added) pipeline.removeModifier(modifier.id);
+      throw error;
+    }
+
+    for (const modifier of previous) pipeline.removeModifier(modifier.id);
+    await this.app.applyPipeline({ fullRebuild: true });
+    return {
+      modifiers: added.map(serializeModifier),
+      pipeline: this.pipelineSnapshot(),
+    };
   };
 
   // ---------------------------------------------------------------------
@@ -65,6 +65,37 @@ function toArrayBuffer(view: DataView, itemSize: number): ArrayBuffer {
   );
 }
 
+/** Decode one IEEE 754 half-precision value. */
+function halfToFloat(bits: number): number {
+  const sign = bits & 0x8000 ? -1 : 1;
+  const exponent = (bits >> 10) & 0x1f;
+  const fraction = bits & 0x3ff;
+  if (exponent === 0) return sign * 2 ** -14 * (fraction / 1024);
+  if (exponent === 0x1f) return fraction ? Number.NaN : sign * Infinity;
+  return sign * 2 ** (exponent - 15) * (1 + fraction / 1024);
+}
+
+/**
+ * Widen reduced-precision coordinate buffers (see Python's
+ * `apply_coordinate_precision`) to Float32Array: float16 is expanded
+ * value by value, fixed-point integers via `offset + value * scale`.
+ */
+function widenToFloat32(
+  ref: BinaryBufferRef,
+  raw: BinaryTypedArray,
+  halfFloat: boolean,
+): BinaryTypedArray {
+  const out = new Float32Array(raw.length);
+  if (halfFloat) {
+    for (let i = 0; i < raw.length; i++) out[i] = halfToFloat(Number(raw[i]));
+  } else {
+    const scale = ref.scale ?? 1;
+    const offset = ref.offset ?? 0;
+    for (let i = 0; i < raw.length; i++) out[i] = offset + Number(raw[i]) * scale;
+  }
+  return attachArrayMetadata(out as BinaryTypedArray, "<f4", ref.shape ?? []);
+}
+
 function createTypedArray(
   ref: BinaryBufferRef,
   buffer: DataView,
@@ -72,6 +103,15 @@ function createTypedArray(
   const normalized = normalizeDtype(ref.dtype);
   const shape = ref.shape ?? [];
 
+  if (normalized === "f2") {
+    const half = createTypedArray({ ...ref, dtype: "<u2" }, buffer);
+    return widenToFloat32(ref, half, true);
+  }
+  if (typeof ref.scale === "number") {
+    const fixed = createTypedArray({ ...ref, scale: undefined }, buffer);
+    return widenToFloat32(ref, fixed, false);
+  }
+
   const factories: Record<
     string,
     {
@@ -183,6 +223,47 @@ export function decodeBinaryPayload(
   return value;
 }
 
+/**
+ * Cut ``value`` out of a message: the buffers it references, renumbered
+ * from zero in first-use order, plus ``value`` with its buffer refs
+ * rewritten to match. The result decodes with ``decodeBinaryPayload``
+ * on its own — used to cache one piece of a state sync.
+ */
+export function detachBinaryPayload(
+  value: unknown,
+  buffers: DataView[],
+): { value: unknown; buffers: DataView[] } {
+  const picked: DataView[] = [];
+  const renumbered = new Map<number, number>();
+  const walk = (node: unknown): unknown => {
+    if (isBinaryBufferRef(node)) {
+      const index = Number(node.index);
+      if (!Number.isInteger(index) || index < 0 || index >= buffers.length) {
+        throw new Error(`Invalid binary buffer reference index '${node.index}'`);
+      }
+      let local = renumbered.get(index);
+      if (local === undefined) {
+        local = picked.length;
+        renumbered.set(index, local);
+        picked.push(buffers[index]);
+      }
+      return { ...node, index: local };
+    }
+    if (Array.isArray(node)) {
+      return node.map(walk);
+    }
+    if (isPlainObject(node)) {
+      const out: Record<string, unknown> = {};
+      for (const [key, entry] of Object.entries(node)) {
+        out[key] = walk(entry);
+      }
+      return out;
+    }
+    return node;
+  };
+  return { value: walk(value), buffers: picked };
+}
+
 function isStringArray(value: unknown[]): value is string[] {
   return value.every((item) => typeof item === "string");
 }
@@ -366,6 +447,45 @@ export function buildFrame(frameData: SerializedFrameData): Frame {
   return frame;
 }
 
+/**
+ * Expand delta-encoded frames from ``molvis.transport.encode_frame_deltas``.
+ *
+ * A frame flagged ``delta: true`` carries only the blocks and columns
+ * that changed; every other column is taken from the previous frame in
+ * the same list. Returns fully populated payloads ready for
+ * {@link buildFrame}. Column arrays are shared, not copied — `buildFrame`
+ * copies them into the molrs block.
+ */
+export function resolveFrameDeltas(
+  rawFrames: unknown[],
+): SerializedFrameData[] {
+  let previous: SerializedFrameData | null = null;
+  return rawFrames.map((raw, i) => {
+    if (!isPlainObject(raw) || !isPlainObject(raw.blocks)) {
+      throw new Error(`frames[${i}]: frame payload must include a 'blocks' object`);
+    }
+    const frameData = raw as unknown as SerializedFrameData;
+    if (!frameData.delta) {
+      previous = frameData;
+      return frameData;
+    }
+    if (!previous) {
+      throw new Error(`frames[${i}]: delta frame has no preceding frame`);
+    }
+    const blocks: Record<string, Record<string, unknown>> = {};
+    for (const [name, columns] of Object.entries(previous.blocks)) {
+      blocks[name] = { ...columns, ...(frameData.blocks[name] ?? {}) };
+    }
+    for (const [name, columns] of Object.entries(frameData.blocks)) {
+      if (!(name in blocks)) blocks[name] = { ...columns };
+    }
+    const resolved: SerializedFrameData = { blocks };
+    if (frameData.metadata) resolved.metadata = frameData.metadata;
+    previous = resolved;
+    return resolved;
+  });
+}
+
 function flattenNumbers(value: unknown): number[] {
   if (ArrayBuffer.isView(value)) {
     return Array.from(value as unknown as ArrayLike<number>, Number);
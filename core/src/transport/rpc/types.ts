@@ -29,11 +29,16 @@ export interface BinaryBufferRef {
   index: number;
   dtype: string;
   shape: number[];
+  /** Fixed-point buffers decode to `offset + value * scale`. */
+  scale?: number;
+  offset?: number;
 }
 
 export interface SerializedFrameData {
   blocks: Record<string, Record<string, unknown>>;
   metadata?: Record<string, unknown>;
+  /** Blocks/columns not listed repeat the previous frame in the same list. */
+  delta?: boolean;
 }
 
 export interface SerializedBoxData {
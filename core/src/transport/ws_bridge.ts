@@ -7,12 +7,22 @@
  * JSON-RPC 2.0 with binary-buffer framing.
  *
  * Handshake:
- *   client → server  {type:"hello", token, session}
- *   server → client  {type:"ready"}              (success)
- *                    ws.close(1008, "auth")       (token mismatch)
+ *   client → server  {type:"hello", token, session, frame_versions:[1,2,3],
+ *                     buffer_codecs:["deflate"], rpc_batch:true}
+ *   server → client  {type:"ready", frame_version?, buffer_codec?}  (success)
+ *                    ws.close(1008, "auth")          (token mismatch)
+ *
+ * `frame_version` selects the binary-frame layout for the connection.
+ * Controllers that predate v2 reply with a bare `{type:"ready"}`, which
+ * keeps the uint32 (v1) layout. `buffer_codecs` lists the per-buffer
+ * codecs this page can inflate (v3 frames flag each buffer's codec).
+ * `rpc_batch` tells the controller it may send JSON-RPC batch arrays.
  *
  * Inbound: JSON-RPC requests are routed to `RPCRouter`. Responses
  * (including those carrying binary buffers) flow back over the same socket.
+ * A batch array is executed entry by entry, in order, and answered with one
+ * batch array. Its frame carries every entry's buffers back to back; an
+ * entry whose buffers do not start at index 0 has a `buffer_offset`.
  *
  * Outbound events: core events (selection-change, mode-change, …) are
  * pushed as JSON-RPC notifications (no `id`) via `sendEvent`.
@@ -23,18 +33,57 @@ import { RPCRouter } from "./rpc/router";
 import type { RPCResponseEnvelope } from "./rpc/types";
 import { createErrorResponse } from "./rpc/types";
 
+/** Original layout: uint32 buffer count + uint32 offset/length table. */
+export const FRAME_VERSION_V1 = 1;
+/** `MVB2` magic + uint32 buffer count + uint64 offset/length table. */
+export const FRAME_VERSION_V2 = 2;
+/** `MVB3` magic + v2 table widened with a uint32 codec id per buffer. */
+export const FRAME_VERSION_V3 = 3;
+export const SUPPORTED_FRAME_VERSIONS: readonly number[] = [
+  FRAME_VERSION_V1,
+  FRAME_VERSION_V2,
+  FRAME_VERSION_V3,
+];
+
+// "MVB2" / "MVB3" read as little-endian uint32.
+const FRAME_V2_MAGIC = 0x3242564d;
+const FRAME_V3_MAGIC = 0x3342564d;
+
+/** Per-buffer codec ids in the v3 table; must match `_codec.BUFFER_CODEC_IDS`. */
+export const BUFFER_CODEC_RAW = 0;
+export const BUFFER_CODEC_DEFLATE = 1;
+
+/**
+ * Codecs this page can inflate. zstd/lz4 have no built-in browser
+ * decoder, so only deflate (via `DecompressionStream`) is advertised.
+ */
+export const SUPPORTED_BUFFER_CODECS: readonly string[] =
+  typeof DecompressionStream === "undefined" ? [] : ["deflate"];
+
 /**
  * Decode a binary WebSocket frame into a JSON object + DataView buffers.
  *
- * Wire format:
+ * Wire format v1:
  *   [4 bytes]  uint32 LE  buffer_count (N)
  *   [N*8 bytes] N pairs of (uint32 LE offset, uint32 LE length)
  *   [variable]  JSON payload (UTF-8)
  *   [variable]  concatenated buffer bytes
+ *
+ * Wire format v2 (detected by its leading `MVB2` magic):
+ *   [4 bytes]   ASCII "MVB2"
+ *   [4 bytes]   uint32 LE  buffer_count (N)
+ *   [N*16 bytes] N pairs of (uint64 LE offset, uint64 LE length)
+ *   [variable]  JSON payload (UTF-8)
+ *   [variable]  concatenated buffer bytes
+ *
+ * Wire format v3 (leading `MVB3` magic) is v2 with a uint32 LE codec id
+ * after each (offset, length) pair. Compressed buffers are returned as
+ * is, with their id in `codecs`; run them through `inflateBuffers`.
  */
 export function decodeBinaryFrame(data: ArrayBuffer): {
   json: Record<string, unknown>;
   buffers: DataView[];
+  codecs: number[];
 } {
   // Every field below is attacker-controllable wire data. Validate each step
   // against `byteLength` before using it to construct DataView/Uint8Array —
@@ -47,10 +96,27 @@ export function decodeBinaryFrame(data: ArrayBuffer): {
   const view = new DataView(data);
   let pos = 0;
 
+  const magic = byteLength >= 8 ? view.getUint32(0, true) : 0;
+  const flagged = magic === FRAME_V3_MAGIC;
+  const wide = flagged || magic === FRAME_V2_MAGIC;
+  if (wide) {
+    pos += 4;
+  }
+  const entrySize = wide ? 8 : 4;
+  const codecSize = flagged ? 4 : 0;
+  const readEntry = (at: number): number => {
+    if (!wide) return view.getUint32(at, true);
+    const value = view.getBigUint64(at, true);
+    if (value > BigInt(Number.MAX_SAFE_INTEGER)) {
+      throw new Error("binary frame offset exceeds safe integer range");
+    }
+    return Number(value);
+  };
+
   const bufferCount = view.getUint32(pos, true);
   pos += 4;
 
-  const headerSize = 4 + bufferCount * 8;
+  const headerSize = pos + bufferCount * (entrySize * 2 + codecSize);
   if (bufferCount < 0 || headerSize > byteLength) {
     throw new Error(
       `binary frame header overflows: bufferCount=${bufferCount}`,
@@ -58,12 +124,15 @@ export function decodeBinaryFrame(data: ArrayBuffer): {
   }
 
   const offsetTable: Array<{ offset: number; length: number }> = [];
+  const codecs: number[] = [];
   let totalBufferSize = 0;
   for (let i = 0; i < bufferCount; i++) {
-    const offset = view.getUint32(pos, true);
-    pos += 4;
-    const length = view.getUint32(pos, true);
-    pos += 4;
+    const offset = readEntry(pos);
+    pos += entrySize;
+    const length = readEntry(pos);
+    pos += entrySize;
+    codecs.push(flagged ? view.getUint32(pos, true) : BUFFER_CODEC_RAW);
+    pos += codecSize;
     offsetTable.push({ offset, length });
     totalBufferSize += length;
   }
@@ -85,19 +154,53 @@ export function decodeBinaryFrame(data: ArrayBuffer): {
     buffers.push(new DataView(data, bufferDataStart + offset, length));
   }
 
-  return { json, buffers };
+  return { json, buffers, codecs };
+}
+
+/**
+ * Decompress the buffers `decodeBinaryFrame` flagged with a codec.
+ * Raw buffers are passed through untouched.
+ */
+export async function inflateBuffers(
+  buffers: DataView[],
+  codecs: number[],
+): Promise<DataView[]> {
+  return Promise.all(
+    buffers.map(async (buffer, i) => {
+      const codec = codecs[i] ?? BUFFER_CODEC_RAW;
+      if (codec === BUFFER_CODEC_RAW) return buffer;
+      if (codec !== BUFFER_CODEC_DEFLATE) {
+        throw new Error(`unsupported buffer codec id ${codec}`);
+      }
+      const bytes = new Uint8Array(
+        buffer.buffer,
+        buffer.byteOffset,
+        buffer.byteLength,
+      );
+      const stream = new Blob([bytes])
+        .stream()
+        .pipeThrough(new DecompressionStream("deflate"));
+      return new DataView(await new Response(stream).arrayBuffer());
+    }),
+  );
 }
 
 /**
  * Encode a JSON-RPC response into the binary wire format.
  * Used when the response carries binary buffers (e.g. snapshot).
+ * `version` is the layout negotiated during the handshake.
  */
 export function encodeBinaryFrame(
-  json: Record<string, unknown>,
+  json: unknown,
   buffers: ArrayBuffer[],
+  version: number = FRAME_VERSION_V1,
 ): ArrayBuffer {
   const jsonBytes = new TextEncoder().encode(JSON.stringify(json));
   const bufferCount = buffers.length;
+  const flagged = version === FRAME_VERSION_V3;
+  const wide = flagged || version === FRAME_VERSION_V2;
+  const entrySize = wide ? 8 : 4;
+  const codecSize = flagged ? 4 : 0;
 
   let totalBufferSize = 0;
   const offsets: Array<{ offset: number; length: number }> = [];
@@ -106,21 +209,35 @@ export function encodeBinaryFrame(
     totalBufferSize += buf.byteLength;
   }
 
-  const headerSize = 4 + bufferCount * 8;
+  const headerSize =
+    (wide ? 8 : 4) + bufferCount * (entrySize * 2 + codecSize);
   const totalSize = headerSize + jsonBytes.byteLength + totalBufferSize;
   const out = new ArrayBuffer(totalSize);
   const outView = new DataView(out);
   const outBytes = new Uint8Array(out);
   let pos = 0;
 
+  if (wide) {
+    outView.setUint32(pos, flagged ? FRAME_V3_MAGIC : FRAME_V2_MAGIC, true);
+    pos += 4;
+  }
   outView.setUint32(pos, bufferCount, true);
   pos += 4;
 
   for (const { offset, length } of offsets) {
-    outView.setUint32(pos, offset, true);
-    pos += 4;
-    outView.setUint32(pos, length, true);
-    pos += 4;
+    if (wide) {
+      outView.setBigUint64(pos, BigInt(offset), true);
+      outView.setBigUint64(pos + 8, BigInt(length), true);
+    } else {
+      outView.setUint32(pos, offset, true);
+      outView.setUint32(pos + 4, length, true);
+    }
+    pos += entrySize * 2;
+    if (flagged) {
+      // Responses go out raw; only the controller compresses buffers.
+      outView.setUint32(pos, BUFFER_CODEC_RAW, true);
+      pos += codecSize;
+    }
   }
 
   outBytes.set(jsonBytes, pos);
@@ -144,9 +261,12 @@ export class WebSocketBridge {
   private router: RPCRouter;
   private cleanupBeforeUnload: (() => void) | null = null;
   private ready = false;
+  private frameVersion = FRAME_VERSION_V1;
 
   constructor(readonly app: MolvisApp) {
-    this.router = new RPCRouter(app);
+    this.router = new RPCRouter(app, (method, params) => {
+      this.sendEvent(method, params);
+    });
   }
 
   /**
@@ -186,6 +306,11 @@ export class WebSocketBridge {
           return;
         }
         if (msg.type === "ready") {
+          this.frameVersion =
+            typeof msg.frame_version === "number" &&
+            SUPPORTED_FRAME_VERSIONS.includes(msg.frame_version)
+              ? msg.frame_version
+              : FRAME_VERSION_V1;
           ws.removeEventListener("message", preReadyHandler);
           ws.addEventListener("message", (e) => {
             void this.handleMessage(e);
@@ -228,7 +353,16 @@ export class WebSocketBridge {
           window.removeEventListener("beforeunload", onBeforeUnload);
         };
 
-        ws.send(JSON.stringify({ type: "hello", token, session }));
+        ws.send(
+          JSON.stringify({
+            type: "hello",
+            token,
+            session,
+            frame_versions: SUPPORTED_FRAME_VERSIONS,
+            buffer_codecs: SUPPORTED_BUFFER_CODECS,
+            rpc_batch: true,
+          }),
+        );
       });
     });
   }
@@ -277,16 +411,18 @@ export class WebSocketBridge {
   }
 
   private async handleMessage(event: MessageEvent): Promise<void> {
-    let request: Record<string, unknown>;
+    let request: unknown;
     let buffers: DataView[];
 
     try {
       if (event.data instanceof ArrayBuffer) {
         const decoded = decodeBinaryFrame(event.data);
         request = decoded.json;
-        buffers = decoded.buffers;
+        buffers = decoded.codecs.some((c) => c !== BUFFER_CODEC_RAW)
+          ? await inflateBuffers(decoded.buffers, decoded.codecs)
+          : decoded.buffers;
       } else if (typeof event.data === "string") {
-        request = JSON.parse(event.data) as Record<string, unknown>;
+        request = JSON.parse(event.data) as unknown;
         buffers = [];
       } else {
         return;
@@ -303,32 +439,81 @@ export class WebSocketBridge {
       return;
     }
 
+    if (Array.isArray(request)) {
+      await this.handleBatch(request, buffers);
+      return;
+    }
+
     // Ignore non-RPC control messages (e.g. future server-initiated pings).
-    if (request.type !== undefined && request.jsonrpc === undefined) {
+    const message = request as Record<string, unknown>;
+    if (message.type !== undefined && message.jsonrpc === undefined) {
       return;
     }
 
     const response: RPCResponseEnvelope = await this.router.execute(
-      request,
+      message,
       buffers,
     );
 
     this.sendResponse(response);
   }
 
+  /**
+   * Execute a JSON-RPC batch in order and answer with one batch array.
+   *
+   * Entries run sequentially, so a batch behaves exactly like the same
+   * requests sent one per frame — only the frame and task count drop.
+   */
+  private async handleBatch(
+    requests: unknown[],
+    buffers: DataView[],
+  ): Promise<void> {
+    if (requests.length === 0) {
+      this.sendResponse({
+        content: createErrorResponse(null, -32600, "Empty JSON-RPC batch"),
+      });
+      return;
+    }
+
+    const replies: Array<Record<string, unknown>> = [];
+    const replyBuffers: ArrayBuffer[] = [];
+    for (const entry of requests) {
+      const offset =
+        typeof entry === "object" &&
+        entry !== null &&
+        typeof (entry as { buffer_offset?: unknown }).buffer_offset ===
+          "number"
+          ? (entry as { buffer_offset: number }).buffer_offset
+          : 0;
+      const response = await this.router.execute(
+        entry,
+        buffers.slice(offset),
+      );
+      const reply: Record<string, unknown> = { ...response.content };
+      if (response.buffers && response.buffers.length > 0) {
+        if (replyBuffers.length > 0) {
+          reply.buffer_offset = replyBuffers.length;
+        }
+        replyBuffers.push(...response.buffers);
+      }
+      replies.push(reply);
+    }
+    this.sendFrame(replies, replyBuffers);
+  }
+
   private sendResponse(response: RPCResponseEnvelope): void {
+    this.sendFrame(response.content, response.buffers ?? []);
+  }
+
+  private sendFrame(json: unknown, buffers: ArrayBuffer[]): void {
     if (!this.ws || this.ws.readyState !== WebSocket.OPEN) {
       return;
     }
 
-    if (response.buffers && response.buffers.length > 0) {
-      const frame = encodeBinaryFrame(
-        response.content as unknown as Record<string, unknown>,
-        response.buffers,
-      );
-      this.ws.send(frame);
+    if (buffers.length > 0) {
+      this.ws.send(encodeBinaryFrame(json, buffers, this.frameVersion));
     } else {
-      this.ws.send(JSON.stringify(response.content));
+      this.ws.send(JSON.stringify(json));
     }
   }
 }
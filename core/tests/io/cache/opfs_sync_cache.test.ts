@@ -0,0 +1,38 @@
+import { afterEach, beforeEach, describe, expect } from "@rstest/core";
+import { OpfsSyncCache } from "../../../src/io/cache/opfs_sync_cache";
+import { clearBucket, opfsIt } from "./opfs_test_helpers";
+
+const record = {
+  json: { frames: [] },
+  buffers: [new DataView(new Float32Array([1, 2, 3]).buffer)],
+};
+
+describe("OpfsSyncCache", () => {
+  beforeEach(() => clearBucket("sync"));
+  afterEach(() => clearBucket("sync"));
+
+  opfsIt("get returns null for a missing hash", async () => {
+    expect(await OpfsSyncCache.get("scene", "0badc0de")).toBeNull();
+  });
+
+  opfsIt("set then get round-trips a record", async () => {
+    await OpfsSyncCache.set("scene", "abc123", record);
+    const loaded = await OpfsSyncCache.get("scene", "abc123");
+    expect(loaded?.json).toEqual(record.json);
+    const view = loaded?.buffers[0] as DataView;
+    expect(
+      Array.from(new Float32Array(view.buffer, view.byteOffset, 3)),
+    ).toEqual([1, 2, 3]);
+  });
+
+  opfsIt("keys and retain are scoped to one scene", async () => {
+    await OpfsSyncCache.set("a", "k1", record);
+    await OpfsSyncCache.set("a", "k2", record);
+    await OpfsSyncCache.set("a.b", "k1", record);
+
+    expect([...(await OpfsSyncCache.keys("a"))].sort()).toEqual(["k1", "k2"]);
+    await OpfsSyncCache.retain("a", new Set(["k2"]));
+    expect([...(await OpfsSyncCache.keys("a"))]).toEqual(["k2"]);
+    expect([...(await OpfsSyncCache.keys("a.b"))]).toEqual(["k1"]);
+  });
+});
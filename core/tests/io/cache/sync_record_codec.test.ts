@@ -0,0 +1,39 @@
+import { describe, expect, it } from "@rstest/core";
+import {
+  decodeSyncRecord,
+  encodeSyncRecord,
+} from "../../../src/io/cache/sync_record_codec";
+
+describe("sync_record_codec", () => {
+  it("round-trips JSON and buffers with aligned buffer views", () => {
+    const json = { frames: [{ blocks: { atoms: { element: ["O", "H"] } } }] };
+    const odd = new Uint8Array([1, 2, 3]);
+    const coords = new Float64Array([0.5, -1.25, 3]);
+    const decoded = decodeSyncRecord(encodeSyncRecord(json, [odd, coords]));
+
+    expect(decoded).not.toBeNull();
+    expect(decoded?.json).toEqual(json);
+    const [a, b] = decoded?.buffers ?? [];
+    expect(
+      Array.from(new Uint8Array(a.buffer, a.byteOffset, a.byteLength)),
+    ).toEqual([1, 2, 3]);
+    expect(b.byteOffset % 8).toBe(0);
+    expect(Array.from(new Float64Array(b.buffer, b.byteOffset, 3))).toEqual([
+      0.5, -1.25, 3,
+    ]);
+  });
+
+  it("encodes a record without buffers", () => {
+    const decoded = decodeSyncRecord(encodeSyncRecord({ id: "m1" }, []));
+    expect(decoded?.json).toEqual({ id: "m1" });
+    expect(decoded?.buffers).toEqual([]);
+  });
+
+  it("returns null for bad magic or a truncated record", () => {
+    const encoded = encodeSyncRecord({ id: "m1" }, [new Uint8Array(16)]);
+    const truncated = encoded.slice(0, encoded.byteLength - 8);
+    expect(decodeSyncRecord(truncated)).toBeNull();
+    new DataView(encoded).setUint32(0, 0xdeadbeef, true);
+    expect(decodeSyncRecord(encoded)).toBeNull();
+  });
+});
@@ -12,7 +12,13 @@
 
 import "@molcrafts/molrs";
 import { describe, expect, it } from "@rstest/core";
-import { buildBox, buildFrame } from "../../../src/transport/rpc/serialization";
+import {
+  buildBox,
+  buildFrame,
+  decodeBinaryPayload,
+  detachBinaryPayload,
+  resolveFrameDeltas,
+} from "../../../src/transport/rpc/serialization";
 import type {
   SerializedBoxData,
   SerializedFrameData,
@@ -211,3 +217,91 @@ describe("buildBox", () => {
     expect(() => buildBox(payload)).toThrow(/origin with 3 values/);
   });
 });
+
+// ── resolveFrameDeltas ─────────────────────────────────────────────────────
+
+describe("resolveFrameDeltas", () => {
+  it("fills omitted columns and blocks from the previous frame", () => {
+    const element = ["O", "H"];
+    const bonds = { i: [0], j: [1] };
+    const resolved = resolveFrameDeltas([
+      { blocks: { atoms: { element, x: [0, 1], y: [0, 0], z: [0, 0] }, bonds } },
+      { blocks: { atoms: { x: [0.5, 1.5] } }, delta: true },
+      { blocks: {}, delta: true },
+    ]);
+
+    expect(resolved[1].blocks.atoms.element).toBe(element);
+    expect(resolved[1].blocks.atoms.x).toEqual([0.5, 1.5]);
+    expect(resolved[1].blocks.bonds).toEqual(bonds);
+    expect(resolved[2].blocks.atoms.x).toEqual([0.5, 1.5]);
+    expect(resolved[2].delta).toBeUndefined();
+
+    const frame = buildFrame(resolved[2]);
+    expect(frame.getBlock("atoms")?.nrows()).toBe(2);
+  });
+
+  it("rejects a delta frame with nothing to inherit from", () => {
+    expect(() =>
+      resolveFrameDeltas([{ blocks: { atoms: { x: [0] } }, delta: true }]),
+    ).toThrow(/no preceding frame/);
+  });
+});
+
+// ── reduced-precision coordinate buffers ───────────────────────────────────
+
+describe("decodeBinaryPayload precision", () => {
+  const ref = (dtype: string, extra: Record<string, number> = {}) => ({
+    __molvis_buffer__: true,
+    index: 0,
+    dtype,
+    shape: [3],
+    ...extra,
+  });
+
+  it("widens float16 buffers to Float32Array", () => {
+    const bits = new Uint16Array([0x3c00, 0xc000, 0x3800]); // 1, -2, 0.5
+    const decoded = decodeBinaryPayload(ref("<f2"), [
+      new DataView(bits.buffer),
+    ]) as Float32Array;
+    expect(decoded).toBeInstanceOf(Float32Array);
+    expect(Array.from(decoded)).toEqual([1, -2, 0.5]);
+  });
+
+  it("dequantizes int16 fixed-point buffers with scale and offset", () => {
+    const values = new Int16Array([-32768, 0, 32767]);
+    const decoded = decodeBinaryPayload(
+      ref("<i2", { scale: 0.5, offset: 10 }),
+      [new DataView(values.buffer)],
+    ) as Float32Array;
+    expect(decoded).toBeInstanceOf(Float32Array);
+    expect(Array.from(decoded)).toEqual([-16374, 10, 16393.5]);
+  });
+});
+
+describe("detachBinaryPayload", () => {
+  it("keeps only referenced buffers, renumbered from zero", () => {
+    const buffers = [0, 1, 2].map(
+      (i) => new DataView(new Float32Array([i, i + 0.5]).buffer),
+    );
+    const ref = (index: number) => ({
+      __molvis_buffer__: true,
+      index,
+      dtype: "<f4",
+      shape: [2],
+    });
+    const detached = detachBinaryPayload(
+      { frames: [{ blocks: { atoms: { x: ref(2), y: ref(0), z: ref(2) } } }] },
+      buffers,
+    );
+
+    expect(detached.buffers).toEqual([buffers[2], buffers[0]]);
+    const decoded = decodeBinaryPayload(
+      detached.value,
+      detached.buffers,
+    ) as { frames: { blocks: { atoms: Record<string, Float32Array> } }[] };
+    const atoms = decoded.frames[0].blocks.atoms;
+    expect(Array.from(atoms.x)).toEqual([2, 2.5]);
+    expect(Array.from(atoms.y)).toEqual([0, 0.5]);
+    expect(Array.from(atoms.z)).toEqual([2, 2.5]);
+  });
+});
@@ -1,7 +1,11 @@
 import { describe, expect, it } from "@rstest/core";
 import {
+  BUFFER_CODEC_DEFLATE,
   decodeBinaryFrame,
   encodeBinaryFrame,
+  FRAME_VERSION_V2,
+  FRAME_VERSION_V3,
+  inflateBuffers,
 } from "../../src/transport/ws_bridge";
 
 describe("decodeBinaryFrame", () => {
@@ -42,4 +46,44 @@ describe("decodeBinaryFrame", () => {
     view.setUint32(8, 9999, true); // length = 9999 (overflow)
     expect(() => decodeBinaryFrame(buf)).toThrow();
   });
+
+  it("round-trips a v2 (64-bit) frame and auto-detects its layout", () => {
+    const payload = new Uint8Array([5, 6, 7]).buffer;
+    const encoded = encodeBinaryFrame(
+      { method: "y" },
+      [payload],
+      FRAME_VERSION_V2,
+    );
+    expect(new TextDecoder().decode(new Uint8Array(encoded, 0, 4))).toBe(
+      "MVB2",
+    );
+    const { json, buffers } = decodeBinaryFrame(encoded);
+    expect(json).toEqual({ method: "y" });
+    expect(buffers).toHaveLength(1);
+    expect(buffers[0].byteLength).toBe(3);
+    expect(buffers[0].getUint8(2)).toBe(7);
+  });
+
+  it("inflates v3 buffers flagged with the deflate codec", async () => {
+    const raw = new Float32Array(256).fill(1.5);
+    const stream = new Blob([raw])
+      .stream()
+      .pipeThrough(new CompressionStream("deflate"));
+    const packed = await new Response(stream).arrayBuffer();
+
+    const encoded = encodeBinaryFrame(
+      { method: "z" },
+      [packed],
+      FRAME_VERSION_V3,
+    );
+    // Header: magic (4) + count (4) + offset (8) + length (8) → codec id.
+    new DataView(encoded).setUint32(24, BUFFER_CODEC_DEFLATE, true);
+
+    const { json, buffers, codecs } = decodeBinaryFrame(encoded);
+    expect(json).toEqual({ method: "z" });
+    expect(codecs).toEqual([BUFFER_CODEC_DEFLATE]);
+    const [inflated] = await inflateBuffers(buffers, codecs);
+    expect(inflated.byteLength).toBe(raw.byteLength);
+    expect(inflated.getFloat32(4, true)).toBe(1.5);
+  });
 });
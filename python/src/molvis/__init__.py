@@ -32,6 +32,7 @@ Both hosts drive the same page bundle over a local WebSocket. See
 configuring the transport explicitly (CDN-hosted page, custom port, …).
 """
 
+from .batch import RequestBatch
 from .errors import MolvisRPCError
 from .events import EventBus, EventHandle, Selection, ViewerState
 from .palettes import (
@@ -43,7 +44,7 @@ from .palettes import (
 )
 from .runtime import DisplaySurface, RuntimeEnv, detect_runtime, display_surface
 from .scene import Molvis
-from .transport import Transport, WebSocketTransport
+from .transport import Transport, TransportHub, WebSocketTransport
 from .utils import NumpyEncoder
 
 __all__ = [
@@ -56,9 +57,11 @@ __all__ = [
     "PaletteDefinition",
     "PaletteEntry",
     "PaletteInfo",
+    "RequestBatch",
     "RuntimeEnv",
     "Selection",
     "Transport",
+    "TransportHub",
     "ViewerState",
     "WebSocketTransport",
     "detect_runtime",
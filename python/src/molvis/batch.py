@@ -0,0 +1,142 @@
+"""Pipelined command batches — see :meth:`molvis.Molvis.batch`.
+
+Inside ``with scene.batch():`` every command is written without waiting
+for its reply. Replies are collected when the block exits, so a script
+that adds hundreds of overlays or modifiers pays one round trip instead
+of one per command.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, InvalidStateError
+from concurrent.futures import wait as wait_futures
+from typing import Any, TypeVar
+
+logger = logging.getLogger("molvis")
+
+__all__ = ["RequestBatch", "resolve", "then"]
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class RequestBatch:
+    """Commands issued inside one ``with scene.batch():`` block.
+
+    Attributes
+    ----------
+    results
+        One entry per command, in issue order, filled when the block
+        exits: the frontend's result for commands that wait for a reply,
+        ``None`` for fire-and-forget commands.
+    """
+
+    def __init__(self) -> None:
+        self._thread = threading.get_ident()
+        self._futures: list[Future[Any]] = []
+        self._deferred: dict[str, Callable[[], Any]] = {}
+        self.results: list[Any] = []
+
+    def __len__(self) -> int:
+        return len(self._futures)
+
+    @property
+    def owned_by_current_thread(self) -> bool:
+        """Only the thread that opened the batch batches its commands."""
+        return threading.get_ident() == self._thread
+
+    def add(self, future: Future[T]) -> Future[T]:
+        """Track ``future`` so :meth:`wait` collects it."""
+        self._futures.append(future)
+        return future
+
+    def defer(self, key: str, callback: Callable[[], Any]) -> None:
+        """Run ``callback`` once after every reply has arrived.
+
+        Repeated calls with the same ``key`` collapse into one — e.g. a
+        pipeline mirror refresh requested by each batched mutation.
+        """
+        self._deferred[key] = callback
+
+    def cancel(self) -> None:
+        """Stop waiting on replies (the commands were already sent)."""
+        for future in self._futures:
+            future.cancel()
+        self._deferred.clear()
+
+    def wait(self, timeout: float | None) -> None:
+        """Collect every reply, then run the deferred callbacks.
+
+        Raises
+        ------
+        TimeoutError
+            Some replies did not arrive within ``timeout`` seconds.
+        MolvisRPCError
+            The first command the frontend rejected (in issue order).
+        """
+        _, pending = wait_futures(self._futures, timeout=timeout)
+        if pending:
+            for future in pending:
+                future.cancel()
+            raise TimeoutError(
+                f"{len(pending)} of {len(self._futures)} batched commands got "
+                f"no response after {timeout}s"
+            )
+
+        first_error: BaseException | None = None
+        for future in self._futures:
+            exc = None if future.cancelled() else future.exception()
+            if exc is not None:
+                first_error = first_error or exc
+            self.results.append(
+                None if future.cancelled() or exc is not None else future.result()
+            )
+
+        for key, callback in self._deferred.items():
+            try:
+                callback()
+            except Exception:
+                if first_error is None:
+                    raise
+                logger.exception("Deferred batch step %r failed", key)
+        if first_error is not None:
+            raise first_error
+
+
+def then(value: T | Future[T], fn: Callable[[T], R]) -> R | Future[R]:
+    """Apply ``fn`` to ``value`` now, or to its result once it resolves."""
+    if not isinstance(value, Future):
+        return fn(value)
+    chained: Future[R] = Future()
+
+    def _done(source: Future[T]) -> None:
+        if source.cancelled():
+            chained.cancel()
+            return
+        try:
+            result = fn(source.result())
+        except BaseException as exc:
+            with contextlib.suppress(InvalidStateError):
+                chained.set_exception(exc)
+        else:
+            with contextlib.suppress(InvalidStateError):
+                chained.set_result(result)
+
+    def _propagate_cancel(future: Future[R]) -> None:
+        if future.cancelled():
+            value.cancel()
+
+    value.add_done_callback(_done)
+    chained.add_done_callback(_propagate_cancel)
+    return chained
+
+
+def resolve(value: T | Future[T], timeout: float | None = 10.0) -> T:
+    """Block until a batched reply arrives; pass plain values through."""
+    if isinstance(value, Future):
+        return value.result(timeout=timeout)
+    return value
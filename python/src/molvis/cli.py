@@ -14,12 +14,14 @@ default browser), then blocks until the page is closed or ``Ctrl+C``.
 from __future__ import annotations
 
 import argparse
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Callable, Sequence
 
 import molpy as mp
 
 import molvis as mv
+from molvis.frame_index import is_extended_xyz, open_indexed_trajectory
 
 if TYPE_CHECKING:
     from molpy import Frame
@@ -41,11 +43,30 @@ _READERS: dict[str, Callable[[Path], "Frame"]] = {
 # with the caller-supplied ``--atom-style``.
 _LAMMPS_DATA_EXT = frozenset({".data", ".lmp", ".lammps", ".lammpsdata"})
 
-# Trajectory formats → a molrs lazy reader exposing ``read_all()``.
+
+def _open_xyz_trajectory(path: Path) -> object:
+    """Index plain XYZ; hand extended XYZ to molpy's reader.
+
+    The indexed reader only knows element and coordinates, so a file whose
+    first comment line declares ``Lattice=`` / ``Properties=`` is read by
+    ``mp.io.read_xyz_trajectory`` to keep every column and its metadata.
+    """
+    with path.open("rb") as fh:
+        fh.readline()
+        comment = fh.readline().decode(errors="replace")
+    if is_extended_xyz(comment):
+        return mp.io.read_xyz_trajectory(path)
+    return open_indexed_trajectory(path, "xyz")
+
+
+# Trajectory formats → a random-access frame reader. Dumps and plain XYZ get
+# an mmap-backed reader over a ``.molidx`` frame index: the first open builds
+# the sidecar, later opens reuse it and jump straight to any frame. Extended
+# XYZ stays on molpy's lazy reader.
 _TRAJECTORY_READERS: dict[str, Callable[[Path], object]] = {
-    ".lammpstrj": mp.io.read_lammps_trajectory,
-    ".dump": mp.io.read_lammps_trajectory,
-    ".xyz": mp.io.read_xyz_trajectory,
+    ".lammpstrj": partial(open_indexed_trajectory, fmt="lammps-dump"),
+    ".dump": partial(open_indexed_trajectory, fmt="lammps-dump"),
+    ".xyz": _open_xyz_trajectory,
     ".extxyz": mp.io.read_xyz_trajectory,
 }
 
@@ -83,8 +104,12 @@ def _load_single_frame(path: Path, atom_style: str) -> "Frame":
     return reader(path)
 
 
-def _load_trajectory(path: Path) -> list["Frame"]:
-    """Read ``path`` as a multi-frame trajectory."""
+def _open_trajectory(path: Path) -> object:
+    """Open ``path`` as a multi-frame trajectory reader.
+
+    Frames are not read here — the viewer pulls them on demand through
+    :meth:`Molvis.attach_trajectory`.
+    """
     ext = path.suffix.lower()
     reader_factory = _TRAJECTORY_READERS.get(ext)
     if reader_factory is None:
@@ -93,8 +118,7 @@ def _load_trajectory(path: Path) -> list["Frame"]:
             f"'{ext or path.name}' is not a recognised trajectory format. "
             f"trajectory formats: {supported}"
         )
-    reader = reader_factory(path)
-    return list(reader.read_all())
+    return reader_factory(path)
 
 
 def _cmd_open(args: argparse.Namespace) -> int:
@@ -110,7 +134,7 @@ def _cmd_open(args: argparse.Namespace) -> int:
     )
     try:
         payload = (
-            _load_trajectory(path)
+            _open_trajectory(path)
             if is_trajectory
             else _load_single_frame(path, args.atom_style)
         )
@@ -124,7 +148,7 @@ def _cmd_open(args: argparse.Namespace) -> int:
     transport = mv.WebSocketTransport(open_browser=not args.no_browser)
     scene = mv.Molvis(name=args.name, transport=transport)
 
-    # ``draw_frame`` / ``set_trajectory`` block until a page connects and
+    # ``draw_frame`` / ``attach_trajectory`` block until a page connects and
     # acks. With ``--no-browser`` nobody is auto-opened, so print the URL
     # first — otherwise the hint would never reach the user in time.
     if args.no_browser:
@@ -136,8 +160,8 @@ def _cmd_open(args: argparse.Namespace) -> int:
             print("molvis: server started; open the printed port in a browser")
 
     if is_trajectory:
-        scene.set_trajectory(payload)
-        print(f"molvis: loaded {len(payload)} frame(s) from {path.name}")
+        scene.attach_trajectory(payload)
+        print(f"molvis: attached {path.name} (frames load on demand)")
     else:
         scene.draw_frame(payload)
         print(f"molvis: opened {path.name}")
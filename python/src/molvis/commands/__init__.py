@@ -6,6 +6,7 @@ from .palette import PaletteCommandsMixin
 from .pipeline import (
     AvailableModifier,
     ModifierInfo,
+    ModifierSpec,
     PipelineCommandsMixin,
 )
 from .selection import SelectionCommandsMixin
@@ -17,6 +18,7 @@ __all__ = [
     "FrontendCommands",
     "FrameCommandsMixin",
     "ModifierInfo",
+    "ModifierSpec",
     "OverlayCommandsMixin",
     "PaletteCommandsMixin",
     "PipelineCommandsMixin",
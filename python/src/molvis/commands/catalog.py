@@ -33,6 +33,11 @@ class FrontendCommands:
     CLEAR = FrontendCommand(FrontendCommandGroup.SCENE, "clear")
     EXPORT_FRAME = FrontendCommand(FrontendCommandGroup.SCENE, "export_frame")
     SET_TRAJECTORY = FrontendCommand(FrontendCommandGroup.SCENE, "set_trajectory")
+    APPEND_FRAMES = FrontendCommand(FrontendCommandGroup.SCENE, "append_frames")
+    ATTACH_TRAJECTORY = FrontendCommand(
+        FrontendCommandGroup.SCENE, "attach_trajectory"
+    )
+    PROVIDE_FRAME = FrontendCommand(FrontendCommandGroup.SCENE, "provide_frame")
     SET_FRAME_LABELS = FrontendCommand(
         FrontendCommandGroup.SCENE, "set_frame_labels"
     )
@@ -56,8 +61,12 @@ class FrontendCommands:
     ADD_OVERLAY = FrontendCommand(FrontendCommandGroup.OVERLAY, "add")
     REMOVE_OVERLAY = FrontendCommand(FrontendCommandGroup.OVERLAY, "remove")
     UPDATE_OVERLAY = FrontendCommand(FrontendCommandGroup.OVERLAY, "update")
+    UPDATE_VECTOR_FIELD = FrontendCommand(
+        FrontendCommandGroup.OVERLAY, "update_vectors"
+    )
     CLEAR_OVERLAYS = FrontendCommand(FrontendCommandGroup.OVERLAY, "clear")
     MARK_ATOM = FrontendCommand(FrontendCommandGroup.OVERLAY, "mark_atom")
+    MARK_ATOMS = FrontendCommand(FrontendCommandGroup.OVERLAY, "mark_atoms")
     UNMARK_ATOM = FrontendCommand(FrontendCommandGroup.OVERLAY, "unmark_atom")
     PIPELINE_LIST = FrontendCommand(FrontendCommandGroup.PIPELINE, "list")
     PIPELINE_AVAILABLE_MODIFIERS = FrontendCommand(
@@ -82,3 +91,4 @@ class FrontendCommands:
         FrontendCommandGroup.PIPELINE, "set_source_owner"
     )
     PIPELINE_CLEAR = FrontendCommand(FrontendCommandGroup.PIPELINE, "clear")
+    PIPELINE_SET = FrontendCommand(FrontendCommandGroup.PIPELINE, "set")
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
 from typing import TYPE_CHECKING, Any, Literal
 
 import molpy as mp
@@ -31,6 +32,71 @@ RepresentationStyle = Literal[
 __all__ = ["DrawingCommandsMixin"]
 
 
+def _table_column(table: Any, name: str) -> np.ndarray | None:
+    """Column ``name`` of a pandas/pyarrow table or mapping, as ndarray."""
+    if hasattr(table, "column_names"):  # pyarrow.Table
+        if name not in table.column_names:
+            return None
+        return table.column(name).to_numpy()
+    if isinstance(table, Mapping):
+        return np.asarray(table[name]) if name in table else None
+    if name not in table.columns:  # pandas / polars DataFrame
+        return None
+    return table[name].to_numpy()
+
+
+def _atom_columns(positions: Any) -> dict[str, np.ndarray]:
+    """Validated ``x``/``y``/``z`` (+ ``symbol``/``element``/``color``) columns."""
+    is_table = isinstance(positions, Mapping) or any(
+        hasattr(positions, attr) for attr in ("columns", "column_names")
+    )
+    if is_table:
+        columns = {
+            name: column
+            for name in ("x", "y", "z", "symbol", "element", "color")
+            if (column := _table_column(positions, name)) is not None
+        }
+        missing = [axis for axis in "xyz" if axis not in columns]
+        if missing:
+            raise ValueError(f"atom table is missing column(s) {missing}")
+    else:
+        xyz = np.asarray(positions)
+        if xyz.ndim != 2 or xyz.shape[1] != 3:
+            raise ValueError(f"positions must have shape (N, 3), got {xyz.shape}")
+        columns = {
+            axis: np.ascontiguousarray(xyz[:, i]) for i, axis in enumerate("xyz")
+        }
+
+    for axis in "xyz":
+        column = columns[axis]
+        if column.ndim != 1 or column.dtype.kind not in "fiu":
+            raise ValueError(
+                f"column {axis!r} must be a 1-D numeric array, "
+                f"got {column.dtype} with shape {column.shape}"
+            )
+        if column.dtype.kind != "f":
+            column = columns[axis] = column.astype(np.float64)
+        bad = np.count_nonzero(~np.isfinite(column))
+        if bad:
+            raise ValueError(f"column {axis!r} has {bad} non-finite value(s)")
+    if not len(columns["x"]) == len(columns["y"]) == len(columns["z"]):
+        raise ValueError("x, y and z columns must have the same length")
+    return columns
+
+
+def _per_atom(values: Any, n_atoms: int, label: str) -> np.ndarray:
+    """Broadcast a scalar string to ``n_atoms`` or check an array's length."""
+    if isinstance(values, str):
+        return np.full(n_atoms, values)
+    array = np.asarray(values)
+    if array.shape != (n_atoms,):
+        raise ValueError(
+            f"{label} must have one entry per atom ({n_atoms}), "
+            f"got shape {array.shape}"
+        )
+    return array
+
+
 class DrawingCommandsMixin:
     """Mixin class providing drawing commands for Molvis widget."""
 
@@ -40,14 +106,14 @@ class DrawingCommandsMixin:
         clear: bool = True,
     ) -> "Molvis":
         """Create a new frame and set it as current."""
-        self.send_cmd(
+        reply = self.send_cmd(
             FrontendCommands.NEW_FRAME.method,
             {"name": name, "clear": clear},
             wait_for_response=True,
         )
         if clear:
             self._clear_mirror()
-        self.list_modifiers()
+        self._mirror_pipeline_reply(reply)
         return self
 
     def draw_frame(
@@ -71,17 +137,19 @@ class DrawingCommandsMixin:
         """
         frame_data = frame.to_dict()
 
-        draw_data: dict[str, Any] = {"blocks": frame_data["blocks"]}
+        draw_data: dict[str, Any] = {
+            "blocks": self._encode_blocks(frame_data["blocks"])
+        }
         if include_metadata and "metadata" in frame_data:
             draw_data["metadata"] = frame_data["metadata"]
 
-        self.send_cmd(
+        reply = self.send_cmd(
             FrontendCommands.DRAW_FRAME.method,
             {"frame": draw_data},
             wait_for_response=True,
         )
-        self._record_trajectory([frame], None)
-        self.list_modifiers()
+        self._record_trajectory({"frames": [{"blocks": draw_data["blocks"]}]})
+        self._mirror_pipeline_reply(reply)
         return self
 
     def draw_atomistic(
@@ -144,6 +212,8 @@ class DrawingCommandsMixin:
 
         Each atom must be dict-like (molpy Atom, plain dict, etc.) with at
         least ``symbol`` (or ``element``) and ``x``, ``y``, ``z`` coordinates.
+        For arrays or tables of atoms use :meth:`draw_atom_arrays`, which
+        skips the per-atom loop.
         """
         if not isinstance(atoms, list):
             atoms = [atoms]
@@ -159,17 +229,58 @@ class DrawingCommandsMixin:
             y_list.append(float(atom.get("y")))
             z_list.append(float(atom.get("z")))
 
+        return self.draw_atom_arrays(
+            {"x": x_list, "y": y_list, "z": z_list},
+            symbols,
+            color=color,
+        )
+
+    def draw_atom_arrays(
+        self: "Molvis",
+        positions: Any,
+        symbols: Any = None,
+        *,
+        color: Any = None,
+    ) -> "Molvis":
+        """
+        Draw atoms from columnar data, without a per-atom Python loop.
+
+        ``positions`` is either an ``(N, 3)`` coordinate array or a table
+        with ``x``, ``y``, ``z`` columns and optional ``symbol`` (or
+        ``element``) and ``color`` columns: a pandas ``DataFrame``, a
+        pyarrow ``Table`` or a mapping of column name to array.
+
+        Validation is vectorized and nothing loops over atoms in Python.
+        Each column is copied in bulk into the ``mp.Frame`` handed to
+        :meth:`draw_frame`, and coordinates are converted once more to
+        :attr:`coordinate_precision` on the way to the transport.
+
+        Args:
+            positions: ``(N, 3)`` array, or a table as described above.
+            symbols: Element symbol per atom, or one symbol for all. Takes
+                precedence over a table's ``symbol`` column; defaults to
+                ``"C"`` when neither is given.
+            color: CSS color per atom, or one color for all. Takes
+                precedence over a table's ``color`` column.
+
+        Returns:
+            Self for method chaining
+        """
+        columns = _atom_columns(positions)
+        n_atoms = len(columns["x"])
+        if symbols is None:
+            symbols = columns.get("symbol", columns.get("element", "C"))
+        if color is None:
+            color = columns.get("color")
+
         atoms_block: dict[str, Any] = {
-            "symbol": np.array(symbols),
-            "x": np.array(x_list, dtype=np.float64),
-            "y": np.array(y_list, dtype=np.float64),
-            "z": np.array(z_list, dtype=np.float64),
+            "symbol": _per_atom(symbols, n_atoms, "symbols"),
+            "x": columns["x"],
+            "y": columns["y"],
+            "z": columns["z"],
         }
-
         if color is not None:
-            if isinstance(color, str):
-                color = [color] * len(atoms)
-            atoms_block["color"] = np.array(color)
+            atoms_block["color"] = _per_atom(color, n_atoms, "color")
 
         frame = mp.Frame(blocks={"atoms": atoms_block})
         return self.draw_frame(frame=frame)
@@ -6,12 +6,14 @@ Frame I/O commands for MolVis.
 from __future__ import annotations
 
 import logging
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Iterator, Mapping
+from itertools import islice
 from typing import TYPE_CHECKING, Any
 
 import molpy as mp
 import numpy as np
 
+from ..batch import resolve
 from .catalog import FrontendCommands
 
 if TYPE_CHECKING:
@@ -22,6 +24,78 @@ logger = logging.getLogger("molvis")
 __all__ = ["FrameCommandsMixin"]
 
 
+def _serialize_boxes(
+    boxes: list[mp.Box | None] | None,
+) -> list[dict[str, Any] | None] | None:
+    """``Box.to_dict()`` each entry, keeping ``None`` placeholders."""
+    if boxes is None:
+        return None
+    return [b.to_dict() if b is not None else None for b in boxes]
+
+
+def _attach_params(
+    n_frames: int,
+    boxes: list[dict[str, Any] | None] | None,
+) -> dict[str, Any]:
+    """Params for ``scene.attach_trajectory`` (``boxes`` already serialized)."""
+    params: dict[str, Any] = {"n_frames": n_frames}
+    if boxes is not None:
+        params["boxes"] = boxes
+    return params
+
+
+def _chunked(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    """Yield successive lists of at most ``size`` items from ``items``."""
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _check_box_count(n_frames: int, n_boxes: int) -> None:
+    """Reject a ``boxes`` argument that is not parallel to the frames."""
+    if n_boxes != n_frames:
+        raise ValueError(
+            f"boxes must have one entry per frame: got {n_boxes} for "
+            f"{n_frames} frame(s)"
+        )
+
+
+def _reader_length(reader: Any) -> int:
+    """Frame count of a molpy trajectory reader (``n_frames`` or ``len``)."""
+    n_frames = getattr(reader, "n_frames", None)
+    if callable(n_frames):
+        n_frames = n_frames()
+    if n_frames is None:
+        n_frames = len(reader)
+    return int(n_frames)
+
+
+def _read_frame(reader: Any, index: int) -> mp.Frame:
+    """Read frame ``index`` from ``reader`` (``read_frame(i)`` or ``reader[i]``)."""
+    read_frame = getattr(reader, "read_frame", None)
+    if callable(read_frame):
+        return read_frame(index)
+    return reader[index]
+
+
+def _owned_blocks(blocks: Mapping[str, Any]) -> dict[str, Any]:
+    """Copy every array column of ``blocks`` out of the frame's storage.
+
+    ``mp.Frame`` columns are views into molrs memory, which has to be
+    released on the thread that allocated it. Owned copies can wait in
+    the transport's outbox and be freed on its loop thread.
+    """
+    return {
+        name: {
+            key: np.array(value, copy=True)
+            if isinstance(value, np.ndarray)
+            else value
+            for key, value in columns.items()
+        }
+        for name, columns in blocks.items()
+    }
+
+
 class FrameCommandsMixin:
     """Mixin class providing frame I/O commands for Molvis widget."""
 
@@ -29,52 +103,217 @@ class FrameCommandsMixin:
         self: "Molvis",
         frames: Iterable[mp.Frame],
         boxes: Iterable[mp.Box | None] | None = None,
+        *,
+        chunk_size: int | None = None,
     ) -> "Molvis":
         """Replace the viewer's trajectory with a list of frames.
 
-        Each frame is serialized via ``frame.to_dict()`` and sent in a
-        single RPC call. The frontend wraps them in a Trajectory and
-        navigates to frame 0. Per-frame descriptors (for the PCATool
-        sidebar) are set separately via :meth:`set_frame_labels`.
+        Each frame is serialized via ``frame.to_dict()``. By default the
+        whole trajectory goes out in a single RPC call; the frontend wraps
+        the frames in a Trajectory and navigates to frame 0. Per-frame
+        descriptors (for the PCATool sidebar) are set separately via
+        :meth:`set_frame_labels`.
+
+        With ``chunk_size`` set, frames are pulled from ``frames`` lazily
+        and streamed in bounded chunks: the first chunk replaces the
+        trajectory (the viewer is interactive from then on) and every
+        later chunk is appended via ``scene.append_frames``. Only one
+        chunk is serialized at a time. The scene still mirrors every
+        chunk it sent for page reloads, so Python memory only stays
+        bounded for a long generator under a ``"disk"`` or ``"none"``
+        mirror; see :meth:`set_mirror_policy`.
 
         Args:
-            frames: Sequence of molpy.Frame objects.
+            frames: Sequence (or iterator, when streaming) of molpy.Frame
+                objects.
             boxes: Optional parallel sequence of molpy.Box objects.
                 ``None`` entries are allowed.
+            chunk_size: Number of frames per RPC. ``None`` (default)
+                sends everything at once.
 
         Returns:
             Self for method chaining.
+
+        Raises:
+            ValueError: If ``frames`` is empty or ``boxes`` does not have
+                one entry per frame. When streaming iterators, a short
+                ``boxes`` is only noticed at the chunk where it runs out.
         """
+        if chunk_size is not None:
+            return self._stream_trajectory(frames, boxes, chunk_size)
+
         frame_list = list(frames)
         if len(frame_list) == 0:
             raise ValueError("set_trajectory requires at least one frame")
+        box_list = list(boxes) if boxes is not None else None
+        if box_list is not None:
+            _check_box_count(len(frame_list), len(box_list))
+
+        params = self._trajectory_params(frame_list, box_list)
+        reply = self.send_cmd(
+            FrontendCommands.SET_TRAJECTORY.method,
+            params,
+            wait_for_response=True,
+        )
 
-        frame_payloads: list[dict[str, Any]] = [
-            {"blocks": f.to_dict().get("blocks", {})} for f in frame_list
-        ]
+        self._record_trajectory(params)
+        self._mirror_pipeline_reply(reply)
+        return self
 
-        box_list: list[mp.Box | None] | None = None
-        box_payloads: list[dict[str, Any] | None] | None = None
-        if boxes is not None:
-            box_list = list(boxes)
-            box_payloads = [
-                b.to_dict() if b is not None else None for b in box_list
-            ]
+    def _stream_trajectory(
+        self: "Molvis",
+        frames: Iterable[mp.Frame],
+        boxes: Iterable[mp.Box | None] | None,
+        chunk_size: int,
+    ) -> "Molvis":
+        """Send ``frames`` as ``set_trajectory`` + ``append_frames`` chunks."""
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+        if hasattr(frames, "__len__") and hasattr(boxes, "__len__"):
+            _check_box_count(len(frames), len(boxes))  # type: ignore[arg-type]
 
-        params: dict[str, Any] = {"frames": frame_payloads}
-        if box_payloads is not None:
-            params["boxes"] = box_payloads
+        box_iter = iter(boxes) if boxes is not None else None
+        sent = 0
+        for frame_chunk in _chunked(frames, chunk_size):
+            box_chunk: list[mp.Box | None] | None = None
+            if box_iter is not None:
+                box_chunk = list(islice(box_iter, len(frame_chunk)))
+                if len(box_chunk) < len(frame_chunk):
+                    _check_box_count(
+                        sent + len(frame_chunk), sent + len(box_chunk)
+                    )
 
-        self.send_cmd(
-            FrontendCommands.SET_TRAJECTORY.method,
-            params,
+            first = sent == 0
+            command = (
+                FrontendCommands.SET_TRAJECTORY
+                if first
+                else FrontendCommands.APPEND_FRAMES
+            )
+            params = self._trajectory_params(frame_chunk, box_chunk)
+            reply = self.send_cmd(command.method, params, wait_for_response=True)
+            if first:
+                self._record_trajectory(params)
+                self._mirror_pipeline_reply(reply)
+            else:
+                self._append_trajectory(params)
+            sent += len(frame_chunk)
+
+        if sent == 0:
+            raise ValueError("set_trajectory requires at least one frame")
+        if box_iter is not None and list(islice(box_iter, 1)):
+            raise ValueError(
+                f"boxes must have one entry per frame: got more than {sent} "
+                f"for {sent} frame(s)"
+            )
+        logger.debug("Streamed %d frame(s) in chunks of %d", sent, chunk_size)
+        return self
+
+    def attach_trajectory(
+        self: "Molvis",
+        reader: Any,
+        boxes: Iterable[mp.Box | None] | None = None,
+    ) -> "Molvis":
+        """Show a trajectory whose frames stay in Python until needed.
+
+        Only the frame count (and ``boxes``, when given) is sent up front.
+        The frontend then asks for individual frames with
+        ``event.request_frame`` as the timeline is scrubbed or
+        :meth:`seek_frame` is called, and each one is read from
+        ``reader`` and pushed back via ``scene.provide_frame``. The page
+        keeps a small LRU of recently viewed frames, so memory on both
+        sides stays bounded regardless of trajectory length.
+
+        Args:
+            reader: A molpy trajectory reader (e.g. the result of
+                ``mp.io.read_lammps_trajectory``). Anything exposing
+                ``n_frames`` or ``__len__`` plus ``read_frame(i)`` or
+                ``__getitem__`` works.
+            boxes: Optional per-frame molpy.Box objects. ``None`` entries
+                are allowed.
+
+        Returns:
+            Self for method chaining.
+        """
+        n_frames = _reader_length(reader)
+        if n_frames < 1:
+            raise ValueError("attach_trajectory requires at least one frame")
+        box_list = _serialize_boxes(list(boxes) if boxes is not None else None)
+
+        reply = self.send_cmd(
+            FrontendCommands.ATTACH_TRAJECTORY.method,
+            _attach_params(n_frames, box_list),
             wait_for_response=True,
         )
 
-        self._record_trajectory(frame_list, box_list)
-        self.list_modifiers()
+        self._record_attached_trajectory(reader, box_list)
+        self._mirror_pipeline_reply(reply)
         return self
 
+    def _reattach_trajectory(self: "Molvis", client: str | None = None) -> None:
+        """Re-send ``attach_trajectory`` for the mirrored reader, if any."""
+        with self._mirror_lock:
+            reader = self._mirror_reader
+            boxes = self._mirror_boxes
+        if reader is None:
+            return
+        self._transport.send_request(
+            FrontendCommands.ATTACH_TRAJECTORY.method,
+            _attach_params(_reader_length(reader), boxes),
+            wait_for_response=False,
+            **({"client": client} if client is not None else {}),
+        )
+
+    def _handle_frame_request(self: "Molvis", params: dict[str, Any]) -> None:
+        """Queue a reply to ``event.request_frame``.
+
+        Runs on a transport listener thread, so the read and the
+        ``scene.provide_frame`` send happen on a single worker thread;
+        that also serializes access to the (not thread-safe) reader.
+        """
+        index = params.get("index")
+        if not isinstance(index, int):
+            logger.warning("Ignoring request_frame without an index: %r", params)
+            return
+        self._frame_executor().submit(self._send_attached_frame, index)
+
+    def _send_attached_frame(self: "Molvis", index: int) -> None:
+        reader = self._attached_reader()
+        if reader is None:
+            return
+        params: dict[str, Any] = {"index": index}
+        try:
+            frame = _read_frame(reader, index)
+            blocks = _owned_blocks(frame.to_dict().get("blocks", {}))
+            # Drop the molrs-backed frame here, on the worker that read it.
+            del frame
+            params["frame"] = {"blocks": self._encode_blocks(blocks)}
+        except Exception as exc:
+            logger.exception("Failed to read frame %d for the viewer", index)
+            params["error"] = f"{type(exc).__name__}: {exc}"
+        try:
+            self._transport.send_request(
+                FrontendCommands.PROVIDE_FRAME.method,
+                params,
+                wait_for_response=False,
+            )
+        except Exception:
+            logger.exception("Failed to send frame %d to frontend", index)
+
+    def _trajectory_params(
+        self: "Molvis",
+        frames: list[mp.Frame],
+        boxes: list[mp.Box | None] | None,
+    ) -> dict[str, Any]:
+        """Serialize frames (and optional boxes) for a trajectory RPC."""
+        params: dict[str, Any] = {
+            "frames": self._encode_frames(
+                f.to_dict().get("blocks", {}) for f in frames
+            )
+        }
+        if boxes is not None:
+            params["boxes"] = _serialize_boxes(boxes)
+        return params
+
     def set_frame_labels(
         self: "Molvis",
         labels: Mapping[str, np.ndarray | Iterable[float]] | None,
@@ -127,11 +366,14 @@ class FrameCommandsMixin:
             TimeoutError: If the frontend does not respond within the timeout
             molvis.MolvisRPCError: If the frontend rejects the export request
         """
-        data = self.send_cmd(
-            FrontendCommands.EXPORT_FRAME.method,
-            {},
-            wait_for_response=True,
-            timeout=timeout,
+        data = resolve(
+            self.send_cmd(
+                FrontendCommands.EXPORT_FRAME.method,
+                {},
+                wait_for_response=True,
+                timeout=timeout,
+            ),
+            timeout,
         )
 
         if not isinstance(data, dict) or "frame" not in data:
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Sequence
 
 import numpy as np
 
+from ..batch import then
 from .catalog import FrontendCommands
 
 if TYPE_CHECKING:
@@ -19,6 +20,19 @@ __all__ = ["OverlayCommandsMixin"]
 Vec3 = Sequence[float]
 
 
+def _as_vec3_array(values: "np.ndarray") -> np.ndarray:
+    """``(N, 3)`` float32 view of ``values``; copies only to convert."""
+    return np.asarray(values, dtype=np.float32).reshape(-1, 3)
+
+
+def _overlay_id(reply: object) -> str:
+    """Overlay id from an ``overlay.add`` reply; raise if there is none."""
+    overlay_id = reply.get("id") if isinstance(reply, dict) else None
+    if not overlay_id:
+        raise ValueError(f"overlay.add reply carries no overlay id: {reply!r}")
+    return str(overlay_id)
+
+
 class OverlayCommandsMixin:
     """Mixin providing overlay annotation commands for Molvis widget."""
 
@@ -269,10 +283,15 @@ class OverlayCommandsMixin:
         max_arrows: int = 5000,
         shaft_radius: float = 0.03,
         head_ratio: float = 0.25,
-    ) -> "Molvis":
+        name: str | None = None,
+        wait_for_response: bool = False,
+    ) -> "str | Molvis":
         """
         Draw a vector field as a batch of arrows.
 
+        ``positions`` and ``vectors`` travel as binary float32 buffers, not
+        JSON lists, so fields with millions of arrows stay cheap to send.
+
         Args:
             positions: ``(N, 3)`` float array of arrow origins.
             vectors: ``(N, 3)`` float array of direction + magnitude.
@@ -282,31 +301,75 @@ class OverlayCommandsMixin:
             max_arrows: Maximum arrows to render (excess culled for perf).
             shaft_radius: Arrow shaft radius in world units.
             head_ratio: Head length / total length.
+            name: Optional display name.
+            wait_for_response: When ``True``, block until the frontend
+                returns the new overlay id and return that id — needed
+                for :meth:`update_vector_field`.
 
         Returns:
-            Self for method chaining.
+            Overlay id (``str``) when ``wait_for_response=True``,
+            otherwise ``self`` for method chaining.
+
+        Raises:
+            ValueError: If ``wait_for_response=True`` and the frontend's
+                reply carries no overlay id.
         """
-        pos_arr = np.asarray(positions, dtype=np.float32).reshape(-1, 3)
-        vec_arr = np.asarray(vectors, dtype=np.float32).reshape(-1, 3)
+        pos_arr = _as_vec3_array(positions)
+        vec_arr = _as_vec3_array(vectors)
         if pos_arr.shape != vec_arr.shape:
             raise ValueError(
                 f"positions and vectors must have the same shape, "
                 f"got {pos_arr.shape} vs {vec_arr.shape}"
             )
 
-        self.send_cmd(
+        params: dict = {
+            "type": "vector_field",
+            "positions": pos_arr.reshape(-1),
+            "vectors": vec_arr.reshape(-1),
+            "scale": scale,
+            "colorMode": color_mode,
+            "color": color,
+            "maxArrows": max_arrows,
+            "shaftRadius": shaft_radius,
+            "headRatio": head_ratio,
+        }
+        if name is not None:
+            params["name"] = name
+
+        result = self.send_cmd(
             FrontendCommands.ADD_OVERLAY.method,
-            {
-                "type": "vector_field",
-                "positions": pos_arr.flatten().tolist(),
-                "vectors": vec_arr.flatten().tolist(),
-                "scale": scale,
-                "colorMode": color_mode,
-                "color": color,
-                "maxArrows": max_arrows,
-                "shaftRadius": shaft_radius,
-                "headRatio": head_ratio,
-            },
+            params,
+            wait_for_response=wait_for_response,
+        )
+        if wait_for_response:
+            # Inside ``batch()`` this is a future of the id.
+            return then(result, _overlay_id)
+        return self
+
+    def update_vector_field(
+        self: "Molvis",
+        overlay_id: str,
+        vectors: "np.ndarray",
+    ) -> "Molvis":
+        """
+        Replace the vectors of an existing vector field in place.
+
+        Only the vectors buffer crosses the wire; positions and style are
+        kept, and the frontend rewrites its arrow instances without
+        rebuilding meshes — fast enough to animate a per-frame force or
+        velocity field.
+
+        Args:
+            overlay_id: Id returned by
+                ``draw_vector_field(..., wait_for_response=True)``.
+            vectors: ``(N, 3)`` float array; ``N`` must match the field.
+
+        Returns:
+            Self for method chaining.
+        """
+        self.send_cmd(
+            FrontendCommands.UPDATE_VECTOR_FIELD.method,
+            {"id": overlay_id, "vectors": _as_vec3_array(vectors).reshape(-1)},
         )
         return self
 
@@ -420,10 +483,100 @@ class OverlayCommandsMixin:
             params,
             wait_for_response=wait_for_response,
         )
-        if wait_for_response and isinstance(result, dict):
-            return str(result.get("id", ""))
+        if wait_for_response:
+            # Inside ``batch()`` this is a future of the id.
+            return then(result, _overlay_id)
         return self
 
+    def mark_atoms(
+        self: "Molvis",
+        atom_ids: "np.ndarray | Sequence[int]",
+        *,
+        labels: "str | Sequence[str | None] | None" = None,
+        colors: "str | Sequence[str] | None" = None,
+        shape_opacity: float | None = None,
+        show_shape: bool = True,
+        label_color: str | None = None,
+        label_background: str | None = None,
+        label_offset: Vec3 | None = None,
+        name: str | None = None,
+        timeout: float = 10.0,
+    ) -> "list[str]":
+        """
+        Mark many atoms in one request.
+
+        Bulk form of :meth:`mark_atom`: the atom ids travel as one binary
+        buffer and the frontend answers with every assigned id, so marking
+        a whole residue set costs one round trip instead of one per atom.
+        Either every atom is marked or, if one id cannot be resolved, none
+        is.
+
+        Args:
+            atom_ids: Atom indices to mark (non-negative integers).
+            labels: One label for all atoms, or one per atom (``None``
+                entries get no label).
+            colors: One halo color for all atoms, or one per atom.
+            shape_opacity: Halo opacity in 0-1, shared by all marks.
+            show_shape: Set ``False`` to display only labels, no halos.
+            label_color: CSS color for the label text.
+            label_background: Fill color behind the labels, or ``None``.
+            label_offset: ``[dx, dy, dz]`` offset of each label.
+            name: Optional display name for the overlays.
+            timeout: Seconds to wait for the frontend's reply.
+
+        Returns:
+            The overlay ids, in ``atom_ids`` order.
+        """
+        ids = np.asarray(atom_ids)
+        if ids.ndim != 1 or (ids.size and ids.dtype.kind not in "iu"):
+            raise ValueError(
+                f"mark_atoms: atom_ids must be a 1-D integer array, "
+                f"got {ids.dtype} with shape {ids.shape}"
+            )
+        if ids.size and int(ids.min()) < 0:
+            raise ValueError("mark_atoms: atom_ids must be non-negative")
+
+        params: dict = {"anchorAtomIds": ids.astype(np.uint32, copy=False)}
+        for key, values in (("labels", labels), ("colors", colors)):
+            if values is None:
+                continue
+            per_atom = [values] * ids.size if isinstance(values, str) else list(values)
+            if len(per_atom) != ids.size:
+                raise ValueError(
+                    f"mark_atoms: {key} must have one entry per atom "
+                    f"({ids.size}), got {len(per_atom)}"
+                )
+            params[key] = per_atom
+
+        if not show_shape:
+            params["shape"] = None
+        elif shape_opacity is not None:
+            params["shape"] = {"opacity": shape_opacity}
+
+        label_style: dict = {}
+        if label_color is not None:
+            label_style["color"] = label_color
+        if label_background is not None:
+            label_style["background"] = label_background
+        if label_offset is not None:
+            label_style["offset"] = list(label_offset)
+        if label_style:
+            params["label"] = label_style
+        if name is not None:
+            params["name"] = name
+
+        result = self.send_cmd(
+            FrontendCommands.MARK_ATOMS.method,
+            params,
+            wait_for_response=True,
+            timeout=timeout,
+        )
+        # Inside ``batch()`` this is a future of the ids.
+        return then(
+            result,
+            lambda r: [str(i) for i in r.get("ids", [])] if isinstance(r, dict) else [],
+        )
+
     def unmark_atom(self: "Molvis", overlay_id: str) -> "Molvis":
         """
         Remove a mark by id.
@@ -3,6 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from ..batch import resolve
 from ..palettes import (
     PaletteDefinition,
     PaletteEntry,
@@ -24,11 +25,14 @@ class PaletteCommandsMixin:
         self: "Molvis",
         timeout: float = 5.0,
     ) -> list[PaletteInfo]:
-        result = self.send_cmd(
-            "palette.list",
-            {},
-            wait_for_response=True,
-            timeout=timeout,
+        result = resolve(
+            self.send_cmd(
+                "palette.list",
+                {},
+                wait_for_response=True,
+                timeout=timeout,
+            ),
+            timeout,
         )
         return [PaletteInfo(r["name"], r["kind"], r["size"]) for r in result]
 
@@ -37,11 +41,14 @@ class PaletteCommandsMixin:
         name: str,
         timeout: float = 5.0,
     ) -> PaletteDefinition:
-        result = self.send_cmd(
-            "palette.get",
-            {"name": name},
-            wait_for_response=True,
-            timeout=timeout,
+        result = resolve(
+            self.send_cmd(
+                "palette.get",
+                {"name": name},
+                wait_for_response=True,
+                timeout=timeout,
+            ),
+            timeout,
         )
         entries = [
             PaletteEntry(e["label"], e["color"])
@@ -15,9 +15,12 @@ redraw path, same undo semantics.
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable, Mapping
+from concurrent.futures import Future
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Union
 
+from ..batch import resolve, then
 from .catalog import FrontendCommands
 
 if TYPE_CHECKING:
@@ -25,7 +28,12 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("molvis")
 
-__all__ = ["PipelineCommandsMixin", "ModifierInfo", "AvailableModifier"]
+__all__ = [
+    "PipelineCommandsMixin",
+    "ModifierInfo",
+    "AvailableModifier",
+    "ModifierSpec",
+]
 
 
 @dataclass(frozen=True)
@@ -49,6 +57,89 @@ class AvailableModifier:
     category: str
 
 
+@dataclass(frozen=True)
+class ModifierSpec:
+    """One node of the graph passed to :meth:`~PipelineCommandsMixin.set_pipeline`.
+
+    ``selection_scope`` and ``source_owner`` name either the ``ref`` of
+    another spec in the same call or the id of a modifier already in the
+    pipeline. ``children`` follow their parent in the pipeline and
+    consume its selection unless they set ``selection_scope`` themselves.
+    Refs starting with ``#`` are reserved for the ones generated for
+    parents without a ``ref``.
+    """
+
+    name: str
+    ref: str | None = None
+    enabled: bool | None = None
+    selection_scope: str | None = None
+    source_owner: str | None = None
+    children: tuple[ModifierSpecLike, ...] = ()
+
+    def __post_init__(self) -> None:
+        if self.ref is not None and self.ref.startswith("#"):
+            raise ValueError(
+                f"ModifierSpec ref {self.ref!r} starts with '#', which is "
+                "reserved for generated refs"
+            )
+
+
+ModifierSpecLike = Union[ModifierSpec, Mapping[str, Any], str]
+
+
+def _to_spec(raw: ModifierSpecLike) -> ModifierSpec:
+    if isinstance(raw, ModifierSpec):
+        return raw
+    if isinstance(raw, str):
+        return ModifierSpec(name=raw)
+    if isinstance(raw, Mapping):
+        fields = dict(raw)
+        fields["children"] = tuple(fields.get("children", ()))
+        return ModifierSpec(**fields)
+    raise TypeError(f"Expected a ModifierSpec, mapping or name, got {raw!r}")
+
+
+def _flatten_specs(specs: Iterable[ModifierSpecLike]) -> list[dict[str, Any]]:
+    """Lay a spec tree out in pipeline order as ``pipeline.set`` entries.
+
+    Parents without a ``ref`` get a generated one so their children can
+    point at them.
+    """
+    entries: list[dict[str, Any]] = []
+
+    def visit(raw: ModifierSpecLike, parent_ref: str | None) -> None:
+        spec = _to_spec(raw)
+        ref = spec.ref
+        if ref is None and spec.children:
+            ref = f"#{len(entries)}"
+        scope = spec.selection_scope if spec.selection_scope is not None else parent_ref
+        entry: dict[str, Any] = {"name": spec.name}
+        for key, value in (
+            ("ref", ref),
+            ("enabled", spec.enabled),
+            ("selection_scope", scope),
+            ("source_owner", spec.source_owner),
+        ):
+            if value is not None:
+                entry[key] = value
+        entries.append(entry)
+        for child in spec.children:
+            visit(child, ref)
+
+    for raw in specs:
+        visit(raw, None)
+    return entries
+
+
+def _settled(reply: Any) -> Any:
+    """A batched reply's result, or ``None`` if that command failed."""
+    if not isinstance(reply, Future):
+        return reply
+    if reply.cancelled() or reply.exception() is not None:
+        return None
+    return reply.result()
+
+
 def _to_modifier_info(raw: Any) -> ModifierInfo:
     return ModifierInfo(
         id=str(raw["id"]),
@@ -64,19 +155,31 @@ def _to_modifier_info(raw: Any) -> ModifierInfo:
 class PipelineCommandsMixin:
     """Mixin class providing modifier pipeline CRUD for :class:`Molvis`.
 
-    Every mutation waits for the frontend's response and then refreshes
-    the local pipeline mirror by calling :meth:`list_modifiers`. This
-    keeps Python's ``_mirror_pipeline`` byte-for-byte aligned with what
-    the frontend renders — the mirror is what gets replayed on a WS
-    reconnect via :meth:`Molvis._send_state_sync_snapshot`.
+    Every mutation waits for the frontend's response, which carries the
+    resulting pipeline under ``"pipeline"``, and refreshes the local
+    mirror from it — one round trip per mutation. This keeps Python's
+    ``_mirror_pipeline`` byte-for-byte aligned with what the frontend
+    renders — the mirror is what gets replayed on a WS reconnect via
+    :meth:`Molvis._send_state_sync_snapshot`. Pages that do not return
+    the pipeline get a follow-up :meth:`list_modifiers` instead.
+
+    Inside :meth:`Molvis.batch` the refresh runs once when the batch
+    closes, and :meth:`add_modifier` / :meth:`remove_modifier` return
+    futures of their usual results.
     """
 
     def list_modifiers(self: "Molvis", timeout: float = 5.0) -> list[ModifierInfo]:
         """Return the ordered list of modifiers currently in the pipeline.
 
         Also refreshes the Python-side mirror used for state sync on
-        reconnect. Safe to call from user code at any time.
+        reconnect. Safe to call from user code at any time. Inside
+        :meth:`Molvis.batch` it only schedules that refresh for when the
+        batch closes and returns ``[]``.
         """
+        batch = self._active_batch()
+        if batch is not None:
+            batch.defer("pipeline", lambda: self.list_modifiers(timeout=timeout))
+            return []
         data = self.send_cmd(
             FrontendCommands.PIPELINE_LIST.method,
             {},
@@ -88,15 +191,40 @@ class PipelineCommandsMixin:
         self._record_pipeline(entries)
         return entries
 
+    def _mirror_pipeline_reply(
+        self: "Molvis", reply: Any, timeout: float = 5.0
+    ) -> None:
+        """Refresh the pipeline mirror from a mutation's ``reply``.
+
+        Uses the reply's ``"pipeline"`` entries when present and falls
+        back to :meth:`list_modifiers` otherwise. Inside
+        :meth:`Molvis.batch` only the last reply of the batch is applied.
+        """
+        batch = self._active_batch()
+        if batch is not None:
+            batch.defer(
+                "pipeline",
+                lambda: self._mirror_pipeline_reply(_settled(reply), timeout),
+            )
+            return
+        raw_list = reply.get("pipeline") if isinstance(reply, dict) else None
+        if not isinstance(raw_list, list):
+            self.list_modifiers(timeout=timeout)
+            return
+        self._record_pipeline(_to_modifier_info(entry) for entry in raw_list)
+
     def available_modifiers(
         self: "Molvis", timeout: float = 5.0
     ) -> list[AvailableModifier]:
         """Return every modifier type registered in the frontend registry."""
-        data = self.send_cmd(
-            FrontendCommands.PIPELINE_AVAILABLE_MODIFIERS.method,
-            {},
-            wait_for_response=True,
-            timeout=timeout,
+        data = resolve(
+            self.send_cmd(
+                FrontendCommands.PIPELINE_AVAILABLE_MODIFIERS.method,
+                {},
+                wait_for_response=True,
+                timeout=timeout,
+            ),
+            timeout,
         )
         raw_list = data.get("modifiers", []) if isinstance(data, dict) else []
         return [
@@ -112,7 +240,7 @@ class PipelineCommandsMixin:
         source_owner_id: str | None = None,
         enabled: bool | None = None,
         timeout: float = 5.0,
-    ) -> ModifierInfo:
+    ) -> ModifierInfo | Future[ModifierInfo]:
         """Append a modifier to the pipeline and return its assigned info.
 
         Args:
@@ -140,16 +268,71 @@ class PipelineCommandsMixin:
             wait_for_response=True,
             timeout=timeout,
         )
-        modifier = (
-            data.get("modifier") if isinstance(data, dict) else None
-        ) or {}
-        info = _to_modifier_info(modifier)
-        self.list_modifiers(timeout=timeout)
+        info = then(
+            data,
+            lambda d: _to_modifier_info(
+                (d.get("modifier") if isinstance(d, dict) else None) or {}
+            ),
+        )
+        self._mirror_pipeline_reply(data, timeout)
         return info
 
+    def set_pipeline(
+        self: "Molvis",
+        spec: Iterable[ModifierSpecLike],
+        *,
+        replace: bool = True,
+        timeout: float = 5.0,
+    ) -> list[ModifierInfo] | Future[list[ModifierInfo]]:
+        """Build a whole modifier graph in one RPC.
+
+        The frontend adds every modifier, wires its selection scope and
+        source owner, and evaluates the pipeline once. Either all of
+        ``spec`` is applied or, when any entry is rejected, none of it.
+
+        Args:
+            spec: :class:`ModifierSpec` objects, equivalent mappings, or
+                bare registry names, in pipeline order. Nested
+                ``children`` are laid out depth-first after their parent.
+            replace: Drop every existing modifier except the data
+                sources first. Links may then only reach data sources
+                outside ``spec``. With ``False`` the graph is appended.
+
+        Returns:
+            The created modifiers, in pipeline order.
+
+        Raises:
+            molvis.MolvisRPCError: If a name is unknown, a link cannot be
+                resolved, or the pipeline rejects a scope/owner link.
+
+        Example::
+
+            scene.set_pipeline([
+                ModifierSpec("Expression Select", children=(
+                    ModifierSpec("Hide Selection"),
+                )),
+                "Hide Hydrogens",
+            ])
+        """
+        data = self.send_cmd(
+            FrontendCommands.PIPELINE_SET.method,
+            {"modifiers": _flatten_specs(spec), "replace": bool(replace)},
+            wait_for_response=True,
+            timeout=timeout,
+        )
+        created = then(
+            data,
+            lambda d: [
+                _to_modifier_info(entry)
+                for entry in (d.get("modifiers", []) if isinstance(d, dict) else [])
+            ],
+        )
+        self._mirror_pipeline_reply(data, timeout)
+        return created
+
     def remove_modifier(
         self: "Molvis", modifier_id: str, *, timeout: float = 5.0
-    ) -> list[str]:
+    ) -> list[str] | Future[list[str]]:
         """Remove a modifier and its descendants. Returns the removed ids."""
         data = self.send_cmd(
             FrontendCommands.PIPELINE_REMOVE_MODIFIER.method,
@@ -157,11 +340,15 @@ class PipelineCommandsMixin:
             wait_for_response=True,
             timeout=timeout,
         )
-        removed = (
-            data.get("removed_ids", []) if isinstance(data, dict) else []
+        removed = then(
+            data,
+            lambda d: [
+                str(x)
+                for x in (d.get("removed_ids", []) if isinstance(d, dict) else [])
+            ],
         )
-        self.list_modifiers(timeout=timeout)
-        return [str(x) for x in removed]
+        self._mirror_pipeline_reply(data, timeout)
+        return removed
 
     def reorder_modifier(
         self: "Molvis",
@@ -171,13 +358,13 @@ class PipelineCommandsMixin:
         timeout: float = 5.0,
     ) -> "Molvis":
         """Move a modifier to a new position in the pipeline array."""
-        self.send_cmd(
+        reply = self.send_cmd(
             FrontendCommands.PIPELINE_REORDER_MODIFIER.method,
             {"id": modifier_id, "new_index": int(new_index)},
             wait_for_response=True,
             timeout=timeout,
         )
-        self.list_modifiers(timeout=timeout)
+        self._mirror_pipeline_reply(reply, timeout)
         return self
 
     def set_modifier_enabled(
@@ -188,13 +375,13 @@ class PipelineCommandsMixin:
         timeout: float = 5.0,
     ) -> "Molvis":
         """Toggle a single modifier on/off without reordering."""
-        self.send_cmd(
+        reply = self.send_cmd(
             FrontendCommands.PIPELINE_SET_ENABLED.method,
             {"id": modifier_id, "enabled": bool(enabled)},
             wait_for_response=True,
             timeout=timeout,
         )
-        self.list_modifiers(timeout=timeout)
+        self._mirror_pipeline_reply(reply, timeout)
         return self
 
     def set_modifier_selection_scope(
@@ -205,13 +392,13 @@ class PipelineCommandsMixin:
         timeout: float = 5.0,
     ) -> "Molvis":
         """Set the selection scope consumed by a modifier, or detach it."""
-        self.send_cmd(
+        reply = self.send_cmd(
             FrontendCommands.PIPELINE_SET_SELECTION_SCOPE.method,
             {"id": modifier_id, "selection_scope_id": selection_scope_id},
             wait_for_response=True,
             timeout=timeout,
         )
-        self.list_modifiers(timeout=timeout)
+        self._mirror_pipeline_reply(reply, timeout)
         return self
 
     def set_modifier_source_owner(
@@ -222,13 +409,13 @@ class PipelineCommandsMixin:
         timeout: float = 5.0,
     ) -> "Molvis":
         """Set source tree ownership for a modifier, or detach it."""
-        self.send_cmd(
+        reply = self.send_cmd(
             FrontendCommands.PIPELINE_SET_SOURCE_OWNER.method,
             {"id": modifier_id, "source_owner_id": source_owner_id},
             wait_for_response=True,
             timeout=timeout,
         )
-        self.list_modifiers(timeout=timeout)
+        self._mirror_pipeline_reply(reply, timeout)
         return self
 
     def clear_pipeline(
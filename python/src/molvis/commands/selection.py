@@ -11,6 +11,7 @@ import logging
 
 import molpy as mp
 
+from ..batch import resolve
 from .catalog import FrontendCommands
 
 logger = logging.getLogger("molvis")
@@ -49,11 +50,14 @@ class SelectionCommandsMixin:
             >>> print(selected.blocks['atoms']['element'])
             ['C', 'N', 'O', ...]
         """
-        data = self.send_cmd(
-            FrontendCommands.GET_SELECTED.method,
-            {},
-            wait_for_response=True,
-            timeout=timeout,
+        data = resolve(
+            self.send_cmd(
+                FrontendCommands.GET_SELECTED.method,
+                {},
+                wait_for_response=True,
+                timeout=timeout,
+            ),
+            timeout,
         )
         
         # Construct molpy.Frame from the response
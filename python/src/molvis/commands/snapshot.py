@@ -9,6 +9,7 @@ import base64
 import logging
 from typing import TYPE_CHECKING
 
+from ..batch import resolve
 from .catalog import FrontendCommands
 
 if TYPE_CHECKING:
@@ -39,11 +40,14 @@ class SnapshotCommandsMixin:
             TimeoutError: If the frontend does not respond within the timeout
             molvis.MolvisRPCError: If the frontend rejects the snapshot request
         """
-        data = self.send_cmd(
-            FrontendCommands.SNAPSHOT.method,
-            {},
-            wait_for_response=True,
-            timeout=timeout,
+        data = resolve(
+            self.send_cmd(
+                FrontendCommands.SNAPSHOT.method,
+                {},
+                wait_for_response=True,
+                timeout=timeout,
+            ),
+            timeout,
         )
 
         if not isinstance(data, dict) or "data" not in data:
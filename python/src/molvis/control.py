@@ -14,16 +14,22 @@ PNG bytes via ``capture.snapshot`` — keep ``ControlMixin`` listed before
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Sequence
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
+
+from .batch import resolve
 
 if TYPE_CHECKING:
     from .video import write_video as _write_video_t  # noqa: F401
 
 __all__ = ["Camera", "CameraPose", "ControlMixin"]
 
+T = TypeVar("T")
+
 
 @dataclass(frozen=True)
 class CameraPose:
@@ -52,6 +58,25 @@ class CameraPose:
         )
 
 
+def _pose_params(
+    alpha: float | None = None,
+    beta: float | None = None,
+    radius: float | None = None,
+    target: Sequence[float] | None = None,
+) -> dict[str, Any]:
+    """Wire form of a (partial) pose, as taken by ``camera.set_pose``."""
+    params: dict[str, Any] = {}
+    if alpha is not None:
+        params["alpha"] = float(alpha)
+    if beta is not None:
+        params["beta"] = float(beta)
+    if radius is not None:
+        params["radius"] = float(radius)
+    if target is not None:
+        params["target"] = [float(v) for v in target]
+    return params
+
+
 class Camera:
     """Proxy that translates camera operations to RPC calls on a viewer."""
 
@@ -59,8 +84,8 @@ class Camera:
         self._viewer = viewer
 
     def get_pose(self) -> CameraPose:
-        result = self._viewer.send_cmd(
-            "camera.get_pose", {}, wait_for_response=True
+        result = resolve(
+            self._viewer.send_cmd("camera.get_pose", {}, wait_for_response=True)
         )
         return CameraPose.from_rpc(result)
 
@@ -72,17 +97,9 @@ class Camera:
         radius: float | None = None,
         target: Sequence[float] | None = None,
     ) -> CameraPose:
-        params: dict[str, Any] = {}
-        if alpha is not None:
-            params["alpha"] = float(alpha)
-        if beta is not None:
-            params["beta"] = float(beta)
-        if radius is not None:
-            params["radius"] = float(radius)
-        if target is not None:
-            params["target"] = [float(v) for v in target]
-        result = self._viewer.send_cmd(
-            "camera.set_pose", params, wait_for_response=True
+        params = _pose_params(alpha, beta, radius, target)
+        result = resolve(
+            self._viewer.send_cmd("camera.set_pose", params, wait_for_response=True)
         )
         return CameraPose.from_rpc(result["pose"])
 
@@ -98,14 +115,14 @@ class Camera:
         }
         if up is not None:
             params["up"] = [float(v) for v in up]
-        result = self._viewer.send_cmd(
-            "camera.look_at", params, wait_for_response=True
+        result = resolve(
+            self._viewer.send_cmd("camera.look_at", params, wait_for_response=True)
         )
         return CameraPose.from_rpc(result["pose"])
 
     def fit_view(self) -> CameraPose:
-        result = self._viewer.send_cmd(
-            "camera.fit_view", {}, wait_for_response=True
+        result = resolve(
+            self._viewer.send_cmd("camera.fit_view", {}, wait_for_response=True)
         )
         return CameraPose.from_rpc(result["pose"])
 
@@ -138,6 +155,73 @@ def _png_bytes_from_response(response: Any) -> bytes:
     )
 
 
+def _prefetched(jobs: Iterable[Callable[[], T]], window: int) -> Iterator[T]:
+    """Run up to ``window`` jobs at once and yield their results in order.
+
+    A job is only started when a slot frees up, so a slow consumer (e.g.
+    ffmpeg) holds at most ``window`` results. Closing the iterator early
+    cancels the jobs that have not started.
+    """
+    if window == 1:
+        for job in jobs:
+            yield job()
+        return
+    pool = ThreadPoolExecutor(
+        max_workers=window, thread_name_prefix="molvis-capture"
+    )
+    in_flight: deque[Future[T]] = deque()
+    try:
+        for job in jobs:
+            in_flight.append(pool.submit(job))
+            if len(in_flight) == window:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _rgba_bytes_from_response(
+    response: Any, width: int | None = None, height: int | None = None
+) -> bytes:
+    """Extract raw RGBA pixels from a ``capture.snapshot`` response.
+
+    A ``format="rgba"`` capture returns ``rgba_ref`` (rows top to bottom,
+    four bytes per pixel) plus the ``width`` / ``height`` it was rendered
+    at; the pixel count is checked against them, and they are checked
+    against the requested ``width`` / ``height`` when given.
+    """
+    if not isinstance(response, dict) or response.get("format") != "rgba":
+        raise ValueError(
+            "Expected an RGBA capture.snapshot response; the page may not "
+            'support format="rgba"'
+        )
+    ref = response.get("rgba_ref")
+    if hasattr(ref, "tobytes"):
+        pixels = ref.tobytes()
+    elif isinstance(ref, (bytes, bytearray, memoryview)):
+        pixels = bytes(ref)
+    else:
+        raise ValueError(
+            f"Unexpected rgba_ref in capture.snapshot: {type(ref).__name__}"
+        )
+    got_width, got_height = int(response["width"]), int(response["height"])
+    if (width is not None and got_width != width) or (
+        height is not None and got_height != height
+    ):
+        raise ValueError(
+            f"RGBA capture is {got_width}x{got_height}, requested "
+            f"{width or got_width}x{height or got_height}"
+        )
+    expected = got_width * got_height * 4
+    if len(pixels) != expected:
+        raise ValueError(
+            f"RGBA capture is {len(pixels)} bytes, expected {expected} for "
+            f"{response['width']}x{response['height']}"
+        )
+    return pixels
+
+
 class ControlMixin:
     """Camera, frame seeking, and snapshot ergonomics for any viewer that
     exposes :meth:`send_cmd` (Jupyter ``Molvis`` and ``StandaloneMolvis``).
@@ -152,18 +236,20 @@ class ControlMixin:
         return proxy
 
     def seek_frame(self, index: int) -> dict[str, int]:
-        return self.send_cmd(
-            "frame.seek", {"index": int(index)}, wait_for_response=True
+        return resolve(
+            self.send_cmd(
+                "frame.seek", {"index": int(index)}, wait_for_response=True
+            )
         )
 
     def next_frame(self) -> dict[str, int]:
-        return self.send_cmd("frame.next", {}, wait_for_response=True)
+        return resolve(self.send_cmd("frame.next", {}, wait_for_response=True))
 
     def prev_frame(self) -> dict[str, int]:
-        return self.send_cmd("frame.prev", {}, wait_for_response=True)
+        return resolve(self.send_cmd("frame.prev", {}, wait_for_response=True))
 
     def frame_info(self) -> dict[str, int]:
-        return self.send_cmd("frame.info", {}, wait_for_response=True)
+        return resolve(self.send_cmd("frame.info", {}, wait_for_response=True))
 
     @property
     def n_frames(self) -> int:
@@ -179,18 +265,33 @@ class ControlMixin:
         crop_padding: int | None = None,
         quality: float | None = None,
         frame_index: int | None = None,
+        pose: CameraPose | None = None,
+        format: Literal["png", "rgba"] = "png",
         timeout: float = 30.0,
     ) -> bytes:
         """Capture the current viewport as PNG bytes.
 
-        ``frame_index`` performs seek + render + capture in one round-trip
-        for use in animation hot loops. The default 30-second timeout
-        accommodates large-resolution offscreen renders.
+        ``format="rgba"`` returns the raw pixels instead, rows top to
+        bottom, ``width * height * 4`` bytes — no PNG encode in the
+        browser or decode on the way to ffmpeg. It cannot be combined
+        with ``auto_crop``.
+
+        ``frame_index`` and ``pose`` make seek + camera move + render +
+        capture one round-trip for use in animation hot loops; the pose
+        stays applied afterwards, as with :meth:`Camera.set_pose`. The
+        default 30-second timeout accommodates large-resolution offscreen
+        renders.
         """
+        if format not in ("png", "rgba"):
+            raise ValueError(f"format must be 'png' or 'rgba', got {format!r}")
+        if format == "rgba" and auto_crop:
+            raise ValueError('snapshot(format="rgba") cannot auto_crop')
         params: dict[str, Any] = {
             "transparent": bool(transparent),
             "autoCrop": bool(auto_crop),
         }
+        if format != "png":
+            params["format"] = format
         if width is not None:
             params["width"] = int(width)
         if height is not None:
@@ -201,12 +302,23 @@ class ControlMixin:
             params["quality"] = float(quality)
         if frame_index is not None:
             params["frameIndex"] = int(frame_index)
+        if pose is not None:
+            params["camera"] = _pose_params(
+                pose.alpha, pose.beta, pose.radius, pose.target
+            )
         response = self.send_cmd(
             "capture.snapshot",
             params,
             wait_for_response=True,
             timeout=timeout,
         )
+        response = resolve(response, timeout)
+        if format == "rgba":
+            return _rgba_bytes_from_response(
+                response,
+                None if width is None else int(width),
+                None if height is None else int(height),
+            )
         return _png_bytes_from_response(response)
 
     def render_animation(
@@ -218,6 +330,8 @@ class ControlMixin:
         fps: int = 30,
         width: int = 1920,
         height: int = 1080,
+        prefetch: int = 4,
+        frame_format: Literal["png", "rgba"] = "png",
         **video_kwargs: Any,
     ) -> Path:
         """Drive a seek + pose + snapshot loop and pipe results to ffmpeg.
@@ -225,9 +339,31 @@ class ControlMixin:
         ``frame_indices`` defaults to every frame in the current trajectory;
         ``camera_path`` may be ``None`` (no per-frame pose change) or a
         sequence of poses with the same length as ``frame_indices``.
+
+        Each frame is one ``capture.snapshot`` request carrying its frame
+        index and pose. Up to ``prefetch`` of them are kept in flight and
+        their images are written in frame order, so the browser renders
+        the next frames while ffmpeg encodes the current one.
+
+        ``frame_format="rgba"`` moves raw pixels instead of PNGs and feeds
+        them to ffmpeg as rawvideo, which removes most of the per-frame
+        CPU cost of large renders at the price of ``width * height * 4``
+        bytes per frame on the wire. Every frame must come back at
+        ``width`` x ``height``; one that does not raises ``ValueError``
+        instead of shearing the video.
         """
         from .video import write_video
 
+        if prefetch < 1:
+            raise ValueError(f"prefetch must be >= 1, got {prefetch}")
+        if frame_format == "rgba":
+            size = video_kwargs.setdefault("size", (width, height))
+            if tuple(size) != (width, height):
+                raise ValueError(
+                    f"size {tuple(size)} does not match the {width}x{height} "
+                    "RGBA frames"
+                )
+
         indices: Sequence[int]
         if frame_indices is None:
             indices = range(self.n_frames)
@@ -245,17 +381,20 @@ class ControlMixin:
                 "frame_indices and camera_path must have the same length"
             )
 
-        def _stream() -> Iterable[bytes]:
-            for idx, pose in zip(indices, poses):
-                if pose is not None:
-                    self.camera.set_pose(
-                        alpha=pose.alpha,
-                        beta=pose.beta,
-                        radius=pose.radius,
-                        target=pose.target,
-                    )
-                yield self.snapshot(
-                    width=width, height=height, frame_index=int(idx)
-                )
-
-        return write_video(_stream(), out_path, fps=fps, **video_kwargs)
+        jobs = (
+            lambda idx=idx, pose=pose: self.snapshot(
+                width=width,
+                height=height,
+                frame_index=int(idx),
+                pose=pose,
+                format=frame_format,
+            )
+            for idx, pose in zip(indices, poses)
+        )
+        return write_video(
+            _prefetched(jobs, prefetch),
+            out_path,
+            fps=fps,
+            frame_format=frame_format,
+            **video_kwargs,
+        )
@@ -10,10 +10,11 @@ The bus does two things:
    are correct without a roundtrip.
 2. Fans the event out to user-registered callbacks.
 
-User callbacks fire on the transport's asyncio thread — not the main
-thread. Synchronous code that wants to *wait* for a specific event
-(e.g. "block until user clicks an atom") should use :meth:`EventBus.wait_for`
-instead of registering a callback.
+User callbacks fire on the transport's listener pool — not the main
+thread — one event name at a time, in arrival order. Synchronous code
+that wants to *wait* for a specific event (e.g. "block until user clicks
+an atom") should use :meth:`EventBus.wait_for` instead of registering a
+callback.
 """
 
 from __future__ import annotations
@@ -0,0 +1,387 @@
+"""Byte-offset frame index for text trajectories (LAMMPS dump, XYZ).
+
+Opening a long trajectory used to mean parsing every frame before the
+viewer saw anything. :func:`open_indexed_trajectory` instead scans the
+file once for frame boundaries, stores the offsets in a ``.molidx``
+sidecar next to the trajectory, and afterwards parses single frames
+straight out of an ``mmap`` on demand.
+
+The sidecar uses the same layout as the frontend's ``molidx`` codec
+(``core/src/io/cache/molidx_codec.ts``), so an index built here is
+readable by the page and vice versa. A sidecar is only trusted when its
+recorded byte length matches the trajectory's current size and it is
+not older than the trajectory; anything else is treated as a miss and
+the file is re-indexed.
+"""
+
+from __future__ import annotations
+
+import logging
+import mmap
+import os
+import re
+import struct
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Literal
+
+import molpy as mp
+import numpy as np
+
+logger = logging.getLogger("molvis")
+
+__all__ = [
+    "FrameIndex",
+    "IndexedTrajectoryReader",
+    "build_frame_index",
+    "decode_molidx",
+    "encode_molidx",
+    "is_extended_xyz",
+    "open_indexed_trajectory",
+]
+
+TrajectoryFormat = Literal["lammps-dump", "xyz"]
+
+# Mirrors molidx_codec.ts — keep the two in lockstep.
+_MOLIDX_MAGIC = 0x5849444D  # "MIDX"
+_MOLIDX_VERSION = 1
+_MOLIDX_HEADER = struct.Struct("<IIIIIQQ")
+_MOLIDX_ENTRY = np.dtype([("offset", "<u8"), ("length", "<u4")])
+_FORMAT_IDS: dict[str, int] = {
+    "lammps-dump": 1,
+    "xyz": 2,
+    "pdb": 3,
+    "lammps": 4,
+    "sdf": 5,
+}
+_SIDECAR_SUFFIX = ".molidx"
+_UINT32_MAX = 0xFFFFFFFF
+
+
+@dataclass(frozen=True)
+class FrameIndex:
+    """Frame boundaries of one trajectory file.
+
+    ``offsets[i]`` / ``lengths[i]`` give the byte range of frame ``i``;
+    ``total_bytes`` is the file size the index was built against.
+    """
+
+    format: str
+    total_bytes: int
+    offsets: np.ndarray
+    lengths: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+
+def encode_molidx(index: FrameIndex) -> bytes:
+    """Serialize ``index`` in the frontend's ``.molidx`` v1 layout."""
+    format_id = _FORMAT_IDS.get(index.format)
+    if format_id is None:
+        raise ValueError(f"molidx encode: unknown format {index.format!r}")
+    entries = np.empty(len(index), dtype=_MOLIDX_ENTRY)
+    entries["offset"] = index.offsets
+    entries["length"] = index.lengths
+    header = _MOLIDX_HEADER.pack(
+        _MOLIDX_MAGIC,
+        _MOLIDX_VERSION,
+        format_id,
+        0,
+        len(index),
+        index.total_bytes,
+        index.total_bytes,
+    )
+    return header + entries.tobytes()
+
+
+def decode_molidx(data: bytes) -> FrameIndex | None:
+    """Parse a ``.molidx`` buffer; ``None`` on any structural mismatch."""
+    if len(data) < _MOLIDX_HEADER.size:
+        return None
+    magic, version, format_id, _reserved, nframes, total_bytes, _source = (
+        _MOLIDX_HEADER.unpack_from(data)
+    )
+    if magic != _MOLIDX_MAGIC or version != _MOLIDX_VERSION:
+        return None
+    if len(data) != _MOLIDX_HEADER.size + nframes * _MOLIDX_ENTRY.itemsize:
+        return None
+    fmt = next((k for k, v in _FORMAT_IDS.items() if v == format_id), None)
+    if fmt is None:
+        return None
+    entries = np.frombuffer(
+        data, dtype=_MOLIDX_ENTRY, count=nframes, offset=_MOLIDX_HEADER.size
+    )
+    return FrameIndex(
+        format=fmt,
+        total_bytes=total_bytes,
+        offsets=entries["offset"].astype(np.int64),
+        lengths=entries["length"].astype(np.int64),
+    )
+
+
+def build_frame_index(path: str | Path, fmt: TrajectoryFormat) -> FrameIndex:
+    """Scan ``path`` once and return the byte range of every frame."""
+    path = Path(path)
+    size = path.stat().st_size
+    if size == 0:
+        return _make_index(fmt, 0, [])
+    with path.open("rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if fmt == "lammps-dump":
+            starts = _scan_lammps_dump(mm)
+        elif fmt == "xyz":
+            starts = _scan_xyz(mm)
+        else:
+            raise ValueError(f"no frame scanner for format {fmt!r}")
+    return _make_index(fmt, size, starts)
+
+
+def _make_index(fmt: str, size: int, starts: list[int]) -> FrameIndex:
+    offsets = np.asarray(starts, dtype=np.int64)
+    lengths = np.diff(np.append(offsets, size))
+    if len(lengths) and int(lengths.max()) > _UINT32_MAX:
+        raise ValueError("molidx cannot describe frames larger than 4 GiB")
+    return FrameIndex(format=fmt, total_bytes=size, offsets=offsets, lengths=lengths)
+
+
+def _scan_lammps_dump(mm: mmap.mmap) -> list[int]:
+    """Every frame of a LAMMPS dump opens with an ``ITEM: TIMESTEP`` line."""
+    marker = b"ITEM: TIMESTEP"
+    starts: list[int] = []
+    pos = mm.find(marker)
+    while pos != -1:
+        if pos == 0 or mm[pos - 1] == 0x0A:
+            starts.append(pos)
+        pos = mm.find(marker, pos + len(marker))
+    return starts
+
+
+def _scan_xyz(mm: mmap.mmap) -> list[int]:
+    """XYZ frames are an atom count, a comment line, then that many atoms."""
+    starts: list[int] = []
+    size = len(mm)
+    pos = 0
+    while pos < size:
+        end = mm.find(b"\n", pos)
+        line_end = size if end == -1 else end
+        count_line = mm[pos:line_end].strip()
+        if not count_line:
+            pos = line_end + 1
+            continue
+        try:
+            natoms = int(count_line)
+        except ValueError:
+            raise ValueError(
+                f"malformed XYZ frame at byte {pos}: expected an atom count, "
+                f"got {count_line[:40]!r}"
+            ) from None
+        starts.append(pos)
+        pos = line_end + 1
+        for _ in range(natoms + 1):
+            end = mm.find(b"\n", pos)
+            if end == -1:
+                pos = size
+                break
+            pos = end + 1
+    return starts
+
+
+def _sidecar_path(path: Path) -> Path:
+    return path.with_name(path.name + _SIDECAR_SUFFIX)
+
+
+def _load_sidecar(path: Path, fmt: str, stat: os.stat_result) -> FrameIndex | None:
+    sidecar = _sidecar_path(path)
+    try:
+        if sidecar.stat().st_mtime_ns < stat.st_mtime_ns:
+            return None
+        index = decode_molidx(sidecar.read_bytes())
+    except OSError:
+        return None
+    if index is None or index.format != fmt or index.total_bytes != stat.st_size:
+        return None
+    return index
+
+
+def _store_sidecar(path: Path, index: FrameIndex) -> None:
+    sidecar = _sidecar_path(path)
+    tmp = sidecar.with_name(sidecar.name + ".tmp")
+    try:
+        tmp.write_bytes(encode_molidx(index))
+        os.replace(tmp, sidecar)
+    except OSError as exc:
+        # Read-only directory and friends: the index still works for this
+        # session, it just has to be rebuilt next time.
+        logger.debug("Could not write frame index %s: %s", sidecar, exc)
+        tmp.unlink(missing_ok=True)
+
+
+class IndexedTrajectoryReader:
+    """Random-access trajectory reader over an ``mmap`` and a :class:`FrameIndex`.
+
+    Exposes the subset of the molpy trajectory-reader surface the viewer
+    needs — ``n_frames``, ``read_frame(i)``, ``read_all()`` — so it can be
+    handed directly to :meth:`Molvis.attach_trajectory`.
+    """
+
+    def __init__(self, path: str | Path, index: FrameIndex) -> None:
+        self.path = Path(path)
+        self.index = index
+        self._file = self.path.open("rb")
+        self._mmap: mmap.mmap | None = (
+            mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if index.total_bytes
+            else None
+        )
+
+    @property
+    def n_frames(self) -> int:
+        return len(self.index)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __getitem__(self, index: int) -> mp.Frame:
+        return self.read_frame(index)
+
+    def read_frame(self, index: int) -> mp.Frame:
+        n = len(self.index)
+        if index < 0:
+            index += n
+        if not 0 <= index < n or self._mmap is None:
+            raise IndexError(f"frame {index} out of range [0, {n})")
+        start = int(self.index.offsets[index])
+        text = self._mmap[start : start + int(self.index.lengths[index])]
+        if self.index.format == "lammps-dump":
+            return _parse_lammps_dump_frame(text)
+        return _parse_xyz_frame(text)
+
+    def read_all(self) -> Iterator[mp.Frame]:
+        for i in range(len(self.index)):
+            yield self.read_frame(i)
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self) -> "IndexedTrajectoryReader":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def open_indexed_trajectory(
+    path: str | Path, fmt: TrajectoryFormat
+) -> IndexedTrajectoryReader:
+    """Open ``path`` for random access, reusing or writing its ``.molidx``."""
+    path = Path(path)
+    stat = path.stat()
+    index = _load_sidecar(path, fmt, stat)
+    if index is None:
+        index = build_frame_index(path, fmt)
+        _store_sidecar(path, index)
+        logger.debug("Indexed %d frame(s) in %s", len(index), path.name)
+    return IndexedTrajectoryReader(path, index)
+
+
+# ----------------------------------------------------------------------
+# Single-frame parsers
+#
+# These produce the same blocks, field names and box as the molpy
+# trajectory readers, so frames look identical whichever path read them.
+# ----------------------------------------------------------------------
+
+# Comment-line fields that make a frame extended XYZ. Those frames carry
+# per-atom properties, a box and typed metadata that only molpy's reader
+# decodes, so the indexed parser refuses them instead of dropping data.
+_EXTENDED_XYZ_RE = re.compile(r"\b(?:Lattice|Properties)=")
+
+
+def is_extended_xyz(comment: str) -> bool:
+    """Whether an XYZ comment line declares extended XYZ fields."""
+    return _EXTENDED_XYZ_RE.search(comment) is not None
+
+
+def _column(values: list[str]) -> np.ndarray:
+    """Typed column: integers, then floats, then strings."""
+    try:
+        return np.asarray(values, dtype=np.int64)
+    except ValueError:
+        pass
+    try:
+        return np.asarray(values, dtype=np.float64)
+    except ValueError:
+        return np.asarray(values)
+
+
+def _parse_xyz_frame(text: bytes) -> mp.Frame:
+    lines = text.decode().splitlines()
+    natoms = int(lines[0])
+    comment = lines[1].strip() if len(lines) > 1 else ""
+    if is_extended_xyz(comment):
+        raise ValueError(
+            "extended XYZ frames are not supported by the indexed reader; "
+            "use mp.io.read_xyz_trajectory"
+        )
+    rows = [line.split() for line in lines[2 : 2 + natoms]]
+    atoms = {
+        "element": np.asarray([r[0] for r in rows]),
+        "x": np.asarray([r[1] for r in rows], dtype=np.float64),
+        "y": np.asarray([r[2] for r in rows], dtype=np.float64),
+        "z": np.asarray([r[3] for r in rows], dtype=np.float64),
+    }
+    return mp.Frame(blocks={"atoms": atoms}, meta={"comment": comment})
+
+
+def _parse_lammps_dump_frame(text: bytes) -> mp.Frame:
+    lines = text.decode().splitlines()
+    meta: dict[str, Any] = {}
+    atoms: dict[str, np.ndarray] = {}
+    box: mp.Box | None = None
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        if line.startswith("ITEM: TIMESTEP"):
+            meta["timestep"] = int(lines[i + 1])
+            i += 2
+        elif line.startswith("ITEM: BOX BOUNDS"):
+            box = _lammps_box(line, lines[i + 1 : i + 4])
+            i += 4
+        elif line.startswith("ITEM: ATOMS"):
+            names = line.split()[2:]
+            rows = [ln.split() for ln in lines[i + 1 :] if ln.strip()]
+            for k, name in enumerate(names):
+                atoms[name] = _column([row[k] for row in rows])
+            break
+        else:
+            i += 1
+    for name, canonical in (("id", "id"), ("type", "type_id")):
+        if name in atoms and atoms[name].dtype.kind == "i":
+            atoms[canonical] = atoms.pop(name).astype(np.uint64)
+    frame = mp.Frame(blocks={"atoms": atoms}, meta=meta)
+    if box is not None:
+        frame.box = box
+    return frame
+
+
+def _lammps_box(header: str, bound_lines: list[str]) -> mp.Box:
+    """Build a box from a dump ``BOX BOUNDS`` section (orthogonal or triclinic)."""
+    tokens = header.split()[3:]
+    flags = [t for t in tokens if t not in ("xy", "xz", "yz")]
+    pbc = [flag == "pp" for flag in flags[:3]] if len(flags) >= 3 else [True] * 3
+    bounds = np.array([[float(v) for v in ln.split()] for ln in bound_lines])
+    xy, xz, yz = bounds[:, 2] if bounds.shape[1] > 2 else (0.0, 0.0, 0.0)
+    # Triclinic dumps store the bounding box of the tilted cell.
+    xlo = bounds[0, 0] - min(0.0, xy, xz, xy + xz)
+    xhi = bounds[0, 1] - max(0.0, xy, xz, xy + xz)
+    ylo = bounds[1, 0] - min(0.0, yz)
+    yhi = bounds[1, 1] - max(0.0, yz)
+    zlo, zhi = bounds[2, 0], bounds[2, 1]
+    matrix = np.array(
+        [[xhi - xlo, xy, xz], [0.0, yhi - ylo, yz], [0.0, 0.0, zhi - zlo]]
+    )
+    return mp.Box(matrix=matrix, pbc=pbc, origin=[xlo, ylo, zlo])
@@ -0,0 +1,329 @@
+"""Frame stores behind the reconnect mirror — see :meth:`molvis.Molvis.set_mirror_policy`.
+
+A scene remembers the trajectory it last pushed so a reloaded page can
+be rebuilt (``event.request_state_sync``). The frames are kept in the
+wire form they were sent in; how much of that stays in Python memory is
+the scene's *mirror policy*:
+
+``"memory"``
+    Keep every encoded frame in memory (default).
+``"disk"``
+    Spill every array column to an append-only file in a temporary
+    directory and keep only the ``hot_frames`` most recently used frames
+    in memory. Cold frames are read back as ``numpy.memmap`` views, so a
+    replay pages them in from disk instead of holding them resident.
+``"none"``
+    Keep nothing. A reloaded page gets the pipeline back but no frames.
+
+Both stores fingerprint their frames on demand (:meth:`MemoryFrameStore.digests`)
+so a resuming page can be sent only the chunks it does not already hold;
+see :func:`chunk_digest`.
+"""
+
+from __future__ import annotations
+
+import abc
+import dataclasses
+import hashlib
+import itertools
+import json
+import shutil
+import tempfile
+import weakref
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import IO, Any, Final, Literal
+
+import numpy as np
+
+from .transport._codec import QuantizedArray
+
+__all__ = [
+    "MIRROR_POLICIES",
+    "SYNC_CHUNK_FRAMES",
+    "DiskFrameStore",
+    "MemoryFrameStore",
+    "MirrorPolicy",
+    "chunk_digest",
+    "frame_digest",
+    "payload_digest",
+]
+
+MirrorPolicy = Literal["memory", "disk", "none"]
+MIRROR_POLICIES: Final[tuple[MirrorPolicy, ...]] = ("memory", "disk", "none")
+
+# Frames per content-addressed chunk in a resumable state sync.
+SYNC_CHUNK_FRAMES: Final = 256
+
+# Dtype kinds written to the spill file; object arrays stay in memory.
+_SPILLED_KINDS: Final = frozenset("biufcSU")
+# Every spilled column starts on this boundary so memmap views are aligned.
+_ALIGNMENT: Final = 64
+
+
+class _FrameStore(abc.ABC):
+    """Interface and digest cache shared by the frame stores."""
+
+    def __init__(self) -> None:
+        self._digests: list[bytes] = []
+
+    @abc.abstractmethod
+    def __len__(self) -> int: ...
+
+    @abc.abstractmethod
+    def __iter__(self) -> Iterator[dict[str, Any]]: ...
+
+    @abc.abstractmethod
+    def __getitem__(self, index: int) -> dict[str, Any]: ...
+
+    @abc.abstractmethod
+    def extend(self, frames: Iterable[dict[str, Any]]) -> None: ...
+
+    @abc.abstractmethod
+    def close(self) -> None: ...
+
+    def digests(self) -> list[bytes]:
+        """:func:`frame_digest` of every frame, hashing only new ones."""
+        done = len(self._digests)
+        if done < len(self):
+            self._digests.extend(
+                frame_digest(frame) for frame in itertools.islice(self, done, None)
+            )
+        return list(self._digests)
+
+    def known_digests(self) -> list[bytes]:
+        """The digests hashed so far: a prefix of :meth:`digests`."""
+        return list(self._digests)
+
+    def remember_digests(self, digests: list[bytes]) -> None:
+        """Cache digests of the leading frames that were hashed elsewhere."""
+        if len(self._digests) < len(digests) <= len(self):
+            self._digests = list(digests)
+
+
+class MemoryFrameStore(_FrameStore):
+    """Keep every encoded frame as-is."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._frames: list[dict[str, Any]] = []
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return iter(list(self._frames))
+
+    def __getitem__(self, index: int) -> dict[str, Any]:
+        return self._frames[index]
+
+    def extend(self, frames: Iterable[dict[str, Any]]) -> None:
+        self._frames.extend(frames)
+
+    def close(self) -> None:
+        self._frames.clear()
+        self._digests.clear()
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _Spilled:
+    """Where one array column lives in the spill file."""
+
+    offset: int
+    dtype: np.dtype
+    shape: tuple[int, ...]
+
+
+class DiskFrameStore(_FrameStore):
+    """Spill encoded frames to disk, keeping an LRU of hot frames in memory.
+
+    Each frame is split into a skeleton (block/column names, ``delta``
+    flags, quantization scales, object columns) that stays in memory and
+    its numeric and string arrays, which are appended to a single file.
+    Cold frames are ``numpy.memmap`` views of that file and keep it alive:
+    the spill directory is removed once the store is closed (or garbage
+    collected) *and* no view it handed out is still referenced, so a
+    replay still queued for the transport stays readable after
+    :meth:`close`.
+
+    Args:
+        directory: Parent directory for the spill directory; the system
+            temp directory by default.
+        hot_frames: How many recently appended or read frames keep their
+            original arrays in memory.
+    """
+
+    def __init__(
+        self, directory: str | Path | None = None, *, hot_frames: int = 8
+    ) -> None:
+        if hot_frames < 0:
+            raise ValueError(f"hot_frames must be >= 0; got {hot_frames}")
+        super().__init__()
+        self.hot_frames = hot_frames
+        self._spill_file: _SpillFile | None = _SpillFile(directory)
+        self.path = self._spill_file.path
+        self._file = self._spill_file.file
+        self._size = 0
+        self._skeletons: list[dict[str, Any]] = []
+        self._hot: OrderedDict[int, dict[str, Any]] = OrderedDict()
+        self._map: np.memmap | None = None
+
+    def __len__(self) -> int:
+        return len(self._skeletons)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        """Yield every frame in order without reshuffling the hot set."""
+        for index in range(len(self._skeletons)):
+            frame = self._hot.get(index)
+            yield frame if frame is not None else self._load(index)
+
+    def __getitem__(self, index: int) -> dict[str, Any]:
+        if index < 0:
+            index += len(self._skeletons)
+        frame = self._hot.get(index)
+        if frame is None:
+            frame = self._load(index)
+        self._touch(index, frame)
+        return frame
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes written to the spill file so far."""
+        return self._size
+
+    def extend(self, frames: Iterable[dict[str, Any]]) -> None:
+        for frame in frames:
+            index = len(self._skeletons)
+            self._skeletons.append(self._spill(frame))
+            self._touch(index, frame)
+        self._file.flush()
+
+    def close(self) -> None:
+        """Forget every frame; the spill file goes with the last live view."""
+        self._hot.clear()
+        self._skeletons.clear()
+        self._digests.clear()
+        self._map = None
+        self._spill_file = None
+
+    def _touch(self, index: int, frame: dict[str, Any]) -> None:
+        self._hot[index] = frame
+        self._hot.move_to_end(index)
+        while len(self._hot) > self.hot_frames:
+            self._hot.popitem(last=False)
+
+    def _spill(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            return {key: self._spill(item) for key, item in value.items()}
+        if isinstance(value, QuantizedArray):
+            return dataclasses.replace(value, values=self._spill(value.values))
+        if isinstance(value, np.ndarray) and value.dtype.kind in _SPILLED_KINDS:
+            return self._write(value)
+        return value
+
+    def _write(self, array: np.ndarray) -> _Spilled:
+        array = np.ascontiguousarray(array)
+        pad = -self._size % _ALIGNMENT
+        if pad:
+            self._file.write(b"\0" * pad)
+        offset = self._size + pad
+        self._file.write(array.reshape(-1).view(np.uint8))
+        self._size = offset + array.nbytes
+        return _Spilled(offset=offset, dtype=array.dtype, shape=array.shape)
+
+    def _load(self, index: int) -> dict[str, Any]:
+        return self._restore(self._skeletons[index])
+
+    def _restore(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            return {key: self._restore(item) for key, item in value.items()}
+        if isinstance(value, QuantizedArray):
+            return dataclasses.replace(value, values=self._restore(value.values))
+        if isinstance(value, _Spilled):
+            return self._view(value)
+        return value
+
+    def _view(self, spilled: _Spilled) -> np.ndarray:
+        nbytes = spilled.dtype.itemsize * int(np.prod(spilled.shape))
+        if nbytes == 0:
+            return np.empty(spilled.shape, dtype=spilled.dtype)
+        if self._map is None or len(self._map) < self._size:
+            # One read-only mapping of the whole file, remapped as it grows.
+            self._map = np.memmap(self._file.name, dtype=np.uint8, mode="r")
+            # Views reach this mapping through ``.base``; pin the file to it.
+            self._map._spill_file = self._spill_file  # type: ignore[attr-defined]
+        raw = self._map[spilled.offset : spilled.offset + nbytes]
+        return raw.view(spilled.dtype).reshape(spilled.shape)
+
+
+def frame_digest(frame: dict[str, Any]) -> bytes:
+    """Content hash of one encoded frame: names, dtypes, shapes and bytes."""
+    digest = hashlib.blake2b(digest_size=16)
+    _feed(digest, frame)
+    return digest.digest()
+
+
+def chunk_digest(
+    frame_digests: Iterable[bytes],
+    boxes: Iterable[dict[str, Any] | None] | None = None,
+) -> str:
+    """Hex key for a run of frames (and their boxes) in a state sync."""
+    digest = hashlib.blake2b(digest_size=16, person=b"molvis-chunk")
+    for item in frame_digests:
+        digest.update(item)
+    if boxes is not None:
+        digest.update(b"boxes")
+        _feed(digest, list(boxes))
+    return digest.hexdigest()
+
+
+def payload_digest(value: Any) -> str:
+    """Hex key for a JSON-serializable payload such as a pipeline entry."""
+    digest = hashlib.blake2b(digest_size=16, person=b"molvis-payload")
+    _feed(digest, value)
+    return digest.hexdigest()
+
+
+def _feed(digest: Any, value: Any) -> None:
+    if isinstance(value, dict):
+        digest.update(b"{%d" % len(value))
+        for key in sorted(value):
+            _feed(digest, key)
+            _feed(digest, value[key])
+    elif isinstance(value, (list, tuple)):
+        digest.update(b"[%d" % len(value))
+        for item in value:
+            _feed(digest, item)
+    elif isinstance(value, QuantizedArray):
+        digest.update(b"q%r,%r" % (value.scale, value.offset))
+        _feed(digest, value.values)
+    elif isinstance(value, np.ndarray) and value.dtype.kind != "O":
+        array = np.ascontiguousarray(value)
+        digest.update(b"a%s%r" % (array.dtype.str.encode(), array.shape))
+        digest.update(array.reshape(-1).view(np.uint8))
+    elif isinstance(value, np.ndarray):
+        digest.update(b"o")
+        _feed(digest, value.tolist())
+    else:
+        digest.update(b"v")
+        digest.update(json.dumps(value, default=repr).encode())
+
+
+class _SpillFile:
+    """A spill file and its directory, removed when the last owner lets go.
+
+    Owners are the :class:`DiskFrameStore` and every memmap it creates.
+    """
+
+    __slots__ = ("__weakref__", "file", "path")
+
+    def __init__(self, directory: str | Path | None) -> None:
+        self.path = Path(tempfile.mkdtemp(prefix="molvis-mirror-", dir=directory))
+        self.file: IO[bytes] = open(self.path / "frames.bin", "w+b")
+        weakref.finalize(self, _remove_spill, self.file, self.path)
+
+
+def _remove_spill(file: IO[bytes], path: Path) -> None:
+    file.close()
+    shutil.rmtree(path, ignore_errors=True)
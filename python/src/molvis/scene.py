@@ -25,6 +25,9 @@ automatically via :mod:`molvis.runtime`:
   ``transport=mv.WebSocketTransport(page_base_url="…")`` to point the
   page at an externally-hosted bundle. Runtime detection still picks
   the display surface.
+* **Shared hub** — pass ``transport=hub`` (a
+  :class:`~molvis.transport.TransportHub`) to many scenes so they share
+  one server thread and port, each reached under its own session name.
 * **Headless**
   (:attr:`~molvis.runtime.DisplaySurface.HEADLESS`) — set
   ``MOLVIS_HEADLESS=1`` or call from a worker thread without a display.
@@ -37,6 +40,9 @@ All host logic lives in the transport and :mod:`molvis.runtime`;
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import functools
 import html
 import json
 import logging
@@ -44,10 +50,13 @@ import secrets
 import threading
 import time
 import weakref
-from typing import TYPE_CHECKING, Any, Final, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final, Iterable, Iterator
 
 import molpy as mp
 
+from .batch import RequestBatch, resolve, then
 from .commands import (
     DrawingCommandsMixin,
     FrameCommandsMixin,
@@ -60,13 +69,31 @@ from .commands import (
 )
 from .errors import MolvisRPCError
 from .events import EventBus, EventHandle, Selection, ViewerState
+from .mirror import (
+    MIRROR_POLICIES,
+    SYNC_CHUNK_FRAMES,
+    DiskFrameStore,
+    MemoryFrameStore,
+    MirrorPolicy,
+    chunk_digest,
+    frame_digest,
+    payload_digest,
+)
 from .runtime import (
     DisplaySurface,
     RuntimeEnv,
     detect_runtime,
     display_surface as _detect_display_surface,
 )
-from .transport import Transport, WebSocketTransport
+from .transport import (
+    COORDINATE_PRECISIONS,
+    CoordinatePrecision,
+    Transport,
+    TransportHub,
+    WebSocketTransport,
+    apply_coordinate_precision,
+    encode_frame_deltas,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -98,6 +125,15 @@ class _Unset:
 _UNSET: Final[_Unset] = _Unset()
 
 
+def _to_client(client: str | None) -> dict[str, Any]:
+    """``send_request`` kwargs that address one page, or every page.
+
+    Left out entirely when ``None`` so transports without multi-client
+    support keep working.
+    """
+    return {} if client is None else {"client": client}
+
+
 class Molvis(
     DrawingCommandsMixin,
     SelectionCommandsMixin,
@@ -122,7 +158,9 @@ class Molvis(
         A :class:`~molvis.transport.Transport` implementation. When
         ``None``, a :class:`~molvis.transport.WebSocketTransport` is
         created with ``open_browser`` set to ``True`` outside Jupyter
-        and ``False`` inside a notebook kernel.
+        and ``False`` inside a notebook kernel. A
+        :class:`~molvis.transport.TransportHub` gets the scene a
+        transport on that hub, serving the session named ``name``.
     width, height
         Cell-host viewport size in CSS pixels (notebook) and a default
         sizing hint for the standalone host.
@@ -161,7 +199,7 @@ class Molvis(
         cls,
         name: str | None = None,
         *,
-        transport: Transport | None = None,
+        transport: Transport | TransportHub | None = None,
         width: int | _Unset = _UNSET,
         height: int | _Unset = _UNSET,
         gui: bool | _Unset = _UNSET,
@@ -187,7 +225,7 @@ class Molvis(
         self,
         name: str | None = None,
         *,
-        transport: Transport | None = None,
+        transport: Transport | TransportHub | None = None,
         width: int | _Unset = _UNSET,
         height: int | _Unset = _UNSET,
         gui: bool | _Unset = _UNSET,
@@ -206,6 +244,8 @@ class Molvis(
             True if isinstance(serve_page, _Unset) else serve_page
         )
         self._created_at: float = time.time()
+        # Wire dtype for x/y/z columns; see ``coordinate_precision``.
+        self._coordinate_precision: CoordinatePrecision = "float32"
 
         # Runtime context frozen at construction time. Tracking the
         # surface lets the scene make the same UX decisions every time
@@ -225,21 +265,28 @@ class Molvis(
         self._state = ViewerState()
         self._events = EventBus(self._state)
 
+        # Browser pop-up is only appropriate when we (a) are serving
+        # the page and (b) are not already embedding inline. Inline
+        # hosts mount the bundle straight into the cell output; a
+        # second standalone tab would duplicate the display.
+        want_browser = (
+            self.serve_page
+            and self._display_surface is DisplaySurface.BROWSER
+        )
         if transport is None:
-            # Browser pop-up is only appropriate when we (a) are serving
-            # the page and (b) are not already embedding inline. Inline
-            # hosts mount the bundle straight into the cell output; a
-            # second standalone tab would duplicate the display.
-            want_browser = (
-                self.serve_page
-                and self._display_surface is DisplaySurface.BROWSER
-            )
             transport = WebSocketTransport(
                 open_browser=want_browser,
                 serve_page=self.serve_page,
                 event_bus=self._events,
                 surface="full" if self.gui else "canvas",
             )
+        elif isinstance(transport, TransportHub):
+            transport = transport.transport(
+                self.name,
+                event_bus=self._events,
+                surface="full" if self.gui else "canvas",
+                open_browser=want_browser,
+            )
         else:
             attach = getattr(transport, "attach_event_bus", None)
             if callable(attach):
@@ -252,14 +299,25 @@ class Molvis(
         # we reply with a `scene.apply_state` RPC carrying this snapshot
         # so the reloaded page can rebuild the same pipeline/scene the
         # old page had. Updated only from the pipeline + drawing mixins.
+        # Frames and boxes are kept in the wire form they were sent in,
+        # so a replay costs no molpy serialization; where the frames live
+        # is up to ``set_mirror_policy``.
+        self._mirror_policy: MirrorPolicy = "memory"
+        self._mirror_options: dict[str, Any] = {}
         self._mirror_pipeline: list[ModifierInfo] = []
-        self._mirror_trajectory: list[mp.Frame] | None = None
-        self._mirror_boxes: list[mp.Box | None] | None = None
+        self._mirror_trajectory: MemoryFrameStore | DiskFrameStore | None = None
+        self._mirror_boxes: list[dict[str, Any] | None] | None = None
+        self._mirror_reader: Any | None = None
         self._mirror_lock = threading.Lock()
+        self._frame_worker: ThreadPoolExecutor | None = None
+        self._submit_worker: ThreadPoolExecutor | None = None
+        # Open ``batch()`` block, if any; see ``_active_batch``.
+        self._batch: RequestBatch | None = None
 
         self._events.on(
             "request_state_sync", self._handle_state_sync_request
         )
+        self._events.on("request_frame", self._handle_frame_request)
 
         Molvis._scene_registry[self.name] = self
         Molvis._instances.add(self)
@@ -295,7 +353,7 @@ class Molvis(
     def _reject_param_conflict(
         self,
         *,
-        transport: Transport | None,
+        transport: Transport | TransportHub | None,
         width: int | _Unset,
         height: int | _Unset,
         gui: bool | _Unset,
@@ -307,7 +365,10 @@ class Molvis(
         We only validate parameters the caller passed explicitly — omitted
         kwargs are treated as "give me whatever is cached".
         """
-        if transport is not None and transport is not self._transport:
+        if transport is not None and transport not in (
+            self._transport,
+            getattr(self._transport, "hub", None),
+        ):
             raise ValueError(
                 f"Molvis(name={self.name!r}) already exists with a "
                 "different transport; refusing to attach a new one. "
@@ -427,6 +488,13 @@ class Molvis(
                 stop()
             except Exception:
                 logger.exception("Transport.stop raised for '%s'", self.name)
+        if self._frame_worker is not None:
+            self._frame_worker.shutdown(wait=False, cancel_futures=True)
+            self._frame_worker = None
+        if self._submit_worker is not None:
+            self._submit_worker.shutdown(wait=False, cancel_futures=True)
+            self._submit_worker = None
+        self._clear_mirror()
         Molvis._scene_registry.pop(self.name, None)
         self._initialised = False
         logger.debug("Molvis '%s' closed", self.name)
@@ -491,6 +559,85 @@ class Molvis(
         """Where this scene will render — inline, browser, or headless."""
         return self._display_surface
 
+    @property
+    def coordinate_precision(self) -> CoordinatePrecision:
+        """Dtype used for ``x``/``y``/``z`` columns on the wire.
+
+        ``"float32"`` (default) halves float64 coordinates with no visible
+        loss. ``"float16"`` and ``"int16"`` (fixed point, with a scale and
+        offset per frame and column) halve that again — useful for preview
+        sessions over slow links such as SSH tunnels. ``"float64"`` sends
+        coordinates untouched.
+        """
+        return self._coordinate_precision
+
+    @coordinate_precision.setter
+    def coordinate_precision(self, precision: CoordinatePrecision) -> None:
+        if precision not in COORDINATE_PRECISIONS:
+            raise ValueError(
+                f"coordinate_precision must be one of "
+                f"{', '.join(COORDINATE_PRECISIONS)}; got {precision!r}"
+            )
+        self._coordinate_precision = precision
+
+    @property
+    def mirror_policy(self) -> MirrorPolicy:
+        """Where the trajectory mirror used for reconnect replay lives.
+
+        See :meth:`set_mirror_policy`.
+        """
+        return self._mirror_policy
+
+    def set_mirror_policy(
+        self,
+        policy: MirrorPolicy,
+        *,
+        directory: str | Path | None = None,
+        hot_frames: int = 8,
+    ) -> "Molvis":
+        """Choose how much of the pushed trajectory the scene keeps around.
+
+        The scene keeps the frames it last sent so a reloaded page can be
+        rebuilt. ``"memory"`` (default) keeps them all in memory;
+        ``"disk"`` spills their arrays to a temporary file and keeps only
+        the ``hot_frames`` most recently used frames resident; ``"none"``
+        keeps nothing, so a reloaded page gets the pipeline back but an
+        empty scene. A trajectory already mirrored moves to the new store.
+
+        Args:
+            policy: ``"memory"``, ``"disk"`` or ``"none"``.
+            directory: Parent of the spill directory for ``"disk"``; the
+                system temp directory by default.
+            hot_frames: Frames kept in memory under ``"disk"``.
+
+        Returns:
+            Self for method chaining.
+        """
+        if policy not in MIRROR_POLICIES:
+            raise ValueError(
+                f"mirror policy must be one of {', '.join(MIRROR_POLICIES)}; "
+                f"got {policy!r}"
+            )
+        if hot_frames < 0:
+            raise ValueError(f"hot_frames must be >= 0; got {hot_frames}")
+        with self._mirror_lock:
+            self._mirror_policy = policy
+            self._mirror_options = (
+                {"directory": directory, "hot_frames": hot_frames}
+                if policy == "disk"
+                else {}
+            )
+            previous = self._mirror_trajectory
+            self._mirror_trajectory = None
+            if previous is not None:
+                self._mirror_trajectory = self._new_frame_store()
+                if self._mirror_trajectory is not None:
+                    self._mirror_trajectory.extend(previous)
+                else:
+                    self._mirror_boxes = None
+                previous.close()
+        return self
+
     @property
     def connection_url(self) -> str:
         """Pasteable ``ws://…?token=…&session=…`` URL for this scene.
@@ -524,6 +671,10 @@ class Molvis(
     ) -> Any:
         """Send a JSON-RPC request to the frontend.
 
+        Inside :meth:`batch` the request is only queued for writing: a
+        command that waits for a response returns a
+        :class:`concurrent.futures.Future` of its result instead.
+
         Raises
         ------
         TimeoutError
@@ -532,6 +683,17 @@ class Molvis(
             The frontend returned an error envelope.
         """
         self._ensure_started()
+        batch = self._active_batch()
+        if batch is not None:
+            pending = self._send_request_nowait(
+                method, params, buffers, wait_for_response, timeout
+            )
+            if not wait_for_response:
+                batch.add(pending)
+                return self
+            return batch.add(
+                then(pending, lambda r: self._unwrap_response(method, r))
+            )
         response = self._transport.send_request(
             method,
             params,
@@ -541,6 +703,150 @@ class Molvis(
         )
         if not wait_for_response:
             return self
+        return self._unwrap_response(method, response)
+
+    async def send_cmd_async(
+        self,
+        method: str,
+        params: dict[str, Any],
+        buffers: list[Any] | None = None,
+        timeout: float = 10.0,
+    ) -> Any:
+        """Awaitable :meth:`send_cmd` that always waits for the response.
+
+        Requests are handed to the transport in call order as soon as
+        the coroutine starts, so
+        ``await asyncio.gather(*(scene.send_cmd_async(...) for ...))``
+        keeps them all in flight at once. Handing over happens on a
+        worker thread: waiting for the page's handshake, for room in a
+        full send queue, and encoding never block the caller's event
+        loop, and all of it counts against ``timeout``.
+
+        Raises
+        ------
+        TimeoutError
+            No response within ``timeout`` seconds.
+        MolvisRPCError
+            The frontend returned an error envelope.
+        """
+        self._ensure_started()
+        loop = asyncio.get_running_loop()
+
+        async def request() -> Any:
+            pending = await loop.run_in_executor(
+                self._submit_executor(),
+                functools.partial(
+                    self._send_request_nowait,
+                    method,
+                    params,
+                    buffers,
+                    True,
+                    timeout,
+                ),
+            )
+            return await asyncio.wrap_future(pending)
+
+        try:
+            response = await asyncio.wait_for(request(), timeout)
+        except TimeoutError:
+            raise TimeoutError(
+                f"No response from frontend for '{method}' after {timeout}s"
+            ) from None
+        return self._unwrap_response(method, response)
+
+    def _send_request_nowait(
+        self,
+        method: str,
+        params: dict[str, Any],
+        buffers: list[Any] | None,
+        wait_for_response: bool,
+        timeout: float,
+    ) -> Future[Any]:
+        """Queue a request through the transport's optional pipelined path.
+
+        ``send_request_nowait`` is not part of the :class:`Transport`
+        protocol. Transports without it send synchronously here and hand
+        back an already-settled future, so :meth:`batch` still works, just
+        without the pipelining.
+        """
+        send_nowait = getattr(self._transport, "send_request_nowait", None)
+        if send_nowait is not None:
+            return send_nowait(
+                method,
+                params,
+                buffers=buffers,
+                wait_for_response=wait_for_response,
+                timeout=timeout,
+            )
+        future: Future[Any] = Future()
+        try:
+            future.set_result(
+                self._transport.send_request(
+                    method,
+                    params,
+                    buffers=buffers,
+                    wait_for_response=wait_for_response,
+                    timeout=timeout,
+                )
+            )
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+
+    @contextlib.contextmanager
+    def batch(self, *, timeout: float = 30.0) -> Iterator[RequestBatch]:
+        """Pipeline every command issued inside the ``with`` block.
+
+        Commands are written back to back without waiting for replies;
+        on exit the block waits for all of them at once, so N commands
+        cost one round trip instead of N. Nested ``batch()`` blocks join
+        the outermost one. Commands from other threads are not batched.
+
+        Inside the block, methods that return frontend data either
+        return a :class:`concurrent.futures.Future`
+        (:meth:`add_modifier`, :meth:`remove_modifier`, raw
+        :meth:`send_cmd`) or wait for their own reply (queries such as
+        :meth:`snapshot`, which then also covers every command queued
+        before them). The pipeline mirror is refreshed once on exit.
+
+        Example::
+
+            with scene.batch() as batch:
+                for i in hits:
+                    scene.mark_atom(i, label=str(i))
+                scene.add_modifier("Hide Selection")
+            batch.results  # one entry per command, in order
+
+        Raises
+        ------
+        TimeoutError
+            Some replies did not arrive within ``timeout`` seconds.
+        MolvisRPCError
+            The first command the frontend rejected.
+        """
+        outer = self._active_batch()
+        if outer is not None:
+            yield outer
+            return
+        batch = RequestBatch()
+        self._batch = batch
+        try:
+            yield batch
+        except BaseException:
+            batch.cancel()
+            raise
+        finally:
+            self._batch = None
+        batch.wait(timeout)
+
+    def _active_batch(self) -> RequestBatch | None:
+        batch = self._batch
+        if batch is None or not batch.owned_by_current_thread:
+            return None
+        return batch
+
+    def _unwrap_response(self, method: str, response: Any) -> Any:
+        """Return a response's ``result`` or raise its ``error``."""
         if isinstance(response, dict) and "error" in response:
             error = response["error"] or {}
             logger.error(
@@ -586,8 +892,11 @@ class Molvis(
 
     def refresh_state(self, *, timeout: float = 10.0) -> ViewerState:
         """Force a roundtrip to rebuild the local cache from the canvas."""
-        snapshot = self.send_cmd(
-            "state.get", {}, wait_for_response=True, timeout=timeout
+        snapshot = resolve(
+            self.send_cmd(
+                "state.get", {}, wait_for_response=True, timeout=timeout
+            ),
+            timeout,
         )
         if isinstance(snapshot, dict):
             self._events.prime_state(snapshot)
@@ -613,6 +922,23 @@ class Molvis(
     def events(self) -> EventBus:
         return self._events
 
+    # ------------------------------------------------------------------
+    # Frame serialization
+    # ------------------------------------------------------------------
+
+    def _encode_blocks(self, blocks: dict[str, Any]) -> dict[str, Any]:
+        """Apply :attr:`coordinate_precision` to one frame's blocks."""
+        return apply_coordinate_precision(blocks, self._coordinate_precision)
+
+    def _encode_frames(
+        self, blocks: Iterable[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Delta-encode a run of frames, then apply the precision policy."""
+        encoded = encode_frame_deltas(blocks)
+        for frame in encoded:
+            frame["blocks"] = self._encode_blocks(frame["blocks"])
+        return encoded
+
     # ------------------------------------------------------------------
     # Mirror state (for reconnect replay)
     # ------------------------------------------------------------------
@@ -622,87 +948,250 @@ class Molvis(
         with self._mirror_lock:
             self._mirror_pipeline = list(entries)
 
-    def _record_trajectory(
-        self,
-        frames: Iterable[mp.Frame],
-        boxes: Iterable[mp.Box | None] | None,
-    ) -> None:
+    def _record_trajectory(self, params: dict[str, Any]) -> None:
         """Cache what we just handed to :meth:`draw_frame` / :meth:`set_trajectory`.
 
-        Keeps frames and boxes as live objects; ``_build_state_payload``
-        re-serializes on demand when the frontend asks for sync.
+        ``params`` is the trajectory payload as sent: ``frames`` already
+        delta-encoded and narrowed to the scene's precision, ``boxes``
+        (optional) already serialized. ``_build_state_payload`` resends
+        it as-is.
         """
+        boxes = params.get("boxes")
         with self._mirror_lock:
-            self._mirror_trajectory = list(frames)
-            if boxes is None:
+            self._close_frame_store()
+            self._mirror_trajectory = self._new_frame_store()
+            self._mirror_reader = None
+            if self._mirror_trajectory is None:
                 self._mirror_boxes = None
-            else:
-                self._mirror_boxes = list(boxes)
+                return
+            self._mirror_trajectory.extend(params["frames"])
+            self._mirror_boxes = None if boxes is None else list(boxes)
+
+    def _record_attached_trajectory(
+        self,
+        reader: Any,
+        boxes: Iterable[dict[str, Any] | None] | None,
+    ) -> None:
+        """Remember the reader behind :meth:`attach_trajectory`.
+
+        Frames are never copied into the mirror; the reader itself is
+        what gets re-attached after a reconnect.
+        """
+        with self._mirror_lock:
+            self._close_frame_store()
+            self._mirror_reader = reader
+            self._mirror_boxes = None if boxes is None else list(boxes)
+
+    def _new_frame_store(self) -> MemoryFrameStore | DiskFrameStore | None:
+        """Empty store for the current mirror policy (``None`` for ``"none"``)."""
+        if self._mirror_policy == "memory":
+            return MemoryFrameStore()
+        if self._mirror_policy == "disk":
+            return DiskFrameStore(**self._mirror_options)
+        return None
+
+    def _close_frame_store(self) -> None:
+        """Release the mirrored frames; callers hold ``_mirror_lock``."""
+        if self._mirror_trajectory is not None:
+            self._mirror_trajectory.close()
+            self._mirror_trajectory = None
+
+    def _attached_reader(self) -> Any | None:
+        with self._mirror_lock:
+            return self._mirror_reader
+
+    def _frame_executor(self) -> ThreadPoolExecutor:
+        """Single worker that serves ``event.request_frame`` in order."""
+        if self._frame_worker is None:
+            self._frame_worker = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix=f"molvis-frames-{self.name}",
+            )
+        return self._frame_worker
+
+    def _submit_executor(self) -> ThreadPoolExecutor:
+        """Single worker that hands :meth:`send_cmd_async` requests over in order."""
+        if self._submit_worker is None:
+            self._submit_worker = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix=f"molvis-submit-{self.name}",
+            )
+        return self._submit_worker
+
+    def _append_trajectory(self, params: dict[str, Any]) -> None:
+        """Extend the mirror with a chunk streamed via ``append_frames``.
+
+        Each chunk's first frame is sent in full, so the concatenated
+        delta-encoded chunks still replay as one valid sequence.
+        """
+        boxes = params.get("boxes")
+        with self._mirror_lock:
+            if self._mirror_trajectory is None:
+                if self._mirror_policy == "none":
+                    return
+                self._mirror_trajectory = self._new_frame_store()
+            self._mirror_trajectory.extend(params["frames"])
+            if boxes is not None:
+                if self._mirror_boxes is None:
+                    self._mirror_boxes = []
+                self._mirror_boxes.extend(boxes)
 
     def _clear_mirror(self) -> None:
         """Drop everything — called from ``clear()`` / ``clear_pipeline()``."""
         with self._mirror_lock:
             self._mirror_pipeline = []
-            self._mirror_trajectory = None
+            self._close_frame_store()
             self._mirror_boxes = None
+            self._mirror_reader = None
+
+    def _mirrored_pipeline_entries(self) -> list[dict[str, Any]]:
+        """Pipeline mirror in ``scene.apply_state`` form; hold ``_mirror_lock``."""
+        return [
+            {
+                "id": m.id,
+                "name": m.name,
+                "category": m.category,
+                "enabled": m.enabled,
+                "selection_scope_id": m.selection_scope_id,
+                "source_owner_id": m.source_owner_id,
+                **({"kind": m.kind} if m.kind else {}),
+                # apply_state requires capabilities; mirror may lack them.
+                "capabilities": [],
+            }
+            for m in self._mirror_pipeline
+        ]
 
     def _build_state_payload(self) -> dict[str, Any]:
         """Serialize mirror state for a ``scene.apply_state`` RPC."""
         with self._mirror_lock:
-            pipeline = [
-                {
-                    "id": m.id,
-                    "name": m.name,
-                    "category": m.category,
-                    "enabled": m.enabled,
-                    "selection_scope_id": m.selection_scope_id,
-                    "source_owner_id": m.source_owner_id,
-                    **({"kind": m.kind} if m.kind else {}),
-                    # apply_state requires capabilities; mirror may lack them.
-                    "capabilities": [],
-                }
-                for m in self._mirror_pipeline
-            ]
+            pipeline = self._mirrored_pipeline_entries()
             frames: list[dict[str, Any]] | None = None
             if self._mirror_trajectory is not None:
-                frames = [
-                    {"blocks": f.to_dict().get("blocks", {})}
-                    for f in self._mirror_trajectory
-                ]
+                frames = list(self._mirror_trajectory)
             boxes: list[dict[str, Any] | None] | None = None
-            if self._mirror_boxes is not None:
-                boxes = [
-                    b.to_dict() if b is not None else None
-                    for b in self._mirror_boxes
-                ]
+            if self._mirror_boxes is not None and self._mirror_reader is None:
+                boxes = list(self._mirror_boxes)
         return {
             "pipeline": pipeline,
             "frames": frames,
             "boxes": boxes,
         }
 
+    def _build_resumable_state_payload(
+        self, client: str | None = None
+    ) -> dict[str, Any]:
+        """Like :meth:`_build_state_payload`, minus what the page already holds.
+
+        Frames (with their boxes) are cut into chunks of
+        ``SYNC_CHUNK_FRAMES`` and every chunk and pipeline entry gets a
+        content hash. The page is asked which hashes it is missing
+        (``scene.state_manifest``); everything else goes out as a bare
+        ``{"hash": ...}`` reference that the page resolves from its own
+        cache. Concatenating the chunks in order gives the same
+        delta-encoded frame list a full sync would carry. ``client``
+        names the page to ask when several are attached.
+        """
+        with self._mirror_lock:
+            pipeline = self._mirrored_pipeline_entries()
+            store = self._mirror_trajectory
+            frames = list(store) if store is not None else []
+            digests = store.known_digests() if store is not None else []
+            boxes = self._mirror_boxes if self._mirror_reader is None else None
+            boxes = list(boxes) if boxes is not None and frames else None
+
+        # Hash new frames without blocking draws that record the mirror.
+        if len(digests) < len(frames):
+            digests += [frame_digest(frame) for frame in frames[len(digests) :]]
+            with self._mirror_lock:
+                if self._mirror_trajectory is store:
+                    store.remember_digests(digests)
+        for entry in pipeline:
+            entry["hash"] = payload_digest(entry)
+        chunks: list[dict[str, Any]] = []
+        for start in range(0, len(frames), SYNC_CHUNK_FRAMES):
+            stop = start + SYNC_CHUNK_FRAMES
+            chunk: dict[str, Any] = {"frames": frames[start:stop]}
+            if boxes is not None:
+                chunk["boxes"] = boxes[start:stop]
+            chunk["hash"] = chunk_digest(digests[start:stop], chunk.get("boxes"))
+            chunks.append(chunk)
+
+        missing = self._missing_state_keys(
+            [c["hash"] for c in chunks], [e["hash"] for e in pipeline], client
+        )
+        return {
+            "scope": self.name,
+            "pipeline": [
+                e if e["hash"] in missing else {"hash": e["hash"]} for e in pipeline
+            ],
+            "chunks": [
+                c if c["hash"] in missing else {"hash": c["hash"]} for c in chunks
+            ],
+        }
+
+    def _missing_state_keys(
+        self, chunks: list[str], modifiers: list[str], client: str | None = None
+    ) -> set[str]:
+        """Ask the page which sync hashes it lacks; all of them on failure."""
+        everything = {*chunks, *modifiers}
+        if not everything:
+            return everything
+        try:
+            response = self._transport.send_request(
+                "scene.state_manifest",
+                {"scope": self.name, "chunks": chunks, "modifiers": modifiers},
+                wait_for_response=True,
+                **_to_client(client),
+            )
+            result = self._unwrap_response("scene.state_manifest", response)
+            missing = result["missing"]
+        except Exception:
+            logger.warning(
+                "State manifest exchange failed for '%s'; resending everything",
+                self.name,
+                exc_info=True,
+            )
+            return everything
+        return everything.intersection(missing)
+
     def _handle_state_sync_request(self, params: dict[str, Any]) -> None:
         """Fire-and-forget reply to ``event.request_state_sync``.
 
-        The EventBus dispatches on the transport's asyncio thread, so we
-        offload the actual send to a daemon thread — ``send_request``
-        uses ``future.result()`` which would deadlock if called from the
-        loop thread.
+        The EventBus dispatches on one of the transport's listener
+        threads; a sync can take a while, so the send runs on its own
+        daemon thread instead of holding up later events. A page that
+        sends ``{"resume": true}`` keeps synced state in its own cache
+        and gets a resumable sync. When several pages share the
+        transport only the one asking is answered.
         """
         threading.Thread(
             target=self._send_state_sync_snapshot,
+            kwargs={
+                "resume": params.get("resume") is True,
+                "client": getattr(self._transport, "event_origin", None),
+            },
             name=f"molvis-state-sync-{self.name}",
             daemon=True,
         ).start()
 
-    def _send_state_sync_snapshot(self) -> None:
+    def _send_state_sync_snapshot(
+        self, *, resume: bool = False, client: str | None = None
+    ) -> None:
         try:
-            payload = self._build_state_payload()
+            payload = (
+                self._build_resumable_state_payload(client)
+                if resume
+                else self._build_state_payload()
+            )
             self._transport.send_request(
                 "scene.apply_state",
                 payload,
                 wait_for_response=False,
+                **_to_client(client),
             )
+            # Attached trajectories are not part of the snapshot; hand
+            # the new page the frame count again so it can start fetching.
+            self._reattach_trajectory(client)
         except Exception:
             logger.exception("Failed to send state sync to frontend")
 
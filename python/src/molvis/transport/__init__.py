@@ -3,34 +3,67 @@
 Exposes:
 
 - :class:`Transport` — Protocol every transport must satisfy.
+- :class:`PipelinedTransport` — optional extension with
+  ``send_request_nowait``, used to keep many requests in flight.
 - :class:`WebSocketTransport` — the only concrete implementation. Hosts
   the bundled page, accepts a WebSocket connection from any browser /
   iframe / notebook cell, and routes JSON-RPC 2.0 + binary buffers.
+- :class:`TransportHub` — one server and loop thread shared by many
+  sessions' transports.
 - :class:`BinaryPayloadEncoder` / :class:`BinaryPayloadDecoder` and the
   binary-frame codec functions are re-exported from :mod:`._codec` for
   tests and advanced users.
 """
 
-from ..transport_base import Transport
+from ..transport_base import PipelinedTransport, Transport
 from ._codec import (
+    COORDINATE_PRECISIONS,
     BinaryPayloadDecoder,
     BinaryPayloadEncoder,
+    CoordinatePrecision,
+    QuantizedArray,
+    apply_coordinate_precision,
+    available_buffer_codecs,
     decode_binary_frame,
     encode_binary_frame,
+    encode_binary_frame_parts,
+    encode_frame_deltas,
+    join_rpc_batch,
 )
 from ._jupyter_env import detect_env, in_jupyter_kernel, resolve_endpoints
-from .websocket import PageEndpoints, WebSocketTransport, resolve_dist
+from .websocket import (
+    OVERFLOW_POLICIES,
+    OverflowPolicy,
+    PageEndpoints,
+    SendQueueStats,
+    TransportHub,
+    WebSocketTransport,
+    resolve_dist,
+)
 
 __all__ = [
+    "COORDINATE_PRECISIONS",
+    "OVERFLOW_POLICIES",
     "BinaryPayloadDecoder",
     "BinaryPayloadEncoder",
+    "CoordinatePrecision",
+    "OverflowPolicy",
     "PageEndpoints",
+    "PipelinedTransport",
+    "QuantizedArray",
+    "SendQueueStats",
     "Transport",
+    "TransportHub",
     "WebSocketTransport",
+    "apply_coordinate_precision",
+    "available_buffer_codecs",
     "decode_binary_frame",
     "detect_env",
     "encode_binary_frame",
+    "encode_binary_frame_parts",
+    "encode_frame_deltas",
     "in_jupyter_kernel",
+    "join_rpc_batch",
     "resolve_endpoints",
     "resolve_dist",
 ]
@@ -7,6 +7,19 @@ Binary-payload codecs shared by all transports.
   dense numeric data does not have to round-trip through JSON.
 * :func:`encode_binary_frame` / :func:`decode_binary_frame` pack those
   buffers together with the JSON envelope into a single WebSocket frame.
+* :func:`encode_binary_frame_parts` produces the same frame as a list of
+  zero-copy fragments (header + JSON, then one flat view per buffer) for
+  transports that can write them out as a fragmented message.
+* :func:`join_rpc_batch` merges several serialized JSON-RPC messages and
+  their buffers into one JSON-RPC batch array for a single frame.
+* :func:`encode_frame_deltas` serializes a run of trajectory frames so
+  blocks and columns that repeat the previous frame are sent only once.
+* :func:`apply_coordinate_precision` narrows coordinate columns before
+  encoding — float32 by default, or float16 / int16 fixed-point
+  (:class:`QuantizedArray`) when a scene opts into lossier transport.
+* :func:`available_buffer_codecs` lists the per-buffer compression codecs
+  usable on this interpreter; v3 frames flag each buffer with the codec
+  it was compressed with.
 """
 
 from __future__ import annotations
@@ -15,18 +28,34 @@ import dataclasses
 import json
 import struct
 import sys
+import zlib
+from collections.abc import Iterable, Mapping
 from dataclasses import asdict
-from typing import Any
+from typing import Any, Literal
 
 import numpy as np
 
 from ..types import BinaryBufferRef
 
 __all__ = [
+    "COORDINATE_PRECISIONS",
+    "FRAME_VERSION_V1",
+    "FRAME_VERSION_V2",
+    "FRAME_VERSION_V3",
+    "SUPPORTED_FRAME_VERSIONS",
     "BinaryPayloadDecoder",
     "BinaryPayloadEncoder",
+    "CoordinatePrecision",
+    "QuantizedArray",
+    "apply_coordinate_precision",
+    "assemble_frame_parts",
+    "available_buffer_codecs",
     "decode_binary_frame",
     "encode_binary_frame",
+    "encode_binary_frame_parts",
+    "encode_frame_deltas",
+    "join_rpc_batch",
+    "pack_frame_buffers",
 ]
 
 
@@ -42,6 +71,81 @@ def _normalize_numeric_array(array: np.ndarray) -> np.ndarray:
     return np.ascontiguousarray(normalized)
 
 
+CoordinatePrecision = Literal["float64", "float32", "float16", "int16"]
+COORDINATE_PRECISIONS: tuple[str, ...] = ("float64", "float32", "float16", "int16")
+
+# Columns the precision policy applies to; everything else keeps its dtype.
+_COORDINATE_COLUMNS = frozenset({"x", "y", "z"})
+_INT16_LEVELS = 65535
+
+
+@dataclasses.dataclass(frozen=True)
+class QuantizedArray:
+    """int16 fixed-point array; decodes to ``offset + values * scale``."""
+
+    values: np.ndarray
+    scale: float
+    offset: float
+
+    @classmethod
+    def from_float(cls, array: np.ndarray) -> "QuantizedArray":
+        """Quantize ``array`` over its own min/max into 65536 levels."""
+        lo = float(array.min())
+        hi = float(array.max())
+        scale = (hi - lo) / _INT16_LEVELS if hi > lo else 1.0
+        steps = np.rint((array - lo) / scale) - 32768
+        values = steps.astype(np.int16)
+        return cls(values=values, scale=scale, offset=lo + 32768 * scale)
+
+    def dequantize(self) -> np.ndarray:
+        return self.offset + self.values.astype(np.float64) * self.scale
+
+
+def _narrow_coordinates(array: Any, precision: str) -> Any:
+    if not isinstance(array, np.ndarray) or array.dtype.kind != "f" or array.size == 0:
+        return array
+    if precision == "float32":
+        return array.astype(np.float32, copy=False)
+    if precision == "float16":
+        return array.astype(np.float16)
+    if precision == "int16":
+        if not np.isfinite(array).all():
+            return array.astype(np.float32, copy=False)
+        return QuantizedArray.from_float(array)
+    return array
+
+
+def apply_coordinate_precision(
+    blocks: dict[str, Any], precision: str
+) -> dict[str, Any]:
+    """Return ``blocks`` with ``x``/``y``/``z`` columns narrowed to ``precision``.
+
+    ``"float64"`` leaves the columns untouched; ``"float32"`` halves them
+    with no visible loss; ``"float16"`` and ``"int16"`` (fixed point with
+    a per-column scale and offset) trade precision for another 2x. Blocks
+    are shallow-copied, the caller's arrays are never modified.
+    """
+    if precision not in COORDINATE_PRECISIONS:
+        raise ValueError(
+            f"unknown coordinate precision {precision!r}; "
+            f"expected one of {', '.join(COORDINATE_PRECISIONS)}"
+        )
+    if precision == "float64":
+        return blocks
+    out: dict[str, Any] = {}
+    for name, columns in blocks.items():
+        if not isinstance(columns, dict):
+            out[name] = columns
+            continue
+        out[name] = {
+            key: _narrow_coordinates(value, precision)
+            if key in _COORDINATE_COLUMNS
+            else value
+            for key, value in columns.items()
+        }
+    return out
+
+
 class BinaryPayloadEncoder:
     """Encode nested payloads and move numeric ndarrays into binary buffers."""
 
@@ -50,6 +154,11 @@ class BinaryPayloadEncoder:
         self._owners: list[np.ndarray] = []
 
     def encode(self, value: Any) -> Any:
+        if isinstance(value, QuantizedArray):
+            return self._encode_ndarray(
+                value.values, scale=value.scale, offset=value.offset
+            )
+
         if dataclasses.is_dataclass(value):
             return self.encode(asdict(value))
 
@@ -67,7 +176,13 @@ class BinaryPayloadEncoder:
 
         return value
 
-    def _encode_ndarray(self, array: np.ndarray) -> Any:
+    def _encode_ndarray(
+        self,
+        array: np.ndarray,
+        *,
+        scale: float | None = None,
+        offset: float | None = None,
+    ) -> Any:
         if array.ndim == 0:
             return array.item()
 
@@ -79,6 +194,8 @@ class BinaryPayloadEncoder:
             index=len(self.buffers),
             dtype=normalized.dtype.str,
             shape=tuple(int(dim) for dim in normalized.shape),
+            scale=scale,
+            offset=offset,
         )
         self._owners.append(normalized)
         self.buffers.append(memoryview(normalized))
@@ -128,86 +245,379 @@ class BinaryPayloadDecoder:
         raw = memoryview(buffers[ref.index]).cast("B")
         array = np.frombuffer(raw, dtype=np.dtype(ref.dtype))
         if ref.shape:
-            return array.reshape(ref.shape)
+            array = array.reshape(ref.shape)
+        if ref.scale is not None:
+            return (ref.offset or 0.0) + array.astype(np.float64) * ref.scale
         return array
 
 
+def _flat_bytes(buf: memoryview | bytes) -> memoryview:
+    """View ``buf`` as a flat byte sequence without copying.
+
+    ``len()`` of an N-d or non-byte memoryview counts items along the
+    first axis, not bytes; casting to ``"B"`` makes length == nbytes.
+    """
+    view = memoryview(buf)
+    if view.format == "B" and view.ndim == 1:
+        return view
+    return view.cast("B")
+
+
+# Frame format versions. v1 is the original uint32 table; v2 prefixes a
+# magic tag and widens offsets/lengths to uint64 so a single frame can
+# carry more than 4 GiB; v3 adds a per-buffer codec id so individual
+# buffers can travel compressed. The version is negotiated per connection
+# during the hello/ready handshake; decoding auto-detects it from the magic.
+FRAME_VERSION_V1 = 1
+FRAME_VERSION_V2 = 2
+FRAME_VERSION_V3 = 3
+SUPPORTED_FRAME_VERSIONS: tuple[int, ...] = (
+    FRAME_VERSION_V1,
+    FRAME_VERSION_V2,
+    FRAME_VERSION_V3,
+)
+
+_FRAME_V2_MAGIC = b"MVB2"
+_FRAME_V3_MAGIC = b"MVB3"
+_UINT32_MAX = 0xFFFFFFFF
+
+# Per-buffer codec ids carried in the v3 table. The ids are wire format —
+# never renumber them. ``deflate`` is zlib-wrapped DEFLATE, which is what
+# the browser's ``DecompressionStream("deflate")`` reads; ``zstd`` and
+# ``lz4`` need their Python packages and a peer that advertises them.
+_CODEC_RAW = 0
+BUFFER_CODEC_IDS: dict[str, int] = {"deflate": 1, "zstd": 2, "lz4": 3}
+_CODEC_NAMES = {codec_id: name for name, codec_id in BUFFER_CODEC_IDS.items()}
+
+# Buffers smaller than this are sent raw: the codec framing overhead and
+# the extra decode step outweigh what a few KiB can save.
+MIN_COMPRESSED_BUFFER_BYTES = 4096
+
+
+def available_buffer_codecs() -> tuple[str, ...]:
+    """Names of the per-buffer codecs this interpreter can encode/decode."""
+    names = ["deflate"]
+    try:
+        import zstandard  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        names.append("zstd")
+    try:
+        import lz4.frame  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        names.append("lz4")
+    return tuple(names)
+
+
+def _compress_buffer(view: memoryview, codec: str) -> bytes:
+    if codec == "deflate":
+        # Level 1: most of the ratio on coordinate/topology arrays at a
+        # fraction of the default level's CPU cost.
+        return zlib.compress(view, 1)
+    if codec == "zstd":
+        import zstandard
+
+        return zstandard.ZstdCompressor(level=3).compress(view)
+    if codec == "lz4":
+        import lz4.frame
+
+        return lz4.frame.compress(view)
+    raise ValueError(f"Unknown buffer codec {codec!r}")
+
+
+def _decompress_buffer(data: bytes, codec_id: int) -> bytes:
+    codec = _CODEC_NAMES.get(codec_id)
+    if codec == "deflate":
+        return zlib.decompress(data)
+    if codec == "zstd":
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompress(data)
+    if codec == "lz4":
+        import lz4.frame
+
+        return lz4.frame.decompress(data)
+    raise ValueError(f"Unknown buffer codec id {codec_id!r} in binary frame")
+
+
+def _pack_header(entries: list[tuple[int, int, int]], version: int) -> bytes:
+    count = len(entries)
+    if version == FRAME_VERSION_V3:
+        flat = [value for entry in entries for value in entry]
+        return _FRAME_V3_MAGIC + struct.pack(f"<I{'QQI' * count}", count, *flat)
+    flat = [value for offset, length, _ in entries for value in (offset, length)]
+    if version == FRAME_VERSION_V2:
+        return _FRAME_V2_MAGIC + struct.pack(f"<I{len(flat)}Q", count, *flat)
+    if version != FRAME_VERSION_V1:
+        raise ValueError(f"Unsupported binary frame version {version!r}")
+    if flat and flat[-2] + flat[-1] > _UINT32_MAX:
+        raise ValueError(
+            "Binary payload exceeds 4 GiB, which the v1 frame format cannot "
+            "address; the connected page did not negotiate frame version 2."
+        )
+    return struct.pack(f"<I{len(flat)}I", count, *flat)
+
+
+def encode_binary_frame_parts(
+    json_payload: dict[str, Any] | list[Any] | bytes,
+    buffers: list[memoryview | bytes],
+    *,
+    version: int = FRAME_VERSION_V1,
+    codec: str | None = None,
+) -> list[memoryview | bytes]:
+    """Split a binary frame into its header + JSON prefix and buffer views.
+
+    Concatenating the returned parts yields exactly the bytes produced by
+    :func:`encode_binary_frame`, but no buffer is copied: each entry after
+    the first is a flat view over the caller's memory (typically the
+    ndarrays pinned by :attr:`BinaryPayloadEncoder._owners`). The caller
+    must keep those owners alive until the parts have been written.
+
+    With ``codec`` set (v3 only), buffers of at least
+    :data:`MIN_COMPRESSED_BUFFER_BYTES` are compressed and flagged in the
+    header; a buffer that does not shrink is still sent raw.
+
+    ``json_payload`` may also be JSON that is already serialized to UTF-8
+    bytes (see :func:`join_rpc_batch`).
+    """
+    json_bytes = (
+        json_payload
+        if isinstance(json_payload, bytes)
+        else json.dumps(json_payload).encode("utf-8")
+    )
+    packed = pack_frame_buffers(buffers, version=version, codec=codec)
+    return assemble_frame_parts(json_bytes, packed, version=version)
+
+
+def pack_frame_buffers(
+    buffers: list[memoryview | bytes],
+    *,
+    version: int = FRAME_VERSION_V1,
+    codec: str | None = None,
+) -> list[tuple[memoryview | bytes, int]]:
+    """Flatten (and optionally compress) buffers for a binary frame.
+
+    Returns ``(payload, codec_id)`` pairs for
+    :func:`assemble_frame_parts`. Splitting the two steps lets a transport
+    do the compression on the calling thread and the cheap header layout
+    later, once it knows which messages share a frame.
+    """
+    if codec is not None:
+        if version != FRAME_VERSION_V3:
+            raise ValueError(
+                "Buffer compression requires binary frame version 3"
+            )
+        if codec not in BUFFER_CODEC_IDS:
+            raise ValueError(f"Unknown buffer codec {codec!r}")
+
+    packed: list[tuple[memoryview | bytes, int]] = []
+    for buf in buffers:
+        payload: memoryview | bytes = _flat_bytes(buf)
+        codec_id = _CODEC_RAW
+        if codec is not None and payload.nbytes >= MIN_COMPRESSED_BUFFER_BYTES:
+            compressed = _compress_buffer(payload, codec)
+            if len(compressed) < payload.nbytes:
+                payload = compressed
+                codec_id = BUFFER_CODEC_IDS[codec]
+        packed.append((payload, codec_id))
+    return packed
+
+
+def assemble_frame_parts(
+    json_bytes: bytes,
+    packed: list[tuple[memoryview | bytes, int]],
+    *,
+    version: int = FRAME_VERSION_V1,
+) -> list[memoryview | bytes]:
+    """Lay out header + JSON and the buffers from :func:`pack_frame_buffers`."""
+    entries: list[tuple[int, int, int]] = []
+    byte_offset = 0
+    for payload, codec_id in packed:
+        length = len(payload) if isinstance(payload, bytes) else payload.nbytes
+        entries.append((byte_offset, length, codec_id))
+        byte_offset += length
+
+    header = _pack_header(entries, version)
+    return [header + json_bytes, *(p for p, _ in packed if len(p))]
+
+
 def encode_binary_frame(
-    json_payload: dict[str, Any],
+    json_payload: dict[str, Any] | list[Any] | bytes,
     buffers: list[memoryview | bytes],
+    *,
+    version: int = FRAME_VERSION_V1,
+    codec: str | None = None,
 ) -> bytes:
     """Pack a JSON-RPC envelope + binary buffers into one WebSocket frame.
 
-    Wire format (little-endian throughout):
+    Wire format v1 (little-endian throughout):
         [4 bytes]    uint32  buffer_count (N)
         [N*8 bytes]  N pairs of (uint32 offset, uint32 length)
         [variable]   JSON payload as UTF-8
         [variable]   concatenated buffer bytes
 
-    Offsets are relative to the start of the buffer data section
-    (immediately after the JSON section).
-    """
-    json_bytes = json.dumps(json_payload).encode("utf-8")
-    buffer_count = len(buffers)
-
-    byte_offset = 0
-    offset_table: list[tuple[int, int]] = []
-    for buf in buffers:
-        nbytes = buf.nbytes if hasattr(buf, "nbytes") else len(buf)
-        offset_table.append((byte_offset, nbytes))
-        byte_offset += nbytes
-
-    header_size = 4 + buffer_count * 8
-    total_size = header_size + len(json_bytes) + byte_offset
+    Wire format v2 (``version=2``):
+        [4 bytes]    ASCII magic ``MVB2``
+        [4 bytes]    uint32  buffer_count (N)
+        [N*16 bytes] N pairs of (uint64 offset, uint64 length)
+        [variable]   JSON payload as UTF-8
+        [variable]   concatenated buffer bytes
 
-    out = bytearray(total_size)
-    pos = 0
+    Wire format v3 (``version=3``):
+        [4 bytes]    ASCII magic ``MVB3``
+        [4 bytes]    uint32  buffer_count (N)
+        [N*20 bytes] N triples of (uint64 offset, uint64 length,
+                     uint32 codec) — codec 0 is raw, otherwise an id
+                     from :data:`BUFFER_CODEC_IDS`
+        [variable]   JSON payload as UTF-8
+        [variable]   concatenated (possibly compressed) buffer bytes
 
-    struct.pack_into("<I", out, pos, buffer_count)
-    pos += 4
+    Offsets are relative to the start of the buffer data section
+    (immediately after the JSON section); lengths count wire bytes.
 
-    for buf_offset, buf_length in offset_table:
-        struct.pack_into("<I", out, pos, buf_offset)
-        pos += 4
-        struct.pack_into("<I", out, pos, buf_length)
-        pos += 4
+    Copies every buffer once into the returned ``bytes``; prefer
+    :func:`encode_binary_frame_parts` when the sink accepts fragments.
 
-    out[pos : pos + len(json_bytes)] = json_bytes
-    pos += len(json_bytes)
+    Raises:
+        ValueError: ``version=1`` and the buffers total more than 4 GiB,
+            or ``codec`` is given for a version other than 3.
+    """
+    return b"".join(
+        encode_binary_frame_parts(
+            json_payload, buffers, version=version, codec=codec
+        )
+    )
 
-    for buf in buffers:
-        buf_bytes = bytes(buf)
-        out[pos : pos + len(buf_bytes)] = buf_bytes
-        pos += len(buf_bytes)
 
-    return bytes(out)
+def decode_binary_frame(data: bytes) -> tuple[Any, list[bytes]]:
+    """Decode a v1, v2 or v3 binary frame into ``(json_dict, [buffer_bytes])``.
 
+    The JSON part is a list when the frame carries a JSON-RPC batch.
 
-def decode_binary_frame(data: bytes) -> tuple[dict[str, Any], list[bytes]]:
-    """Decode a binary frame into ``(json_dict, [buffer_bytes])``."""
+    Compressed v3 buffers are returned decompressed.
+    """
     pos = 0
+    entry_format = "<II"
+    if data[:4] == _FRAME_V2_MAGIC:
+        pos += 4
+        entry_format = "<QQ"
+    elif data[:4] == _FRAME_V3_MAGIC:
+        pos += 4
+        entry_format = "<QQI"
+    entry_size = struct.calcsize(entry_format)
 
     buffer_count = struct.unpack_from("<I", data, pos)[0]
     pos += 4
 
-    offset_table: list[tuple[int, int]] = []
+    offset_table: list[tuple[int, int, int]] = []
     for _ in range(buffer_count):
-        buf_offset = struct.unpack_from("<I", data, pos)[0]
-        pos += 4
-        buf_length = struct.unpack_from("<I", data, pos)[0]
-        pos += 4
-        offset_table.append((buf_offset, buf_length))
+        buf_offset, buf_length, *codec = struct.unpack_from(
+            entry_format, data, pos
+        )
+        pos += entry_size
+        offset_table.append(
+            (buf_offset, buf_length, codec[0] if codec else _CODEC_RAW)
+        )
 
-    header_size = 4 + buffer_count * 8
-    total_buffer_size = sum(length for _, length in offset_table)
+    header_size = pos
+    total_buffer_size = sum(length for _, length, _ in offset_table)
     json_end = len(data) - total_buffer_size
     json_bytes = data[header_size:json_end]
     json_payload = json.loads(json_bytes.decode("utf-8"))
 
     buffer_data_start = json_end
     buffers: list[bytes] = []
-    for buf_offset, buf_length in offset_table:
+    for buf_offset, buf_length, codec_id in offset_table:
         start = buffer_data_start + buf_offset
-        buffers.append(data[start : start + buf_length])
+        buffer = data[start : start + buf_length]
+        if codec_id != _CODEC_RAW:
+            buffer = _decompress_buffer(buffer, codec_id)
+        buffers.append(buffer)
 
     return json_payload, buffers
+
+
+def join_rpc_batch(
+    messages: list[tuple[bytes, list[Any]]],
+) -> tuple[bytes, list[Any]]:
+    """Merge serialized JSON-RPC messages into one batch array.
+
+    Each entry is ``(json_bytes, buffers)`` for one request or response
+    whose buffer refs index into its own ``buffers``. The buffers are
+    concatenated; every message whose buffers do not start at index 0
+    gets a ``"buffer_offset"`` member, and the receiver resolves its refs
+    against ``buffers[buffer_offset:]``. Returns the UTF-8 JSON array and
+    the combined buffer list.
+    """
+    parts: list[bytes] = []
+    combined: list[Any] = []
+    for json_bytes, buffers in messages:
+        if buffers and combined:
+            # Serialized objects end in "}"; append the member in place
+            # rather than re-serializing the message.
+            json_bytes = (
+                json_bytes[:-1] + b', "buffer_offset": %d}' % len(combined)
+            )
+        parts.append(json_bytes)
+        combined.extend(buffers)
+    return b"[" + b", ".join(parts) + b"]", combined
+
+
+def _same_column(a: Any, b: Any) -> bool:
+    """True when two column values would serialize identically."""
+    if a is b:
+        return True
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        if not (isinstance(a, np.ndarray) and isinstance(b, np.ndarray)):
+            return False
+        return a.dtype == b.dtype and a.shape == b.shape and np.array_equal(a, b)
+    if type(a) is not type(b):
+        return False
+    try:
+        return bool(a == b)
+    except (TypeError, ValueError):
+        return False
+
+
+def _same_layout(
+    prev: Mapping[str, Mapping[str, Any]], blocks: Mapping[str, Mapping[str, Any]]
+) -> bool:
+    return prev.keys() == blocks.keys() and all(
+        prev[name].keys() == blocks[name].keys() for name in blocks
+    )
+
+
+def encode_frame_deltas(
+    frames: Iterable[Mapping[str, Mapping[str, Any]]],
+) -> list[dict[str, Any]]:
+    """Serialize per-frame ``blocks`` dicts, dropping repeats of the previous frame.
+
+    The first frame is sent in full as ``{"blocks": ...}``. Every later
+    frame whose block and column names match its predecessor becomes
+    ``{"blocks": <changed columns only>, "delta": True}``; the frontend
+    fills the omitted columns from the previous frame in the same list.
+    For fixed-topology trajectories that leaves just the coordinates (and
+    any per-atom properties that actually move) on the wire. A frame that
+    adds or drops a block or column is sent in full.
+    """
+    out: list[dict[str, Any]] = []
+    prev: Mapping[str, Mapping[str, Any]] | None = None
+    for blocks in frames:
+        if prev is None or not _same_layout(prev, blocks):
+            out.append({"blocks": {name: dict(cols) for name, cols in blocks.items()}})
+        else:
+            changed: dict[str, dict[str, Any]] = {}
+            for name, cols in blocks.items():
+                diff = {
+                    key: value
+                    for key, value in cols.items()
+                    if not _same_column(prev[name][key], value)
+                }
+                if diff:
+                    changed[name] = diff
+            out.append({"blocks": changed, "delta": True})
+        prev = blocks
+    return out
@@ -11,18 +11,89 @@ embed flow (notebook).
 Handshake
 ---------
 
-    client → server  {"type":"hello", "token":"…", "session":"…"}
-    server → client  {"type":"ready"}              ✓
-                     ws.close(1008, "auth")         ✗ token mismatch
+    client → server  {"type":"hello", "token":"…", "session":"…",
+                      "frame_versions":[1, 2, 3],
+                      "buffer_codecs":["deflate"], "rpc_batch":true}
+    server → client  {"type":"ready", "frame_version":3,
+                      "buffer_codec":"deflate"}             ✓
+                     ws.close(1008, "auth")                ✗ token mismatch
+
+``frame_versions`` is optional: pages that omit it get a bare
+``{"type":"ready"}`` and the v1 (uint32) binary-frame layout. Pages that
+advertise v2 get 64-bit offsets so one frame can exceed 4 GiB; v3 adds a
+per-buffer codec flag. ``buffer_codecs`` lists the codecs the page can
+decompress; ``buffer_codec`` is echoed only when the transport was
+configured with one that both ends support. ``rpc_batch`` says the page
+accepts JSON-RPC batch arrays (see *Batching* below).
+
+Compression
+-----------
+
+Two independent layers, both configurable on :class:`WebSocketTransport`:
+
+* ``compression="deflate"`` (default) negotiates permessage-deflate for
+  text messages and binary messages up to ``deflate_max_size`` bytes —
+  JSON-heavy traffic such as pipeline specs and ``tolist()``-ed string
+  columns. Larger binary messages skip it, so bulk arrays are never
+  deflated on the event-loop thread.
+* ``buffer_codec`` (opt-in) compresses each large binary buffer on the
+  calling thread before it is framed, flagged per buffer in the v3
+  header (see :mod:`._codec`).
 
 After ``ready``, both ends speak JSON-RPC 2.0 with the binary-frame codec
 from :mod:`._codec`. Requests carry ``id``; notifications (frontend events)
 omit ``id`` and are routed to the attached :class:`~molvis.events.EventBus`.
+
+Batching
+--------
+
+Requests queued while an earlier write is still in flight — a burst of
+``send_request_nowait`` calls, or several threads sending at once — are
+written as one JSON-RPC batch array in a single frame when the page
+advertised ``rpc_batch``. Each entry keeps its own buffers: the frame's
+buffer table is the concatenation, and an entry whose buffers do not
+start at index 0 carries ``"buffer_offset"``. The page answers with a
+batch array in the same layout; responses are routed back by ``id``.
+
+Several clients
+---------------
+
+Any number of pages (tabs, users watching the same analysis server) can
+attach with the same token; ``max_clients`` caps it. Every request is
+encoded once and the same frame bytes are written to every client with
+the same negotiated wire format; notifications from any client reach the
+event bus. Replies are taken from the *primary* client only — the
+longest-attached one — so ``wait_for_response`` results stay
+deterministic; the others' replies are dropped. A request can instead
+target one client (``client=``), e.g. a state sync for the tab that just
+connected: :attr:`WebSocketTransport.event_origin` names the client whose
+notification is being dispatched.
+
+Inbound threading
+-----------------
+
+The event loop only moves bytes. Messages of 64 KiB or more are parsed
+and decoded on a small decode pool, and event-bus listeners run on a
+listener pool, so neither a large response nor a slow callback delays
+other traffic or keepalive pings. Each client's messages are still
+handed over in arrival order, and listeners for one event name run one
+at a time in that order.
+
+Several sessions
+----------------
+
+The server itself — loop thread, socket, token, static files — is a
+:class:`TransportHub`. A standalone :class:`WebSocketTransport` runs a
+private hub that accepts any ``session``; transports created with
+:meth:`TransportHub.transport` share one hub, which routes each
+connection by the ``session`` of its hello and closes connections for
+unknown sessions with ``1008 unknown session``.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
 import logging
 import mimetypes
@@ -31,19 +102,29 @@ import pathlib
 import re
 import secrets
 import threading
+import time
 import urllib.parse
 import webbrowser
-from dataclasses import asdict, dataclass
+from collections import deque
+from collections.abc import Callable, Hashable
+from concurrent.futures import Executor, Future, InvalidStateError, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from importlib.resources import files
-from queue import Empty, Queue
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
 
 from ..types import JsonRPCRequest
 from ._codec import (
+    FRAME_VERSION_V1,
+    SUPPORTED_FRAME_VERSIONS,
+    BUFFER_CODEC_IDS,
+    FRAME_VERSION_V3,
     BinaryPayloadDecoder,
     BinaryPayloadEncoder,
+    assemble_frame_parts,
+    available_buffer_codecs,
     decode_binary_frame,
-    encode_binary_frame,
+    join_rpc_batch,
+    pack_frame_buffers,
 )
 from ._jupyter_env import resolve_endpoints
 
@@ -52,7 +133,15 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("molvis")
 
-__all__ = ["PageEndpoints", "WebSocketTransport", "resolve_dist"]
+__all__ = [
+    "OVERFLOW_POLICIES",
+    "OverflowPolicy",
+    "PageEndpoints",
+    "SendQueueStats",
+    "TransportHub",
+    "WebSocketTransport",
+    "resolve_dist",
+]
 
 
 mimetypes.add_type("application/wasm", ".wasm")
@@ -65,6 +154,17 @@ _LINK_TAG_RE = re.compile(r"<link\b[^>]*>", re.IGNORECASE)
 _LINK_HREF_RE = re.compile(r"\bhref=[\"']([^\"']+)[\"']", re.IGNORECASE)
 _LINK_REL_RE = re.compile(r"\brel=[\"']([^\"']+)[\"']", re.IGNORECASE)
 
+# Inbound messages smaller than this are decoded on the loop thread; the
+# hop to a worker would cost more than the decode.
+_INLINE_DECODE_BYTES = 64 * 1024
+# Messages read ahead of the one being delivered, per client.
+_INBOUND_WINDOW = 32
+# Weight of the newest sample in the drain-latency moving average.
+_LATENCY_ALPHA = 0.1
+
+OverflowPolicy = Literal["block", "drop", "coalesce"]
+OVERFLOW_POLICIES: tuple[OverflowPolicy, ...] = ("block", "drop", "coalesce")
+
 
 def _cors_headers(extra: dict[str, str] | None = None) -> Any:
     """Headers that let a notebook webview (different origin) fetch us.
@@ -149,49 +249,60 @@ class PageEndpoints:
     standalone_url: str
 
 
-class WebSocketTransport:
-    """Transport that hosts the page bundle and drives it over a WebSocket.
+@dataclass(frozen=True)
+class SendQueueStats:
+    """Snapshot of a transport's outbound queue; see :attr:`WebSocketTransport.send_queue`.
+
+    Attributes
+    ----------
+    depth
+        Requests accepted but not yet written to every target.
+    bytes_in_flight
+        Encoded size (JSON plus raw buffers) of those requests.
+    sent
+        Requests written so far.
+    dropped
+        Fire-and-forget requests discarded by the ``"drop"`` policy.
+    coalesced
+        Queued requests replaced by a newer one under ``"coalesce"``.
+    drain_latency
+        Moving average of the seconds from submit to written.
+    max_drain_latency
+        Slowest submit-to-written time seen.
+    """
+
+    depth: int
+    bytes_in_flight: int
+    sent: int
+    dropped: int
+    coalesced: int
+    drain_latency: float
+    max_drain_latency: float
+
+
+class TransportHub:
+    """One server, port and event-loop thread shared by many sessions.
+
+    Each :class:`WebSocketTransport` made by :meth:`transport` is bound to
+    a session name, and every incoming connection is routed to one of
+    them by the ``session`` field of its hello frame. A notebook with
+    thirty viewers then runs one asyncio loop and listens on one port
+    instead of thirty:
+
+        >>> hub = mv.TransportHub(open_browser=False)
+        >>> a = mv.Molvis("a", transport=hub)
+        >>> b = mv.Molvis("b", transport=hub)
+
+    A standalone :class:`WebSocketTransport` runs a private hub that
+    accepts every session.
 
     Parameters
     ----------
-    page_base_url
-        External base URL the page is served from (e.g. a CDN). When
-        ``None`` (default), the transport also serves the bundled
-        ``dist/`` on its own HTTP port. Trailing slash optional.
-    host, port
-        Host/port the WS server binds to. ``port=0`` (default) asks the
-        OS to pick a free port.
-    token
-        Shared secret embedded in the standalone URL and checked during
-        the hello handshake. Auto-generated if ``None``.
-    open_browser
-        If ``True`` (default), call :func:`webbrowser.open` on the
-        standalone URL when ``start()`` is called. Notebook hosts pass
-        ``False``.
-    dist
-        Override the local static asset directory. Ignored when
-        ``page_base_url`` is given.
-    event_bus
-        :class:`~molvis.events.EventBus` to dispatch frontend-pushed
-        JSON-RPC notifications into. Usually set by :class:`Molvis`.
-    surface
-        Page chrome preset: ``"full"`` (default) or ``"canvas"`` (no
-        chrome — TopBar, sidebars, timeline hidden). Standalone URL gets
-        ``&surface=canvas`` when set to ``"canvas"``.
-    handshake_timeout
-        Seconds to wait for the browser to finish the hello handshake —
-        both on the server side (after a TCP accept, before a hello
-        frame arrives) and on the client side (``send_request`` blocking
-        until a browser is attached). ``None`` (default) waits
-        indefinitely; set a concrete number only when you want a hard
-        failure if the browser never shows up.
-    serve_page
-        When ``True`` (default), HTTP requests to paths other than
-        ``/ws`` serve the bundled ``dist/`` — useful for notebook
-        hosts and the VSCode webview. Pass ``False`` for WS-only mode
-        where the frontend is hosted elsewhere (e.g. an
-        already-open ``npm run dev:page`` tab) and only the
-        ``ws://…?token=…&session=…`` URL is shared.
+    page_base_url, host, port, token, dist, handshake_timeout, serve_page,
+    compression, deflate_max_size, max_message_size, decode_workers,
+    listener_workers
+        As for :class:`WebSocketTransport`; they configure the shared
+        server and apply to every session on it.
     """
 
     def __init__(
@@ -201,46 +312,60 @@ class WebSocketTransport:
         host: str = "localhost",
         port: int = 0,
         token: str | None = None,
-        open_browser: bool = True,
         dist: pathlib.Path | None = None,
-        event_bus: EventBus | None = None,
-        surface: str = "full",
         handshake_timeout: float | None = None,
         serve_page: bool = True,
+        compression: str | None = "deflate",
+        deflate_max_size: int = 64 * 1024,
+        max_message_size: int | None = None,
+        decode_workers: int = 2,
+        listener_workers: int = 4,
     ) -> None:
+        if max_message_size is not None and max_message_size < 1:
+            raise ValueError(
+                f"max_message_size must be >= 1, got {max_message_size}"
+            )
+        if decode_workers < 0:
+            raise ValueError(f"decode_workers must be >= 0, got {decode_workers}")
+        if listener_workers < 1:
+            raise ValueError(
+                f"listener_workers must be >= 1, got {listener_workers}"
+            )
         self._page_base_url = (
             page_base_url.rstrip("/") + "/" if page_base_url else None
         )
         self._host = host
         self._port = port
         self._token = token or secrets.token_urlsafe(24)
-        self._open_browser = open_browser
         self._dist = dist or resolve_dist()
-        self._event_bus = event_bus
-        if surface not in ("full", "canvas"):
-            raise ValueError(
-                f"surface must be 'full' or 'canvas', got {surface!r}"
-            )
-        self._surface = surface
         self._handshake_timeout = handshake_timeout
         self._serve_page = serve_page
-
-        self._decoder = BinaryPayloadDecoder()
-        self._response_lock = threading.Lock()
-        self._request_counter = 0
-        self._responses: dict[int, Queue[dict[str, Any]]] = {}
+        if compression not in ("deflate", None):
+            raise ValueError(
+                f"compression must be 'deflate' or None, got {compression!r}"
+            )
+        self._compression = compression
+        self._deflate_max_size = deflate_max_size
+        self._max_message_size = max_message_size
+        self._decode_workers = decode_workers
+        self._listener_workers = listener_workers
+        # Created by start(); shared by every session on the hub.
+        self._decode_pool: ThreadPoolExecutor | None = None
+        self._listener_pool: ThreadPoolExecutor | None = None
+
+        # Session name → transport. ``_fallback`` takes every session
+        # without a route of its own (a standalone transport's hub).
+        self._routes: dict[str, WebSocketTransport] = {}
+        self._fallback: WebSocketTransport | None = None
+        self._routes_lock = threading.Lock()
 
         self._ready_event = threading.Event()
-        self._connected_event = threading.Event()
-        self._disconnected_event = threading.Event()
+        self._start_lock = threading.Lock()
         self._started = False
-
         self._thread: threading.Thread | None = None
         self._loop: asyncio.AbstractEventLoop | None = None
-        self._ws: Any | None = None
         self._ws_server: Any | None = None
         self._bound_port: int = 0
-        self._bound_session: str = ""
 
         self._asset_scripts: tuple[str, ...] = ()
         self._asset_css: tuple[str, ...] = ()
@@ -258,19 +383,87 @@ class WebSocketTransport:
         return self._token
 
     @property
-    def connected(self) -> bool:
-        return self._connected_event.is_set()
+    def sessions(self) -> list[str]:
+        """Session names with a transport on this hub."""
+        with self._routes_lock:
+            return list(self._routes)
 
-    def attach_event_bus(self, event_bus: EventBus) -> None:
-        """Wire a late-constructed event bus. No-op if already set."""
-        if self._event_bus is None:
-            self._event_bus = event_bus
+    # ------------------------------------------------------------------
+    # Sessions
+    # ------------------------------------------------------------------
+
+    def transport(
+        self,
+        session: str,
+        *,
+        event_bus: EventBus | None = None,
+        surface: str = "full",
+        open_browser: bool = False,
+        buffer_codec: str | None = None,
+        max_clients: int | None = None,
+        max_queued_bytes: int | None = None,
+        max_queued_messages: int | None = None,
+        overflow: OverflowPolicy = "block",
+    ) -> WebSocketTransport:
+        """Create the transport for ``session`` on this hub.
+
+        Keyword arguments are the per-session options of
+        :class:`WebSocketTransport`. :meth:`WebSocketTransport.stop`
+        on the result detaches its pages and frees the session name;
+        the hub keeps running until :meth:`stop`.
+
+        Raises
+        ------
+        ValueError
+            ``session`` already has a transport on this hub.
+        """
+        return WebSocketTransport(
+            hub=self,
+            session=session,
+            event_bus=event_bus,
+            surface=surface,
+            open_browser=open_browser,
+            buffer_codec=buffer_codec,
+            max_clients=max_clients,
+            max_queued_bytes=max_queued_bytes,
+            max_queued_messages=max_queued_messages,
+            overflow=overflow,
+        )
+
+    def _register(self, session: str | None, transport: WebSocketTransport) -> None:
+        with self._routes_lock:
+            current = (
+                self._fallback if session is None else self._routes.get(session)
+            )
+            if current is not None and current is not transport:
+                raise ValueError(
+                    f"Session {session!r} already has a transport on this hub"
+                )
+            if session is None:
+                self._fallback = transport
+            else:
+                self._routes[session] = transport
+
+    def _unregister(self, transport: WebSocketTransport) -> None:
+        with self._routes_lock:
+            if self._fallback is transport:
+                self._fallback = None
+            self._routes = {
+                name: t for name, t in self._routes.items() if t is not transport
+            }
+
+    def _route(self, session: str) -> WebSocketTransport:
+        with self._routes_lock:
+            transport = self._routes.get(session, self._fallback)
+        if transport is None:
+            raise _HandshakeError(1008, "unknown session")
+        return transport
 
     # ------------------------------------------------------------------
     # URL helpers
     # ------------------------------------------------------------------
 
-    def page_endpoints(self, *, session: str) -> PageEndpoints:
+    def page_endpoints(self, *, session: str, surface: str = "full") -> PageEndpoints:
         """Compose viewer endpoints for ``session``.
 
         Pulls the env-aware base + WS URLs from
@@ -302,8 +495,8 @@ class WebSocketTransport:
             "token": self._token,
             "session": session,
         }
-        if self._surface != "full":
-            params["surface"] = self._surface
+        if surface != "full":
+            params["surface"] = surface
         query = urllib.parse.urlencode(params)
         standalone_url = f"{base}{sep}{query}"
 
@@ -352,35 +545,41 @@ class WebSocketTransport:
     # ------------------------------------------------------------------
 
     def start(self) -> int:
-        if self._started:
-            return self._bound_port
-        self._started = True
+        """Start the server thread (once) and return the bound port."""
+        with self._start_lock:
+            if self._started:
+                return self._bound_port
+            self._started = True
 
-        self._load_asset_manifest()
+            self._load_asset_manifest()
 
-        self._thread = threading.Thread(
-            target=self._run_loop,
-            name="molvis-transport",
-            daemon=True,
-        )
-        self._thread.start()
-        if not self._ready_event.wait(timeout=10):
-            raise RuntimeError("WebSocketTransport failed to start within 10 seconds")
+            if self._decode_workers:
+                self._decode_pool = ThreadPoolExecutor(
+                    self._decode_workers, thread_name_prefix="molvis-decode"
+                )
+            self._listener_pool = ThreadPoolExecutor(
+                self._listener_workers, thread_name_prefix="molvis-listener"
+            )
+            self._ready_event.clear()
+            self._thread = threading.Thread(
+                target=self._run_loop,
+                name="molvis-transport",
+                daemon=True,
+            )
+            self._thread.start()
+            if not self._ready_event.wait(timeout=10):
+                raise RuntimeError(
+                    "WebSocketTransport failed to start within 10 seconds"
+                )
         logger.info(
             "MolVis transport listening on ws://%s:%d/ws",
             self._host,
             self._bound_port,
         )
-        if self._open_browser:
-            try:
-                webbrowser.open(
-                    self.page_endpoints(session="default").standalone_url
-                )
-            except Exception:  # pragma: no cover — best-effort UX
-                logger.exception("webbrowser.open failed")
         return self._bound_port
 
     def stop(self) -> None:
+        """Close the server and every session's pages."""
         loop = self._loop
         if loop is None:
             self._started = False
@@ -398,32 +597,17 @@ class WebSocketTransport:
             self._thread.join(timeout=5)
             self._thread = None
         self._loop = None
-        self._ws = None
+        for pool in (self._decode_pool, self._listener_pool):
+            if pool is not None:
+                pool.shutdown(wait=False)
+        self._decode_pool = self._listener_pool = None
+        with self._routes_lock:
+            transports = [*self._routes.values(), self._fallback]
+        for transport in transports:
+            if transport is not None:
+                transport._clients = []
         self._started = False
 
-    def wait_for_connection(self, timeout: float | None = None) -> None:
-        """Block until a browser finishes the hello handshake.
-
-        Parameters
-        ----------
-        timeout
-            Maximum seconds to wait. ``None`` (default) waits
-            indefinitely — appropriate when the user may open the
-            browser tab at any time. Pass a concrete number to fail
-            fast when the browser is expected to be ready already.
-        """
-        if timeout is None:
-            self._connected_event.wait()
-            return
-        if not self._connected_event.wait(timeout=timeout):
-            raise TimeoutError(
-                f"No browser session within {timeout}s. "
-                "The page may not have loaded or the token may be wrong."
-            )
-
-    def wait_for_disconnection(self, timeout: float | None = None) -> bool:
-        return self._disconnected_event.wait(timeout=timeout)
-
     # ------------------------------------------------------------------
     # Asset manifest
     # ------------------------------------------------------------------
@@ -451,157 +635,6 @@ class WebSocketTransport:
             len(self._asset_css),
         )
 
-    # ------------------------------------------------------------------
-    # Outbound — main thread → browser
-    # ------------------------------------------------------------------
-
-    def send_request(
-        self,
-        method: str,
-        params: dict[str, Any],
-        *,
-        buffers: list[Any] | None = None,
-        wait_for_response: bool = False,
-        timeout: float = 10.0,
-    ) -> dict[str, Any] | None:
-        if not self._connected_event.is_set():
-            handshake_timeout = self._handshake_timeout
-            if handshake_timeout is None:
-                self._connected_event.wait()
-            elif not self._connected_event.wait(timeout=handshake_timeout):
-                raise TimeoutError(
-                    f"No browser handshake after {handshake_timeout}s — "
-                    "cannot send RPC."
-                )
-
-        if self._ws is None or self._loop is None:
-            raise RuntimeError("WebSocket transport is not connected")
-
-        encoder = BinaryPayloadEncoder()
-        encoded_params = encoder.encode(params)
-
-        with self._response_lock:
-            self._request_counter += 1
-            request_id = self._request_counter
-            response_queue: Queue[dict[str, Any]] | None = None
-            if wait_for_response:
-                response_queue = Queue(maxsize=1)
-                self._responses[request_id] = response_queue
-
-        request = JsonRPCRequest(
-            jsonrpc="2.0",
-            method=method,
-            params=encoded_params,
-            id=request_id,
-        )
-
-        payload_buffers: list[Any] = [*encoder.buffers, *(buffers or [])]
-        if payload_buffers:
-            frame = encode_binary_frame(asdict(request), payload_buffers)
-            future = asyncio.run_coroutine_threadsafe(
-                self._ws.send(frame), self._loop
-            )
-        else:
-            text = json.dumps(asdict(request))
-            future = asyncio.run_coroutine_threadsafe(
-                self._ws.send(text), self._loop
-            )
-
-        try:
-            future.result(timeout=timeout)
-        except Exception:
-            with self._response_lock:
-                self._responses.pop(request_id, None)
-            raise
-
-        if not wait_for_response or response_queue is None:
-            return None
-
-        try:
-            return response_queue.get(timeout=timeout)
-        except Empty:
-            raise TimeoutError(
-                f"No response from frontend for '{method}' after {timeout}s"
-            ) from None
-        finally:
-            with self._response_lock:
-                self._responses.pop(request_id, None)
-
-    # ------------------------------------------------------------------
-    # Inbound — browser → main thread
-    # ------------------------------------------------------------------
-
-    def _dispatch_inbound(self, message: Any) -> None:
-        if isinstance(message, bytes):
-            try:
-                json_payload, buffers = decode_binary_frame(message)
-            except Exception as exc:  # pragma: no cover
-                logger.warning("Failed to decode binary frame: %s", exc)
-                return
-        elif isinstance(message, str):
-            try:
-                json_payload = json.loads(message)
-            except json.JSONDecodeError as exc:
-                logger.debug("Ignoring non-JSON text message: %s", exc)
-                return
-            buffers = []
-        else:
-            logger.debug("Ignoring unexpected WS message type: %s", type(message))
-            return
-
-        if not isinstance(json_payload, dict):
-            logger.debug("Ignoring non-object JSON payload")
-            return
-
-        # JSON-RPC notification: has method, no id.
-        if "method" in json_payload and "id" not in json_payload:
-            self._dispatch_notification(json_payload, buffers)
-            return
-
-        # Otherwise treat as response.
-        self._dispatch_response(json_payload, buffers)
-
-    def _dispatch_notification(
-        self, payload: dict[str, Any], buffers: list[Any]
-    ) -> None:
-        bus = self._event_bus
-        if bus is None:
-            return
-        method = payload.get("method")
-        if not isinstance(method, str):
-            return
-        raw_params = payload.get("params") or {}
-        try:
-            params = self._decoder.decode(raw_params, buffers)
-        except Exception as exc:
-            logger.warning("Failed to decode notification '%s': %s", method, exc)
-            return
-        try:
-            bus.dispatch(method, params if isinstance(params, dict) else {})
-        except Exception:
-            logger.exception("Event bus raised while dispatching '%s'", method)
-
-    def _dispatch_response(
-        self, payload: dict[str, Any], buffers: list[Any]
-    ) -> None:
-        try:
-            decoded = self._decoder.decode(payload, buffers)
-        except Exception as exc:
-            logger.warning("Failed to decode response: %s", exc)
-            return
-        if not isinstance(decoded, dict):
-            return
-        request_id = decoded.get("id")
-        if request_id is None:
-            logger.debug("Dropping response without request id")
-            return
-        with self._response_lock:
-            queue = self._responses.get(int(request_id))
-        if queue is None:
-            logger.debug("No waiter for request id %s", request_id)
-            return
-        queue.put_nowait(decoded)
-
     # ------------------------------------------------------------------
     # asyncio event loop in background thread
     # ------------------------------------------------------------------
@@ -630,20 +663,10 @@ class WebSocketTransport:
             ) from exc
 
         async def handler(ws: Any) -> None:
-            if self._connected_event.is_set():
-                await ws.close(1013, "session already bound")
-                return
-
-            # Reset the disconnect event so a re-connect (e.g. React
-            # StrictMode's dev double-mount) does not leave stale state
-            # that would trip the next wait_for_disconnection().
-            self._disconnected_event.clear()
-            self._ws = ws
             try:
-                await self._handshake(ws)
-                self._connected_event.set()
-                async for message in ws:
-                    self._dispatch_inbound(message)
+                hello = await self._read_hello(ws)
+                transport = self._route(str(hello.get("session") or "default"))
+                await transport._serve(ws, hello)
             except websockets.exceptions.ConnectionClosed:
                 pass
             except _HandshakeError as err:
@@ -652,10 +675,6 @@ class WebSocketTransport:
                     await ws.close(err.code, err.reason)
                 except Exception:  # pragma: no cover
                     pass
-            finally:
-                self._ws = None
-                self._connected_event.clear()
-                self._disconnected_event.set()
 
         async def process_request(connection: Any, request: Any) -> Any:
             from websockets.datastructures import Headers
@@ -673,6 +692,11 @@ class WebSocketTransport:
             self._host,
             self._port,
             process_request=process_request,
+            max_size=self._max_message_size,
+            compression=None,
+            extensions=_deflate_extensions(self._deflate_max_size)
+            if self._compression == "deflate"
+            else None,
         )
         self._ws_server = ws_server
         for sock in ws_server.sockets:
@@ -680,8 +704,23 @@ class WebSocketTransport:
             break
         self._ready_event.set()
 
-    async def _handshake(self, ws: Any) -> None:
-        """Wait for the client hello, validate the token, respond ready."""
+    def _decode(
+        self, decode: Callable[[Any], list[_Inbound]], message: Any
+    ) -> asyncio.Future[list[_Inbound]]:
+        """Run ``decode(message)`` off the loop unless the message is small."""
+        loop = asyncio.get_running_loop()
+        pool = self._decode_pool
+        if pool is not None and len(message) >= _INLINE_DECODE_BYTES:
+            return loop.run_in_executor(pool, decode, message)
+        future: asyncio.Future[list[_Inbound]] = loop.create_future()
+        try:
+            future.set_result(decode(message))
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+
+    async def _read_hello(self, ws: Any) -> dict[str, Any]:
+        """Wait for the client hello and validate the token."""
         try:
             if self._handshake_timeout is None:
                 raw = await ws.recv()
@@ -702,8 +741,7 @@ class WebSocketTransport:
         token = str(hello.get("token") or "")
         if not secrets.compare_digest(token, self._token):
             raise _HandshakeError(1008, "auth")
-        self._bound_session = str(hello.get("session") or "default")
-        await ws.send(json.dumps({"type": "ready"}))
+        return hello
 
     # ------------------------------------------------------------------
     # Static file serving (only when page_base_url is None)
@@ -747,6 +785,1111 @@ class WebSocketTransport:
         return response_cls(200, "OK", headers, body)
 
 
+class WebSocketTransport:
+    """Transport that hosts the page bundle and drives it over a WebSocket.
+
+    By default every transport runs its own :class:`TransportHub` (one
+    server thread and port). Pass ``hub`` — or use
+    :meth:`TransportHub.transport` — to share one with other sessions.
+
+    Parameters
+    ----------
+    page_base_url
+        External base URL the page is served from (e.g. a CDN). When
+        ``None`` (default), the transport also serves the bundled
+        ``dist/`` on its own HTTP port. Trailing slash optional.
+    host, port
+        Host/port the WS server binds to. ``port=0`` (default) asks the
+        OS to pick a free port.
+    token
+        Shared secret embedded in the standalone URL and checked during
+        the hello handshake. Auto-generated if ``None``.
+    open_browser
+        If ``True`` (default), call :func:`webbrowser.open` on the
+        standalone URL when ``start()`` is called. Notebook hosts pass
+        ``False``.
+    dist
+        Override the local static asset directory. Ignored when
+        ``page_base_url`` is given.
+    event_bus
+        :class:`~molvis.events.EventBus` to dispatch frontend-pushed
+        JSON-RPC notifications into. Usually set by :class:`Molvis`.
+    surface
+        Page chrome preset: ``"full"`` (default) or ``"canvas"`` (no
+        chrome — TopBar, sidebars, timeline hidden). Standalone URL gets
+        ``&surface=canvas`` when set to ``"canvas"``.
+    handshake_timeout
+        Seconds to wait for the browser to finish the hello handshake —
+        both on the server side (after a TCP accept, before a hello
+        frame arrives) and on the client side (``send_request`` blocking
+        until a browser is attached). ``None`` (default) waits
+        indefinitely; set a concrete number only when you want a hard
+        failure if the browser never shows up.
+    serve_page
+        When ``True`` (default), HTTP requests to paths other than
+        ``/ws`` serve the bundled ``dist/`` — useful for notebook
+        hosts and the VSCode webview. Pass ``False`` for WS-only mode
+        where the frontend is hosted elsewhere (e.g. an
+        already-open ``npm run dev:page`` tab) and only the
+        ``ws://…?token=…&session=…`` URL is shared.
+    compression
+        ``"deflate"`` (default) offers permessage-deflate to the page;
+        ``None`` disables it, which is cheaper on loopback connections.
+    deflate_max_size
+        Binary messages larger than this many bytes (and every
+        fragmented binary message) bypass permessage-deflate. Text
+        messages are always deflated when compression is on.
+    max_message_size
+        Largest inbound message, in bytes, a page may send; a larger one
+        closes its connection with ``1009``. ``None`` (default) has no
+        limit, since replies such as RGBA snapshots run to tens of MB.
+    buffer_codec
+        Per-buffer codec for large binary buffers: ``"deflate"``,
+        ``"zstd"`` or ``"lz4"``. ``None`` (default) sends buffers raw.
+        Only takes effect when the page advertises the codec during the
+        handshake; otherwise buffers fall back to raw.
+    max_clients
+        How many pages may be attached at once. ``None`` (default) has
+        no limit; connections beyond it are closed with
+        ``1013 too many clients``.
+    max_queued_bytes, max_queued_messages
+        High-water marks for the outbound queue: requests accepted but
+        not yet written, in encoded bytes and in count. ``None``
+        (default) leaves that dimension unbounded. A request is always
+        accepted into an empty queue, however large.
+    overflow
+        What a request that would cross a high-water mark does:
+        ``"block"`` (default) waits for the queue to drain;
+        ``"drop"`` discards fire-and-forget requests; ``"coalesce"``
+        replaces the newest queued fire-and-forget request with the same
+        method and targets, so only the latest state is sent — use it
+        when each request overwrites the previous one (frame or camera
+        streams). Requests that expect a reply always block.
+    decode_workers
+        Threads that parse and decode inbound messages of at least
+        64 KiB, so a large response does not stall the event loop (and
+        its keepalive pings). ``0`` decodes everything on the loop.
+    listener_workers
+        Threads that run :class:`~molvis.events.EventBus` listeners.
+        Events of one name are delivered one at a time, in arrival
+        order; different names may run concurrently.
+    hub
+        Shared :class:`TransportHub` to run on. The server options
+        (``page_base_url``, ``host``, ``port``, ``token``, ``dist``,
+        ``handshake_timeout``, ``serve_page``, ``compression``,
+        ``deflate_max_size``, ``max_message_size``, ``decode_workers``,
+        ``listener_workers``)
+        are the hub's and ignored here.
+    session
+        Session name pages must send in their hello to reach this
+        transport. Required with ``hub``; without one, ``None`` (default)
+        accepts every session.
+    """
+
+    def __init__(
+        self,
+        *,
+        page_base_url: str | None = None,
+        host: str = "localhost",
+        port: int = 0,
+        token: str | None = None,
+        open_browser: bool = True,
+        dist: pathlib.Path | None = None,
+        event_bus: EventBus | None = None,
+        surface: str = "full",
+        handshake_timeout: float | None = None,
+        serve_page: bool = True,
+        compression: str | None = "deflate",
+        deflate_max_size: int = 64 * 1024,
+        max_message_size: int | None = None,
+        buffer_codec: str | None = None,
+        max_clients: int | None = None,
+        max_queued_bytes: int | None = None,
+        max_queued_messages: int | None = None,
+        overflow: OverflowPolicy = "block",
+        decode_workers: int = 2,
+        listener_workers: int = 4,
+        hub: TransportHub | None = None,
+        session: str | None = None,
+    ) -> None:
+        if hub is not None and session is None:
+            raise ValueError("a transport on a shared hub needs a session name")
+        self._open_browser = open_browser
+        self._event_bus = event_bus
+        if surface not in ("full", "canvas"):
+            raise ValueError(
+                f"surface must be 'full' or 'canvas', got {surface!r}"
+            )
+        self._surface = surface
+        if buffer_codec is not None and buffer_codec not in BUFFER_CODEC_IDS:
+            raise ValueError(
+                f"buffer_codec must be one of {sorted(BUFFER_CODEC_IDS)} "
+                f"or None, got {buffer_codec!r}"
+            )
+        if (
+            buffer_codec is not None
+            and buffer_codec not in available_buffer_codecs()
+        ):
+            raise ImportError(
+                f"buffer_codec={buffer_codec!r} needs an optional package. "
+                "Install with: pip install 'molcrafts-molvis[compression]'"
+            )
+        self._buffer_codec = buffer_codec
+        if max_clients is not None and max_clients < 1:
+            raise ValueError(f"max_clients must be >= 1, got {max_clients}")
+        self._max_clients = max_clients
+        for name, mark in (
+            ("max_queued_bytes", max_queued_bytes),
+            ("max_queued_messages", max_queued_messages),
+        ):
+            if mark is not None and mark < 1:
+                raise ValueError(f"{name} must be >= 1, got {mark}")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"overflow must be one of {OVERFLOW_POLICIES}, got {overflow!r}"
+            )
+        self._max_queued_bytes = max_queued_bytes
+        self._max_queued_messages = max_queued_messages
+        self._overflow: OverflowPolicy = overflow
+
+        self._owns_hub = hub is None
+        self._hub = hub or TransportHub(
+            page_base_url=page_base_url,
+            host=host,
+            port=port,
+            token=token,
+            dist=dist,
+            handshake_timeout=handshake_timeout,
+            serve_page=serve_page,
+            compression=compression,
+            deflate_max_size=deflate_max_size,
+            max_message_size=max_message_size,
+            decode_workers=decode_workers,
+            listener_workers=listener_workers,
+        )
+        self._session = session
+        self._hub._register(session, self)
+
+        self._decoder = BinaryPayloadDecoder()
+        self._response_lock = threading.Lock()
+        self._request_counter = 0
+        self._responses: dict[int, Future[dict[str, Any]]] = {}
+        # Client whose reply resolves each entry of ``_responses``.
+        self._responders: dict[int, _Client] = {}
+
+        self._connected_event = threading.Event()
+        self._disconnected_event = threading.Event()
+        self._started = False
+
+        # Attached pages, oldest (primary) first. Replaced, never mutated,
+        # so caller threads can read it without the loop's cooperation.
+        self._clients: list[_Client] = []
+        self._client_counter = 0
+        # Per-thread, because listeners run on the hub's listener pool.
+        self._origin = threading.local()
+        self._listeners = _SerialByKey()
+        # Created on the loop thread by the first flush.
+        self._send_lock: asyncio.Lock | None = None
+        self._outbox: list[_Outgoing] = []
+        # Reentrant: settling a coalesced entry releases it under the lock.
+        self._outbox_lock = threading.RLock()
+        self._outbox_space = threading.Condition(self._outbox_lock)
+        self._queued_messages = 0
+        self._queued_bytes = 0
+        self._sent_count = 0
+        self._dropped_count = 0
+        self._coalesced_count = 0
+        self._drain_latency = 0.0
+        self._max_drain_latency = 0.0
+
+    # ------------------------------------------------------------------
+    # Read-only properties
+    # ------------------------------------------------------------------
+
+    @property
+    def port(self) -> int:
+        return self._hub.port
+
+    @property
+    def token(self) -> str:
+        return self._hub.token
+
+    @property
+    def hub(self) -> TransportHub:
+        """The hub whose server and loop thread this transport runs on."""
+        return self._hub
+
+    @property
+    def session(self) -> str | None:
+        """Session this transport serves; ``None`` accepts any."""
+        return self._session
+
+    @property
+    def connected(self) -> bool:
+        return self._connected_event.is_set()
+
+    @property
+    def client_count(self) -> int:
+        """Number of pages currently attached."""
+        return len(self._clients)
+
+    @property
+    def event_origin(self) -> str | None:
+        """Id of the client whose notification is being dispatched.
+
+        Only set on the thread running an :class:`~molvis.events.EventBus`
+        callback; pass it as ``client=`` to answer that page alone.
+        """
+        return getattr(self._origin, "value", None)
+
+    @property
+    def send_queue(self) -> SendQueueStats:
+        """Depth, bytes in flight and drain latency of the outbound queue."""
+        with self._outbox_lock:
+            return SendQueueStats(
+                depth=self._queued_messages,
+                bytes_in_flight=self._queued_bytes,
+                sent=self._sent_count,
+                dropped=self._dropped_count,
+                coalesced=self._coalesced_count,
+                drain_latency=self._drain_latency,
+                max_drain_latency=self._max_drain_latency,
+            )
+
+    def attach_event_bus(self, event_bus: EventBus) -> None:
+        """Wire a late-constructed event bus. No-op if already set."""
+        if self._event_bus is None:
+            self._event_bus = event_bus
+
+    # ------------------------------------------------------------------
+    # URL helpers
+    # ------------------------------------------------------------------
+
+    def page_endpoints(self, *, session: str) -> PageEndpoints:
+        """Compose viewer endpoints for ``session``; see :meth:`TransportHub.page_endpoints`."""
+        return self._hub.page_endpoints(session=session, surface=self._surface)
+
+    def connection_url(self, *, session: str = "default") -> str:
+        """Pasteable ``ws://…`` URL; see :meth:`TransportHub.connection_url`."""
+        return self._hub.connection_url(session=session)
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> int:
+        if self._started:
+            return self._hub.port
+        # A stopped transport gives its session back; claim it again.
+        self._hub._register(self._session, self)
+        self._started = True
+        port = self._hub.start()
+        if self._open_browser:
+            try:
+                webbrowser.open(
+                    self.page_endpoints(
+                        session=self._session or "default"
+                    ).standalone_url
+                )
+            except Exception:  # pragma: no cover — best-effort UX
+                logger.exception("webbrowser.open failed")
+        return port
+
+    def stop(self) -> None:
+        """Stop serving; a private hub is shut down, a shared one kept."""
+        self._started = False
+        if self._owns_hub:
+            self._hub.stop()
+            self._clients = []
+            return
+        self._hub._unregister(self)
+        loop = self._hub._loop
+        clients, self._clients = self._clients, []
+        if loop is None or not clients:
+            return
+
+        async def _close() -> None:
+            for client in clients:
+                with contextlib.suppress(Exception):
+                    await client.ws.close(1001, "session closed")
+
+        with contextlib.suppress(Exception):
+            asyncio.run_coroutine_threadsafe(_close(), loop).result(timeout=5)
+
+    def wait_for_connection(self, timeout: float | None = None) -> None:
+        """Block until a browser finishes the hello handshake.
+
+        Parameters
+        ----------
+        timeout
+            Maximum seconds to wait. ``None`` (default) waits
+            indefinitely — appropriate when the user may open the
+            browser tab at any time. Pass a concrete number to fail
+            fast when the browser is expected to be ready already.
+        """
+        if timeout is None:
+            self._connected_event.wait()
+            return
+        if not self._connected_event.wait(timeout=timeout):
+            raise TimeoutError(
+                f"No browser session within {timeout}s. "
+                "The page may not have loaded or the token may be wrong."
+            )
+
+    def wait_for_disconnection(self, timeout: float | None = None) -> bool:
+        return self._disconnected_event.wait(timeout=timeout)
+
+    # ------------------------------------------------------------------
+    # Outbound — main thread → browser
+    # ------------------------------------------------------------------
+
+    def send_request(
+        self,
+        method: str,
+        params: dict[str, Any],
+        *,
+        buffers: list[Any] | None = None,
+        wait_for_response: bool = False,
+        timeout: float = 10.0,
+        client: str | None = None,
+    ) -> dict[str, Any] | None:
+        """Send a request to every attached page, or only to ``client``.
+
+        With ``wait_for_response`` the reply comes from ``client`` when
+        given, otherwise from the primary (longest-attached) page.
+        """
+        request_id, sent, response = self._submit(
+            method, params, buffers, wait_for_response, client, timeout
+        )
+        try:
+            sent.result(timeout=timeout)
+            if response is None:
+                return None
+            try:
+                return response.result(timeout=timeout)
+            except TimeoutError:
+                raise TimeoutError(
+                    f"No response from frontend for '{method}' after {timeout}s"
+                ) from None
+        finally:
+            self._forget_request(request_id)
+
+    def send_request_nowait(
+        self,
+        method: str,
+        params: dict[str, Any],
+        *,
+        buffers: list[Any] | None = None,
+        wait_for_response: bool = False,
+        timeout: float | None = None,
+        client: str | None = None,
+    ) -> Future[dict[str, Any] | None]:
+        """Send a request without blocking on the write or the response.
+
+        Returns a :class:`concurrent.futures.Future` that resolves to the
+        JSON-RPC response dict (``wait_for_response=True``) or to ``None``
+        once the message has been written. Requests are written in call
+        order, so callers can issue many before waiting on any — one
+        round trip for the lot instead of one each. ``client`` works as
+        in :meth:`send_request`.
+
+        The call itself still waits for a page to attach and, under the
+        ``"block"`` overflow policy, for room in the send queue; with
+        ``timeout`` each of those waits raises :class:`TimeoutError`
+        after that many seconds instead of blocking indefinitely.
+        """
+        request_id, sent, response = self._submit(
+            method,
+            params,
+            buffers,
+            wait_for_response,
+            client,
+            timeout,
+            handshake_timeout=timeout,
+        )
+        # Never hand out ``sent`` itself: cancelling it would abort a
+        # write that may be half-way through a fragmented message.
+        result: Future[dict[str, Any] | None] = (
+            response if response is not None else Future()
+        )
+
+        def _on_sent(future: Future[Any]) -> None:
+            exc = (
+                ConnectionError("send cancelled")
+                if future.cancelled()
+                else future.exception()
+            )
+            with contextlib.suppress(InvalidStateError):
+                if exc is not None:
+                    result.set_exception(exc)
+                elif response is None:
+                    result.set_result(None)
+
+        def _forget(_: Future[Any]) -> None:
+            self._forget_request(request_id)
+
+        if response is not None:
+            result.add_done_callback(_forget)
+        sent.add_done_callback(_on_sent)
+        return result
+
+    def _submit(
+        self,
+        method: str,
+        params: dict[str, Any],
+        buffers: list[Any] | None,
+        wait_for_response: bool,
+        client: str | None = None,
+        timeout: float | None = None,
+        *,
+        handshake_timeout: float | None = None,
+    ) -> tuple[int, Future[Any], Future[dict[str, Any]] | None]:
+        """Encode and schedule one request on the loop thread.
+
+        Returns ``(request_id, sent, response)``: ``sent`` resolves once
+        the message is written to at least one client (or is dropped by
+        the overflow policy); ``response`` (only when a reply is
+        expected) resolves from :meth:`_dispatch_response`. Blocks for
+        up to ``timeout`` seconds while the send queue is full, and
+        waits for a page as long as the hub's ``handshake_timeout`` or
+        ``handshake_timeout`` here, whichever is shorter.
+        """
+        if not self._connected_event.is_set():
+            limits = (self._hub._handshake_timeout, handshake_timeout)
+            known = [limit for limit in limits if limit is not None]
+            handshake_timeout = min(known) if known else None
+            if handshake_timeout is None:
+                self._connected_event.wait()
+            elif not self._connected_event.wait(timeout=handshake_timeout):
+                raise TimeoutError(
+                    f"No browser handshake after {handshake_timeout}s — "
+                    "cannot send RPC."
+                )
+
+        targets = self._clients
+        if client is not None:
+            targets = [c for c in targets if c.id == client]
+            if not targets:
+                raise ConnectionError(f"Client {client!r} is not attached")
+        loop = self._hub._loop
+        if not targets or loop is None:
+            raise RuntimeError("WebSocket transport is not connected")
+
+        encoder = BinaryPayloadEncoder()
+        encoded_params = encoder.encode(params)
+
+        with self._response_lock:
+            self._request_counter += 1
+            request_id = self._request_counter
+            response: Future[dict[str, Any]] | None = None
+            if wait_for_response:
+                response = Future()
+                self._responses[request_id] = response
+                self._responders[request_id] = targets[0]
+
+        request = JsonRPCRequest(
+            jsonrpc="2.0",
+            method=method,
+            params=encoded_params,
+            id=request_id,
+        )
+
+        # Serialization and buffer compression happen here, on the
+        # calling thread and once per buffer codec in use, however many
+        # clients there are; the loop thread only lays out the frame.
+        # ``encoder`` rides along in the outbox entry and keeps the
+        # ndarrays behind the buffer views alive until the write completes.
+        raw_buffers = [*encoder.buffers, *(buffers or [])]
+        json_bytes = json.dumps(asdict(request)).encode("utf-8")
+        outgoing = _Outgoing(
+            method=method,
+            expects_reply=wait_for_response,
+            nbytes=len(json_bytes)
+            + sum(memoryview(buf).nbytes for buf in raw_buffers),
+            targets=targets,
+            json_bytes=json_bytes,
+            buffers={
+                codec: pack_frame_buffers(
+                    raw_buffers,
+                    version=FRAME_VERSION_V3 if codec else FRAME_VERSION_V1,
+                    codec=codec,
+                )
+                for codec in {c.buffer_codec for c in targets}
+            },
+            owner=encoder,
+        )
+        try:
+            queued = self._enqueue(outgoing, timeout)
+        except BaseException:
+            self._forget_request(request_id)
+            raise
+        if queued:
+            asyncio.run_coroutine_threadsafe(self._flush_outbox(), loop)
+        return request_id, outgoing.sent, response
+
+    def _enqueue(self, item: _Outgoing, timeout: float | None) -> bool:
+        """Admit ``item`` to the outbox under the overflow policy.
+
+        Returns ``False`` when the ``"drop"`` policy discarded it.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._outbox_space:
+            while self._over_high_water(item):
+                if not item.expects_reply:
+                    if self._overflow == "drop":
+                        self._dropped_count += 1
+                        logger.debug("Send queue full; dropped '%s'", item.method)
+                        item.sent.set_result(None)
+                        return False
+                    if self._overflow == "coalesce" and self._coalesce(item):
+                        break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(
+                        f"Send queue still full after {timeout}s; "
+                        f"'{item.method}' not sent"
+                    )
+                self._outbox_space.wait(remaining)
+            self._outbox.append(item)
+            self._queued_messages += 1
+            self._queued_bytes += item.nbytes
+        item.sent.add_done_callback(lambda _: self._release(item))
+        return True
+
+    def _over_high_water(self, item: _Outgoing) -> bool:
+        if not self._queued_messages:
+            return False
+        return (
+            self._max_queued_messages is not None
+            and self._queued_messages >= self._max_queued_messages
+        ) or (
+            self._max_queued_bytes is not None
+            and self._queued_bytes + item.nbytes > self._max_queued_bytes
+        )
+
+    def _coalesce(self, item: _Outgoing) -> bool:
+        """Retire the newest unwritten request ``item`` supersedes, if any."""
+        for index in range(len(self._outbox) - 1, -1, -1):
+            queued = self._outbox[index]
+            if (
+                not queued.expects_reply
+                and queued.method == item.method
+                and queued.targets == item.targets
+            ):
+                del self._outbox[index]
+                queued.superseded = True
+                self._coalesced_count += 1
+                _settle([queued], None)
+                return True
+        return False
+
+    def _release(self, item: _Outgoing) -> None:
+        """Account for an entry leaving the queue and wake blocked senders."""
+        with self._outbox_space:
+            self._queued_messages -= 1
+            self._queued_bytes -= item.nbytes
+            if not item.superseded and item.sent.exception() is None:
+                latency = time.perf_counter() - item.queued_at
+                self._sent_count += 1
+                self._drain_latency = (
+                    latency
+                    if self._sent_count == 1
+                    else self._drain_latency
+                    + _LATENCY_ALPHA * (latency - self._drain_latency)
+                )
+                self._max_drain_latency = max(self._max_drain_latency, latency)
+            self._outbox_space.notify_all()
+
+    async def _flush_outbox(self) -> None:
+        """Write every queued request, batching them when the page can.
+
+        One flush is scheduled per request, but the first to run drains
+        the whole outbox: requests queued while an earlier write was in
+        flight go out together as one JSON-RPC batch array. Flushes that
+        find the outbox empty return immediately. Clients are written to
+        concurrently, each in queue order; a request counts as sent once
+        any of its targets took it.
+        """
+        # Coroutines scheduled from other threads start in submission
+        # order; the (FIFO) lock keeps a fragmented message from being
+        # overtaken while it awaits between fragments.
+        if self._send_lock is None:
+            self._send_lock = asyncio.Lock()
+        async with self._send_lock:
+            with self._outbox_lock:
+                pending, self._outbox = self._outbox, []
+            delivered: set[_Outgoing] = set()
+            errors: dict[_Outgoing, BaseException] = {}
+            messages: dict[tuple[Any, ...], Any] = {}
+            try:
+                clients = dict.fromkeys(c for item in pending for c in item.targets)
+                await asyncio.gather(
+                    *(
+                        self._write_to(
+                            client,
+                            [item for item in pending if client in item.targets],
+                            messages,
+                            delivered,
+                            errors,
+                        )
+                        for client in clients
+                    )
+                )
+                for item in pending:
+                    _settle([item], None if item in delivered else errors.get(item))
+            finally:
+                # Only reached with unsettled entries when the loop is
+                # shutting down mid-write.
+                _settle(pending, ConnectionError("send cancelled"))
+
+    async def _write_to(
+        self,
+        client: _Client,
+        items: list[_Outgoing],
+        messages: dict[tuple[Any, ...], Any],
+        delivered: set[_Outgoing],
+        errors: dict[_Outgoing, BaseException],
+    ) -> None:
+        """Write ``items`` to one client, reusing frames built for others."""
+        for group in self._frame_groups(client, items):
+            key = (
+                *map(id, group),
+                client.frame_version,
+                client.buffer_codec,
+            )
+            message = messages.get(key)
+            if message is None:
+                message = messages[key] = self._frame_message(client, group)
+            try:
+                await client.ws.send(message)
+            except Exception as exc:
+                for item in group:
+                    errors.setdefault(item, exc)
+            else:
+                delivered.update(group)
+
+    @staticmethod
+    def _frame_groups(
+        client: _Client, items: list[_Outgoing]
+    ) -> list[list[_Outgoing]]:
+        """Split one client's queued requests into the frames they go out as."""
+        if not client.rpc_batch or len(items) < 2:
+            return [[item] for item in items]
+        return [items]
+
+    @staticmethod
+    def _frame_message(client: _Client, group: list[_Outgoing]) -> Any:
+        packed = [item.buffers[client.buffer_codec] for item in group]
+        if len(group) == 1:
+            json_bytes, buffers = group[0].json_bytes, packed[0]
+        else:
+            json_bytes, buffers = join_rpc_batch(
+                [(item.json_bytes, bufs) for item, bufs in zip(group, packed)]
+            )
+        if not buffers:
+            return json_bytes.decode("utf-8")
+        # Hand websockets the header + JSON and the original ndarray
+        # views as fragments of one message instead of concatenating
+        # them first.
+        return assemble_frame_parts(
+            json_bytes, buffers, version=client.frame_version
+        )
+
+    def _forget_request(self, request_id: int) -> None:
+        with self._response_lock:
+            self._responses.pop(request_id, None)
+            self._responders.pop(request_id, None)
+
+    # ------------------------------------------------------------------
+    # Inbound — browser → main thread
+    # ------------------------------------------------------------------
+
+    def _decode_inbound(self, message: Any) -> list[_Inbound]:
+        """Parse and decode one WebSocket message, batch entries included.
+
+        Depends only on the message, so large ones run on the hub's
+        decode pool (see :meth:`TransportHub._decode`).
+        """
+        if isinstance(message, bytes):
+            try:
+                json_payload, buffers = decode_binary_frame(message)
+            except Exception as exc:  # pragma: no cover
+                logger.warning("Failed to decode binary frame: %s", exc)
+                return []
+        elif isinstance(message, str):
+            try:
+                json_payload = json.loads(message)
+            except json.JSONDecodeError as exc:
+                logger.debug("Ignoring non-JSON text message: %s", exc)
+                return []
+            buffers = []
+        else:
+            logger.debug("Ignoring unexpected WS message type: %s", type(message))
+            return []
+
+        if isinstance(json_payload, list):
+            # JSON-RPC batch: refs in each entry index into the frame's
+            # buffers from its ``buffer_offset`` on.
+            decoded: list[_Inbound] = []
+            for entry in json_payload:
+                if not isinstance(entry, dict):
+                    logger.debug("Ignoring non-object batch entry")
+                    continue
+                offset = int(entry.pop("buffer_offset", 0) or 0)
+                item = self._decode_message(entry, buffers[offset:])
+                if item is not None:
+                    decoded.append(item)
+            return decoded
+        if not isinstance(json_payload, dict):
+            logger.debug("Ignoring non-object JSON payload")
+            return []
+        item = self._decode_message(json_payload, buffers)
+        return [] if item is None else [item]
+
+    def _decode_message(
+        self, payload: dict[str, Any], buffers: list[Any]
+    ) -> _Inbound | None:
+        # JSON-RPC notification: has method, no id.
+        if "method" in payload and "id" not in payload:
+            method = payload.get("method")
+            if not isinstance(method, str):
+                return None
+            raw_params = payload.get("params") or {}
+            try:
+                params = self._decoder.decode(raw_params, buffers)
+            except Exception as exc:
+                logger.warning("Failed to decode notification '%s': %s", method, exc)
+                return None
+            return _Inbound(
+                method=method, payload=params if isinstance(params, dict) else {}
+            )
+
+        # Otherwise treat as response.
+        try:
+            decoded = self._decoder.decode(payload, buffers)
+        except Exception as exc:
+            logger.warning("Failed to decode response: %s", exc)
+            return None
+        if not isinstance(decoded, dict):
+            return None
+        request_id = decoded.get("id")
+        if request_id is None:
+            logger.debug("Dropping response without request id")
+            return None
+        return _Inbound(request_id=int(request_id), payload=decoded)
+
+    async def _pump_inbound(
+        self,
+        inbound: asyncio.Queue[asyncio.Future[list[_Inbound]] | None],
+        client: _Client,
+    ) -> None:
+        """Hand decoded messages over in arrival order, however long each took."""
+        while (pending := await inbound.get()) is not None:
+            try:
+                items = await pending
+            except Exception:
+                logger.exception("Failed to decode inbound message")
+                continue
+            for item in items:
+                if item.method is not None:
+                    self._dispatch_notification(item.method, item.payload, client)
+                elif item.request_id is not None:
+                    self._dispatch_response(item.request_id, item.payload, client)
+
+    def _dispatch_notification(
+        self, method: str, params: dict[str, Any], client: _Client
+    ) -> None:
+        if self._event_bus is None:
+            return
+        pool = self._hub._listener_pool
+        if pool is None:
+            return
+        # Listeners run on the hub's listener pool, one event name at a
+        # time, so a slow callback cannot hold up the loop or reorder
+        # events of the same name.
+        self._listeners.submit(
+            pool, method, self._notify, method, params, client.id
+        )
+
+    def _notify(self, method: str, params: dict[str, Any], origin: str) -> None:
+        bus = self._event_bus
+        if bus is None:
+            return
+        self._origin.value = origin
+        try:
+            bus.dispatch(method, params)
+        except Exception:
+            logger.exception("Event bus raised while dispatching '%s'", method)
+        finally:
+            self._origin.value = None
+
+    def _dispatch_response(
+        self, request_id: int, decoded: dict[str, Any], client: _Client
+    ) -> None:
+        with self._response_lock:
+            future = self._responses.get(request_id)
+            responder = self._responders.get(request_id)
+        if future is None:
+            logger.debug("No waiter for request id %s", request_id)
+            return
+        if responder is not client:
+            # Every client answers a broadcast; only one reply counts.
+            return
+        with contextlib.suppress(InvalidStateError):
+            future.set_result(decoded)
+
+    # ------------------------------------------------------------------
+    # Attached pages — run on the hub's loop thread
+    # ------------------------------------------------------------------
+
+    async def _serve(self, ws: Any, hello: dict[str, Any]) -> None:
+        """Answer a validated hello and pump the page's messages until it leaves."""
+        if self._max_clients is not None and len(self._clients) >= self._max_clients:
+            await ws.close(1013, "too many clients")
+            return
+        frame_version = _negotiate_frame_version(hello.get("frame_versions"))
+        self._client_counter += 1
+        client = _Client(
+            id=f"client-{self._client_counter}",
+            ws=ws,
+            session=str(hello.get("session") or "default"),
+            frame_version=frame_version,
+            buffer_codec=_negotiate_buffer_codec(
+                self._buffer_codec, hello.get("buffer_codecs"), frame_version
+            ),
+            rpc_batch=hello.get("rpc_batch") is True,
+        )
+        ready: dict[str, Any] = {"type": "ready"}
+        if client.frame_version != FRAME_VERSION_V1:
+            ready["frame_version"] = client.frame_version
+        if client.buffer_codec is not None:
+            ready["buffer_codec"] = client.buffer_codec
+        await ws.send(json.dumps(ready))
+        self._attach(client)
+        # Messages are decoded concurrently (large ones on the hub's
+        # decode pool) while the pump delivers them in arrival order.
+        inbound: asyncio.Queue[asyncio.Future[list[_Inbound]] | None] = (
+            asyncio.Queue(_INBOUND_WINDOW)
+        )
+        pump = asyncio.create_task(self._pump_inbound(inbound, client))
+        try:
+            async for message in ws:
+                await inbound.put(self._hub._decode(self._decode_inbound, message))
+        finally:
+            if not pump.done():
+                await inbound.put(None)
+                await pump
+            self._detach(client)
+
+    def _attach(self, client: _Client) -> None:
+        self._clients = [*self._clients, client]
+        # Reset the disconnect event so a re-connect (e.g. React
+        # StrictMode's dev double-mount) does not leave stale state
+        # that would trip the next wait_for_disconnection().
+        self._disconnected_event.clear()
+        self._connected_event.set()
+
+    def _detach(self, client: _Client) -> None:
+        self._clients = [c for c in self._clients if c is not client]
+        # Requests only this client could answer will never resolve.
+        with self._response_lock:
+            orphaned = [
+                self._responses[request_id]
+                for request_id, responder in self._responders.items()
+                if responder is client and request_id in self._responses
+            ]
+        for future in orphaned:
+            with contextlib.suppress(InvalidStateError):
+                future.set_exception(
+                    ConnectionError(f"Client {client.id!r} disconnected")
+                )
+        if not self._clients:
+            self._connected_event.clear()
+            self._disconnected_event.set()
+
+
+def _negotiate_frame_version(offered: Any) -> int:
+    """Pick the newest binary-frame version both ends understand.
+
+    Older pages send no ``frame_versions`` at all and fall back to v1.
+    """
+    if not isinstance(offered, list):
+        return FRAME_VERSION_V1
+    common = [
+        v for v in offered if isinstance(v, int) and v in SUPPORTED_FRAME_VERSIONS
+    ]
+    return max(common, default=FRAME_VERSION_V1)
+
+
+@dataclass(frozen=True, slots=True)
+class _Inbound:
+    """One decoded notification (``method``) or response (``request_id``)."""
+
+    payload: dict[str, Any]
+    method: str | None = None
+    request_id: int | None = None
+
+
+class _SerialByKey:
+    """Run tasks on a shared pool, one at a time and in order per key."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._backlog: dict[Hashable, deque[tuple[Callable[..., None], tuple]]] = {}
+
+    def submit(
+        self, pool: Executor, key: Hashable, fn: Callable[..., None], *args: Any
+    ) -> None:
+        with self._lock:
+            backlog = self._backlog.get(key)
+            if backlog is not None:
+                backlog.append((fn, args))
+                return
+            self._backlog[key] = deque()
+        self._start(pool, key, fn, args)
+
+    def _start(
+        self, pool: Executor, key: Hashable, fn: Callable[..., None], args: tuple
+    ) -> None:
+        try:
+            pool.submit(self._run, pool, key, fn, args)
+        except RuntimeError:  # pool shut down
+            with self._lock:
+                self._backlog.pop(key, None)
+
+    def _run(
+        self, pool: Executor, key: Hashable, fn: Callable[..., None], args: tuple
+    ) -> None:
+        try:
+            fn(*args)
+        except Exception:
+            logger.exception("Task for %r raised", key)
+        with self._lock:
+            backlog = self._backlog[key]
+            if not backlog:
+                del self._backlog[key]
+                return
+            fn, args = backlog.popleft()
+        # Resubmit rather than loop, so one busy key cannot hog a worker.
+        self._start(pool, key, fn, args)
+
+
+@dataclass(eq=False)
+class _Client:
+    """One attached page and the wire format negotiated with it."""
+
+    id: str
+    ws: Any
+    session: str
+    frame_version: int = FRAME_VERSION_V1
+    buffer_codec: str | None = None
+    rpc_batch: bool = False
+
+
+@dataclass(eq=False)
+class _Outgoing:
+    """One encoded request waiting in the outbox.
+
+    ``buffers`` holds the packed buffers per buffer codec in use among
+    ``targets``; the JSON is shared by all of them. ``nbytes`` (JSON
+    plus raw buffers) is what the entry counts against the queue's
+    byte high-water mark.
+    """
+
+    method: str
+    expects_reply: bool
+    nbytes: int
+    targets: list[_Client]
+    json_bytes: bytes
+    buffers: dict[str | None, list[tuple[memoryview | bytes, int]]]
+    owner: Any
+    sent: Future[None] = field(default_factory=Future)
+    queued_at: float = field(default_factory=time.perf_counter)
+    # Set when a newer request replaced this one under "coalesce".
+    superseded: bool = False
+
+
+def _settle(items: list[_Outgoing], exc: BaseException | None) -> None:
+    """Resolve each unsettled ``sent`` future with ``exc`` (or success)."""
+    for item in items:
+        if item.sent.done():
+            continue
+        if exc is None:
+            item.sent.set_result(None)
+        else:
+            item.sent.set_exception(exc)
+
+
+def _negotiate_buffer_codec(
+    requested: str | None, offered: Any, frame_version: int
+) -> str | None:
+    """Return ``requested`` if the page can decode it over this connection.
+
+    Buffer codecs are flagged in the v3 frame header, so a page that did
+    not negotiate v3 (or did not list the codec) gets raw buffers.
+    """
+    if requested is None:
+        return None
+    if (
+        frame_version != FRAME_VERSION_V3
+        or not isinstance(offered, list)
+        or requested not in offered
+    ):
+        logger.info("Page cannot decode %s buffers; sending raw", requested)
+        return None
+    return requested
+
+
+def _deflate_extensions(max_size: int) -> list[Any]:
+    """permessage-deflate limited to text and small binary messages.
+
+    websockets deflates every message once the extension is negotiated,
+    including multi-megabyte coordinate buffers that barely compress.
+    RFC 7692 flags compression per message (RSV1 on the first frame), so
+    the wrapped extension can leave large or fragmented binary messages
+    untouched while the page keeps inflating the rest.
+    """
+    from websockets.extensions.permessage_deflate import (
+        PerMessageDeflate,
+        ServerPerMessageDeflateFactory,
+    )
+    from websockets.frames import CONT, CTRL_OPCODES, Opcode
+
+    class _SmallMessageDeflate(PerMessageDeflate):
+        _passthrough = False
+
+        def encode(self, frame: Any) -> Any:
+            if frame.opcode in CTRL_OPCODES:
+                return frame
+            if frame.opcode is not CONT:
+                self._passthrough = frame.opcode is Opcode.BINARY and (
+                    not frame.fin or len(frame.data) > max_size
+                )
+            if self._passthrough:
+                return frame
+            return super().encode(frame)
+
+    class _Factory(ServerPerMessageDeflateFactory):
+        def process_request_params(self, params: Any, accepted: Any) -> Any:
+            response, ext = super().process_request_params(params, accepted)
+            return response, _SmallMessageDeflate(
+                ext.remote_no_context_takeover,
+                ext.local_no_context_takeover,
+                ext.remote_max_window_bits,
+                ext.local_max_window_bits,
+                ext.compress_settings,
+            )
+
+    # Same settings websockets uses for compression="deflate".
+    return [
+        _Factory(
+            server_max_window_bits=12,
+            client_max_window_bits=12,
+            compress_settings={"memLevel": 5},
+        )
+    ]
+
+
 class _HandshakeError(Exception):
     """Raised inside the WS handler when the hello frame is invalid."""
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import Future
 from typing import Any, Protocol, runtime_checkable
 
 
@@ -13,6 +14,10 @@ class Transport(Protocol):
     The sole concrete implementation today is
     :class:`~molvis.transport.WebSocketTransport`; command mixins depend
     only on this Protocol so test fakes can be swapped in freely.
+
+    A transport may also offer ``send_request_nowait`` (see
+    :class:`PipelinedTransport`). It is optional: ``Molvis`` detects it
+    and falls back to :meth:`send_request` when it is missing.
     """
 
     def send_request(
@@ -38,3 +43,30 @@ class Transport(Protocol):
             otherwise None.
         """
         ...
+
+
+@runtime_checkable
+class PipelinedTransport(Transport, Protocol):
+    """A :class:`Transport` that can queue requests without blocking.
+
+    :meth:`Molvis.batch` and :meth:`Molvis.send_cmd_async` use this to
+    keep many requests in flight.
+    """
+
+    def send_request_nowait(
+        self,
+        method: str,
+        params: dict[str, Any],
+        *,
+        buffers: list[Any] | None = None,
+        wait_for_response: bool = False,
+        timeout: float | None = None,
+    ) -> Future[dict[str, Any] | None]:
+        """Send a JSON-RPC request without waiting for the write or reply.
+
+        Requests are written in call order. The returned future resolves
+        to the response dict when *wait_for_response* is True, otherwise
+        to None once the request has been written. The call may still
+        wait for a connection or queue space; *timeout* bounds that wait.
+        """
+        ...
@@ -13,21 +13,31 @@ class BinaryBufferRef:
     index: int
     dtype: str
     shape: tuple[int, ...]
+    # Fixed-point buffers decode to ``offset + value * scale``.
+    scale: float | None = None
+    offset: float | None = None
 
     def to_json(self) -> dict[str, Any]:
-        return {
+        payload: dict[str, Any] = {
             BUFFER_REF_MARKER: True,
             "index": self.index,
             "dtype": self.dtype,
             "shape": list(self.shape),
         }
+        if self.scale is not None:
+            payload["scale"] = self.scale
+            payload["offset"] = self.offset or 0.0
+        return payload
 
     @classmethod
     def from_json(cls, payload: dict[str, Any]) -> "BinaryBufferRef":
+        scale = payload.get("scale")
         return cls(
             index=int(payload["index"]),
             dtype=str(payload["dtype"]),
             shape=tuple(int(dim) for dim in payload.get("shape", [])),
+            scale=float(scale) if scale is not None else None,
+            offset=float(payload.get("offset", 0.0)) if scale is not None else None,
         )
 
     @classmethod
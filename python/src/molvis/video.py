@@ -1,4 +1,4 @@
-"""Pipe a stream of PNG frames into ffmpeg to produce a video file."""
+"""Pipe a stream of PNG or raw RGBA frames into ffmpeg to produce a video file."""
 
 from __future__ import annotations
 
@@ -6,6 +6,7 @@ import shutil
 import subprocess
 from collections.abc import Iterable
 from pathlib import Path
+from typing import Literal
 
 __all__ = ["FfmpegNotFoundError", "write_video"]
 
@@ -39,16 +40,19 @@ def write_video(
     codec: str = "libx264",
     crf: int = 18,
     pix_fmt: str = "yuv420p",
+    frame_format: Literal["png", "rgba"] = "png",
+    size: tuple[int, int] | None = None,
     extra_args: list[str] | None = None,
 ) -> Path:
-    """Encode ``frames`` (PNG bytes) into a video at ``path`` via ffmpeg.
+    """Encode ``frames`` into a video at ``path`` via ffmpeg.
 
     Defaults produce a browser-playable mp4 (``yuv420p`` + ``+faststart``).
     The function streams frames into ffmpeg's stdin, so memory usage stays
     bounded regardless of trajectory length.
 
     Args:
-        frames: Iterable of PNG byte payloads (e.g. ``viewer.snapshot()``).
+        frames: Iterable of PNG byte payloads (e.g. ``viewer.snapshot()``),
+            or of raw RGBA pixels when ``frame_format="rgba"``.
         path: Output file path; parent directory must exist.
         fps: Output frame rate.
         codec: ffmpeg ``-c:v`` codec name.
@@ -56,6 +60,10 @@ def write_video(
             lossless for libx264).
         pix_fmt: Pixel format. ``yuv420p`` is required for QuickTime /
             browser playback.
+        frame_format: ``"png"`` decodes each frame as a PNG; ``"rgba"``
+            reads ``width * height * 4`` bytes per frame as rawvideo,
+            which skips PNG encoding in the browser and decoding here.
+        size: ``(width, height)`` of every frame; required for ``"rgba"``.
         extra_args: Additional ffmpeg arguments inserted before the output
             path (e.g. ``["-vf", "scale=1920:1080"]``).
 
@@ -65,7 +73,28 @@ def write_video(
     Raises:
         FfmpegNotFoundError: If ``ffmpeg`` is not available on PATH.
         RuntimeError: If ffmpeg exits with a non-zero status.
+        ValueError: If ``frame_format`` is unknown, or ``"rgba"`` is
+            given without ``size``.
     """
+    if frame_format == "png":
+        input_args = ["-f", "image2pipe", "-vcodec", "png"]
+    elif frame_format == "rgba":
+        if size is None:
+            raise ValueError('write_video(frame_format="rgba") requires size')
+        width, height = size
+        input_args = [
+            "-f",
+            "rawvideo",
+            "-pix_fmt",
+            "rgba",
+            "-s",
+            f"{int(width)}x{int(height)}",
+        ]
+    else:
+        raise ValueError(
+            f"frame_format must be 'png' or 'rgba', got {frame_format!r}"
+        )
+
     executable = _find_ffmpeg_executable()
     if executable is None:
         raise FfmpegNotFoundError(
@@ -81,10 +110,7 @@ def write_video(
         "-y",
         "-loglevel",
         "error",
-        "-f",
-        "image2pipe",
-        "-vcodec",
-        "png",
+        *input_args,
         "-r",
         str(fps),
         "-i",
@@ -109,8 +135,8 @@ def write_video(
     assert proc.stdin is not None and proc.stderr is not None
 
     try:
-        for png in frames:
-            proc.stdin.write(png)
+        for frame in frames:
+            proc.stdin.write(frame)
         proc.stdin.close()
         rc = proc.wait()
         if rc != 0:
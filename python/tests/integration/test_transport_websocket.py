@@ -104,6 +104,28 @@ def test_handshake_with_good_token_succeeds() -> None:
     assert json.loads(received) == {"type": "ready"}
 
 
+def test_handshake_negotiates_frame_version_when_offered() -> None:
+    async def run(tport: WebSocketTransport) -> str:
+        uri = f"ws://localhost:{tport.port}/ws"
+        async with ws_connect(uri) as ws:
+            await ws.send(
+                json.dumps(
+                    {
+                        "type": "hello",
+                        "token": "test-token",
+                        "session": "s",
+                        "frame_versions": [1, 2, 99],
+                    }
+                )
+            )
+            msg = await asyncio.wait_for(ws.recv(), timeout=2.0)
+        return msg
+
+    with running_transport() as (tport, _bus):
+        received = _run(run(tport))
+    assert json.loads(received) == {"type": "ready", "frame_version": 2}
+
+
 def test_handshake_with_bad_token_is_closed_with_1008() -> None:
     async def run(tport: WebSocketTransport) -> tuple[int, str]:
         uri = f"ws://localhost:{tport.port}/ws"
@@ -230,3 +252,514 @@ def test_send_request_rpc_round_trip() -> None:
     assert request["method"] == "state.get"
     assert request["params"] == {"probe": 7}
     assert result_holder["response"]["result"] == {"echoed": {"probe": 7}}
+
+
+def test_buffer_codec_compresses_large_buffers_when_page_offers_it() -> None:
+    import numpy as np
+
+    from molvis.transport import decode_binary_frame
+
+    async def run_client(tport: WebSocketTransport) -> tuple[dict, bytes, list]:
+        uri = f"ws://localhost:{tport.port}/ws"
+        async with ws_connect(uri) as ws:
+            await ws.send(
+                json.dumps(
+                    {
+                        "type": "hello",
+                        "token": "test-token",
+                        "session": "s",
+                        "frame_versions": [1, 2, 3],
+                        "buffer_codecs": ["deflate"],
+                    }
+                )
+            )
+            ready = json.loads(await asyncio.wait_for(ws.recv(), timeout=2.0))
+            frame = await asyncio.wait_for(ws.recv(), timeout=2.0)
+            return ready, frame, list(ws.protocol.extensions)
+
+    coords = np.zeros(50_000, dtype=np.float32)
+
+    def run_server_side(tport: WebSocketTransport) -> None:
+        tport.wait_for_connection(timeout=5)
+        tport.send_request("scene.draw_frame", {"x": coords})
+
+    with running_transport(buffer_codec="deflate") as (tport, _bus):
+        server_thread = threading.Thread(
+            target=run_server_side, args=(tport,), daemon=True
+        )
+        server_thread.start()
+        ready, frame, extensions = _run(run_client(tport))
+        server_thread.join(timeout=5)
+
+    assert ready == {"type": "ready", "frame_version": 3, "buffer_codec": "deflate"}
+    assert [ext.name for ext in extensions] == ["permessage-deflate"]
+    assert frame[:4] == b"MVB3"
+    assert len(frame) < coords.nbytes // 10
+    _payload, buffers = decode_binary_frame(frame)
+    assert buffers == [coords.tobytes()]
+
+
+def test_pipelined_requests_resolve_by_id_in_any_reply_order() -> None:
+    async def run_client(tport: WebSocketTransport) -> list[str]:
+        uri = f"ws://localhost:{tport.port}/ws"
+        async with ws_connect(uri) as ws:
+            await ws.send(
+                json.dumps(
+                    {"type": "hello", "token": "test-token", "session": "s"}
+                )
+            )
+            await asyncio.wait_for(ws.recv(), timeout=2.0)
+            requests = [
+                json.loads(await asyncio.wait_for(ws.recv(), timeout=2.0))
+                for _ in range(3)
+            ]
+            # Reply only after all three arrived, newest first.
+            for request in reversed(requests):
+                await ws.send(
+                    json.dumps(
+                        {
+                            "jsonrpc": "2.0",
+                            "id": request["id"],
+                            "result": request["method"],
+                        }
+                    )
+                )
+            await asyncio.sleep(0.05)
+            return [r["method"] for r in requests]
+
+    results: list = []
+
+    def run_server_side(tport: WebSocketTransport) -> None:
+        tport.wait_for_connection(timeout=5)
+        futures = [
+            tport.send_request_nowait(m, {}, wait_for_response=True)
+            for m in ("a.one", "a.two", "a.three")
+        ]
+        results.extend(f.result(timeout=5)["result"] for f in futures)
+
+    with running_transport() as (tport, _bus):
+        server_thread = threading.Thread(
+            target=run_server_side, args=(tport,), daemon=True
+        )
+        server_thread.start()
+        order = _run(run_client(tport))
+        server_thread.join(timeout=5)
+
+    assert order == ["a.one", "a.two", "a.three"]
+    assert results == ["a.one", "a.two", "a.three"]
+
+
+def test_requests_queued_behind_a_write_go_out_as_one_batch() -> None:
+    import numpy as np
+
+    from molvis.transport import (
+        BinaryPayloadEncoder,
+        decode_binary_frame,
+        encode_binary_frame,
+        join_rpc_batch,
+    )
+
+    async def run_client(tport: WebSocketTransport) -> list:
+        uri = f"ws://localhost:{tport.port}/ws"
+        async with ws_connect(uri, max_size=None) as ws:
+            await ws.send(
+                json.dumps(
+                    {
+                        "type": "hello",
+                        "token": "test-token",
+                        "session": "s",
+                        "rpc_batch": True,
+                    }
+                )
+            )
+            await asyncio.wait_for(ws.recv(), timeout=2.0)
+            frames = []
+            received = 0
+            while received < 3:
+                frame = await asyncio.wait_for(ws.recv(), timeout=2.0)
+                payload = (
+                    decode_binary_frame(frame)[0]
+                    if isinstance(frame, bytes)
+                    else json.loads(frame)
+                )
+                frames.append(payload)
+                received += len(payload) if isinstance(payload, list) else 1
+            # One batched reply for all three, each with its own buffer.
+            replies = []
+            for request_id in (1, 2, 3):
+                encoder = BinaryPayloadEncoder()
+                result = encoder.encode({"n": np.array([request_id], np.uint8)})
+                reply = {"jsonrpc": "2.0", "id": request_id, "result": result}
+                replies.append((json.dumps(reply).encode(), encoder.buffers))
+            await ws.send(encode_binary_frame(*join_rpc_batch(replies)))
+            await asyncio.sleep(0.05)
+            return frames
+
+    results: list = []
+
+    def run_server_side(tport: WebSocketTransport) -> None:
+        tport.wait_for_connection(timeout=5)
+        # The first write is large enough that the requests after it are
+        # queued (at the latest) while it is still in flight.
+        bulk = np.zeros(4_000_000, dtype=np.float32)
+        futures = [
+            tport.send_request_nowait("a.bulk", {"x": bulk}, wait_for_response=True),
+            tport.send_request_nowait("a.one", {}, wait_for_response=True),
+            tport.send_request_nowait("a.two", {}, wait_for_response=True),
+        ]
+        results.extend(
+            int(f.result(timeout=5)["result"]["n"][0]) for f in futures
+        )
+
+    with running_transport(compression=None) as (tport, _bus):
+        server_thread = threading.Thread(
+            target=run_server_side, args=(tport,), daemon=True
+        )
+        server_thread.start()
+        frames = _run(run_client(tport))
+        server_thread.join(timeout=5)
+
+    requests = [
+        entry
+        for frame in frames
+        for entry in (frame if isinstance(frame, list) else [frame])
+    ]
+    assert any(isinstance(frame, list) for frame in frames)
+    assert [r["method"] for r in requests] == ["a.bulk", "a.one", "a.two"]
+    assert results == [1, 2, 3]
+
+
+def test_requests_fan_out_to_every_client_and_the_primary_answers() -> None:
+    bus = EventBus()
+    origins: list[str | None] = []
+    pinged = threading.Event()
+
+    def on_ping(_params: dict) -> None:
+        origins.append(tport.event_origin)
+        pinged.set()
+
+    bus.on("ping", on_ping)
+    hello = json.dumps({"type": "hello", "token": "test-token", "session": "s"})
+
+    async def run_client(tport: WebSocketTransport) -> tuple[Any, Any, Any, bool]:
+        uri = f"ws://localhost:{tport.port}/ws"
+        async with ws_connect(uri) as first, ws_connect(uri) as second:
+            for ws in (first, second):
+                await ws.send(hello)
+                await asyncio.wait_for(ws.recv(), timeout=2.0)
+            await second.send(
+                json.dumps({"jsonrpc": "2.0", "method": "event.ping", "params": {}})
+            )
+            raw_first = await asyncio.wait_for(first.recv(), timeout=2.0)
+            raw_second = await asyncio.wait_for(second.recv(), timeout=2.0)
+            request_id = json.loads(raw_first)["id"]
+            # The non-primary client answers first; its reply is ignored.
+            for ws, answer in ((second, "second"), (first, "primary")):
+                await ws.send(
+                    json.dumps({"jsonrpc": "2.0", "id": request_id, "result": answer})
+                )
+            targeted = await asyncio.wait_for(second.recv(), timeout=2.0)
+            try:
+                await asyncio.wait_for(first.recv(), timeout=0.2)
+                first_idle = False
+            except asyncio.TimeoutError:
+                first_idle = True
+            return raw_first, raw_second, targeted, first_idle
+
+    results: dict = {}
+
+    def run_server_side(tport: WebSocketTransport) -> None:
+        pinged.wait(timeout=5)
+        results["count"] = tport.client_count
+        results["reply"] = tport.send_request(
+            "state.get", {}, wait_for_response=True, timeout=5.0
+        )
+        tport.send_request("only.second", {}, client=origins[0])
+
+    with running_transport(event_bus=bus) as (tport, _b):
+        server_thread = threading.Thread(
+            target=run_server_side, args=(tport,), daemon=True
+        )
+        server_thread.start()
+        raw_first, raw_second, targeted, first_idle = _run(run_client(tport))
+        server_thread.join(timeout=5)
+        time.sleep(0.05)
+        assert tport.client_count == 0
+
+    assert results["count"] == 2
+    assert raw_first == raw_second
+    assert results["reply"]["result"] == "primary"
+    assert json.loads(targeted)["method"] == "only.second"
+    assert first_idle
+
+
+def test_max_clients_rejects_extra_connections() -> None:
+    hello = json.dumps({"type": "hello", "token": "test-token", "session": "s"})
+
+    async def run(tport: WebSocketTransport) -> tuple[int, str]:
+        uri = f"ws://localhost:{tport.port}/ws"
+        async with ws_connect(uri) as first:
+            await first.send(hello)
+            await asyncio.wait_for(first.recv(), timeout=2.0)
+            async with ws_connect(uri) as extra:
+                await extra.send(hello)
+                try:
+                    await asyncio.wait_for(extra.recv(), timeout=2.0)
+                except ConnectionClosed as closed:
+                    rcvd = getattr(closed, "rcvd", None)
+                    code = rcvd.code if rcvd is not None else closed.code
+                    reason = rcvd.reason if rcvd is not None else closed.reason
+                    return code, reason
+            return (0, "unexpected-open")
+
+    with running_transport(max_clients=1) as (tport, _bus):
+        code, reason = _run(run(tport))
+    assert code == 1013
+    assert reason == "too many clients"
+
+
+def test_hub_routes_sessions_to_their_transports_on_one_port() -> None:
+    from molvis.transport import TransportHub
+
+    hub = TransportHub(token="test-token")
+    buses = {name: EventBus() for name in ("a", "b")}
+    seen: list[tuple[str, dict]] = []
+    for name, bus in buses.items():
+        bus.on("ping", lambda ev, name=name: seen.append((name, ev)))
+    transports = {
+        name: hub.transport(name, event_bus=bus) for name, bus in buses.items()
+    }
+
+    def hello(session: str) -> str:
+        return json.dumps({"type": "hello", "token": "test-token", "session": session})
+
+    async def run() -> tuple[Any, Any, int]:
+        uri = f"ws://localhost:{hub.port}/ws"
+        async with ws_connect(uri) as a, ws_connect(uri) as b:
+            for ws, session in ((a, "a"), (b, "b")):
+                await ws.send(hello(session))
+                await asyncio.wait_for(ws.recv(), timeout=2.0)
+                await ws.send(
+                    json.dumps(
+                        {
+                            "jsonrpc": "2.0",
+                            "method": "event.ping",
+                            "params": {"from": session},
+                        }
+                    )
+                )
+            transports["b"].wait_for_connection(timeout=2)
+            await asyncio.to_thread(transports["b"].send_request, "only.b", {})
+            to_b = await asyncio.wait_for(b.recv(), timeout=2.0)
+            try:
+                await asyncio.wait_for(a.recv(), timeout=0.2)
+                to_a = None
+            except asyncio.TimeoutError:
+                to_a = "idle"
+        async with ws_connect(uri) as stranger:
+            await stranger.send(hello("c"))
+            try:
+                await asyncio.wait_for(stranger.recv(), timeout=2.0)
+                code = 0
+            except ConnectionClosed as closed:
+                rcvd = getattr(closed, "rcvd", None)
+                code = rcvd.code if rcvd is not None else closed.code
+        return to_a, to_b, code
+
+    try:
+        assert transports["a"].start() == transports["b"].start() == hub.port
+        threads = [t for t in threading.enumerate() if t.name == "molvis-transport"]
+        to_a, to_b, code = _run(run())
+        time.sleep(0.05)
+        assert len(threads) == 1
+        assert transports["a"].port == hub.port
+        assert sorted(hub.sessions) == ["a", "b"]
+        assert to_a == "idle"
+        assert json.loads(to_b)["method"] == "only.b"
+        assert code == 1008
+        assert sorted(seen, key=lambda item: item[0]) == [
+            ("a", {"from": "a"}),
+            ("b", {"from": "b"}),
+        ]
+
+        transports["a"].stop()
+        assert hub.sessions == ["b"]
+        assert hub.port > 0
+        with pytest.raises(ValueError, match="already has a transport"):
+            hub.transport("b")
+    finally:
+        hub.stop()
+
+
+def test_listeners_run_off_the_loop_in_order_per_event_name() -> None:
+    import numpy as np
+
+    from molvis.transport import BinaryPayloadEncoder, encode_binary_frame
+
+    bus = EventBus()
+    seen: list[tuple[str, int]] = []
+    release = threading.Event()
+
+    def slow(ev: dict) -> None:
+        release.wait(timeout=5)
+        seen.append(("slow", ev["n"]))
+
+    bus.on("slow", slow)
+    bus.on("seq", lambda ev: seen.append(("seq", ev["n"])))
+    hello = json.dumps({"type": "hello", "token": "test-token", "session": "s"})
+
+    def note(method: str, n: int) -> str:
+        return json.dumps({"jsonrpc": "2.0", "method": method, "params": {"n": n}})
+
+    async def run_client(tport: WebSocketTransport) -> None:
+        uri = f"ws://localhost:{tport.port}/ws"
+        async with ws_connect(uri, max_size=None) as ws:
+            await ws.send(hello)
+            await asyncio.wait_for(ws.recv(), timeout=2.0)
+            await ws.send(note("event.slow", 0))
+            await ws.send(note("event.slow", 1))
+            for n in range(20):
+                await ws.send(note("event.seq", n))
+            # Decoded on the worker pool, and past websockets' 1 MiB default.
+            request = json.loads(await asyncio.wait_for(ws.recv(), timeout=2.0))
+            encoder = BinaryPayloadEncoder()
+            result = encoder.encode({"x": np.arange(400_000, dtype=np.float32)})
+            reply = {"jsonrpc": "2.0", "id": request["id"], "result": result}
+            await ws.send(encode_binary_frame(json.dumps(reply).encode(), encoder.buffers))
+            await asyncio.sleep(0.1)
+
+    results: dict = {}
+
+    def run_server_side(tport: WebSocketTransport) -> None:
+        tport.wait_for_connection(timeout=5)
+        results["reply"] = tport.send_request(
+            "state.get", {}, wait_for_response=True, timeout=5.0
+        )
+        # The blocked listener held up neither the other event name nor
+        # the response.
+        deadline = time.monotonic() + 2.0
+        while len(seen) < 20 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        results["before_release"] = list(seen)
+        release.set()
+
+    with running_transport(event_bus=bus) as (tport, _b):
+        server_thread = threading.Thread(
+            target=run_server_side, args=(tport,), daemon=True
+        )
+        server_thread.start()
+        _run(run_client(tport))
+        server_thread.join(timeout=5)
+        time.sleep(0.1)
+
+    x = results["reply"]["result"]["x"]
+    assert x.dtype == np.float32 and x[-1] == 399_999
+    assert results["before_release"] == [("seq", n) for n in range(20)]
+    assert [n for name, n in seen if name == "slow"] == [0, 1]
+
+
+def _binary_reply_client(payload: bytes):
+    """Page that answers the first request with ``payload`` as a buffer."""
+    import numpy as np
+
+    from molvis.transport import BinaryPayloadEncoder, encode_binary_frame
+
+    async def run_client(tport: WebSocketTransport) -> int | None:
+        uri = f"ws://localhost:{tport.port}/ws"
+        async with ws_connect(uri, max_size=None) as ws:
+            await ws.send(
+                json.dumps({"type": "hello", "token": "test-token", "session": "s"})
+            )
+            await asyncio.wait_for(ws.recv(), timeout=2.0)
+            request = json.loads(await asyncio.wait_for(ws.recv(), timeout=2.0))
+            encoder = BinaryPayloadEncoder()
+            result = encoder.encode({"rgba": np.frombuffer(payload, np.uint8)})
+            reply = {"jsonrpc": "2.0", "id": request["id"], "result": result}
+            await ws.send(
+                encode_binary_frame(json.dumps(reply).encode(), encoder.buffers)
+            )
+            try:
+                await asyncio.wait_for(ws.wait_closed(), timeout=0.5)
+            except asyncio.TimeoutError:
+                return None
+            return ws.protocol.close_code
+
+    return run_client
+
+
+def _request_reply(tport: WebSocketTransport, results: dict) -> None:
+    tport.wait_for_connection(timeout=5)
+    try:
+        results["reply"] = tport.send_request(
+            "scene.snapshot", {}, wait_for_response=True, timeout=2.0
+        )
+    except Exception as exc:
+        results["error"] = exc
+
+
+def test_binary_replies_larger_than_one_mib_are_accepted() -> None:
+    # A 1080p RGBA snapshot.
+    payload = bytes(range(256)) * (1920 * 1080 * 4 // 256)
+    results: dict = {}
+
+    with running_transport() as (tport, _bus):
+        server_thread = threading.Thread(
+            target=_request_reply, args=(tport, results), daemon=True
+        )
+        server_thread.start()
+        close_code = _run(_binary_reply_client(payload)(tport))
+        server_thread.join(timeout=5)
+
+    assert close_code is None
+    assert results["reply"]["result"]["rgba"].tobytes() == payload
+
+
+def test_max_message_size_closes_pages_that_exceed_it() -> None:
+    results: dict = {}
+
+    with running_transport(max_message_size=1024) as (tport, _bus):
+        server_thread = threading.Thread(
+            target=_request_reply, args=(tport, results), daemon=True
+        )
+        server_thread.start()
+        close_code = _run(_binary_reply_client(bytes(4096))(tport))
+        server_thread.join(timeout=5)
+
+    assert close_code == 1009
+    assert "reply" not in results
+
+
+def test_send_cmd_async_before_a_page_attaches_times_out_off_the_loop() -> None:
+    from molvis import Molvis
+
+    tport = WebSocketTransport(token="test-token", open_browser=False)
+    scene = Molvis(name="async-unattached", transport=tport)
+    ticks = 0
+
+    async def tick() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    async def run() -> float:
+        ticker = asyncio.create_task(tick())
+        start = time.monotonic()
+        try:
+            with pytest.raises(TimeoutError):
+                await scene.send_cmd_async("frame.info", {}, timeout=0.3)
+        finally:
+            ticker.cancel()
+        return time.monotonic() - start
+
+    try:
+        elapsed = asyncio.run(run())
+        # The submit itself also gives up instead of waiting for a page.
+        with pytest.raises(TimeoutError):
+            tport.send_request_nowait("frame.info", {}, timeout=0.05)
+    finally:
+        scene.close()
+
+    assert elapsed < 2.0
+    # The loop kept running while the request waited for a handshake.
+    assert ticks >= 10
@@ -0,0 +1,194 @@
+"""Pipelined commands: ``Molvis.batch()`` and ``Molvis.send_cmd_async``.
+
+A fake transport records whether each request went through the blocking
+``send_request`` or the pipelined ``send_request_nowait`` path and
+answers from a canned response table.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Future
+from typing import Any
+
+import pytest
+
+from molvis import Molvis, MolvisRPCError, Transport
+from molvis.transport import PipelinedTransport
+from molvis.commands import ModifierInfo
+from molvis.events import EventBus
+
+
+class _BlockingTransport:
+    """A transport with only the required ``send_request``."""
+
+    def __init__(self, responses: dict[str, Any]) -> None:
+        self.responses = responses
+        self.log: list[tuple[str, str]] = []
+        self.pending: list[tuple[str, Future]] = []
+        self.auto_reply = True
+
+    def attach_event_bus(self, bus: EventBus) -> None:
+        pass
+
+    def start(self) -> int:
+        return 0
+
+    def stop(self) -> None:
+        return None
+
+    def _reply(self, method: str) -> dict[str, Any]:
+        result = self.responses.get(method, {})
+        if isinstance(result, Exception):
+            error = {"code": -1, "message": str(result)}
+            return {"jsonrpc": "2.0", "id": 1, "error": error}
+        return {"jsonrpc": "2.0", "id": 1, "result": result}
+
+    def send_request(self, method, params, *, wait_for_response=False, **kwargs):
+        self.log.append(("blocking", method))
+        return self._reply(method) if wait_for_response else None
+
+
+class _PipelinedTransport(_BlockingTransport):
+    def send_request_nowait(
+        self, method, params, *, buffers=None, wait_for_response=False, timeout=None
+    ):
+        self.log.append(("pipelined", method))
+        future: Future = Future()
+        if self.auto_reply:
+            future.set_result(self._reply(method) if wait_for_response else None)
+        else:
+            self.pending.append((method, future))
+        return future
+
+
+_MODIFIER = {
+    "id": "m1",
+    "name": "Slice",
+    "category": "Filter",
+    "enabled": True,
+    "selection_scope_id": None,
+    "source_owner_id": None,
+}
+
+
+@pytest.fixture(autouse=True)
+def _reset_registry() -> None:
+    Molvis._scene_registry.clear()
+    yield
+    Molvis._scene_registry.clear()
+
+
+def test_batch_pipelines_commands_and_refreshes_the_pipeline_once() -> None:
+    transport = _PipelinedTransport(
+        {
+            "pipeline.add_modifier": {"modifier": _MODIFIER},
+            "pipeline.list": {"modifiers": [_MODIFIER]},
+        }
+    )
+    scene = Molvis(name="batch", transport=transport)
+
+    with scene.batch() as batch:
+        for atom in range(3):
+            assert scene.mark_atom(atom) is scene
+        added = scene.add_modifier("Slice")
+        scene.set_modifier_enabled("m1", False)
+        assert isinstance(added, Future)
+
+    assert transport.log == [
+        ("pipelined", "overlay.mark_atom"),
+        ("pipelined", "overlay.mark_atom"),
+        ("pipelined", "overlay.mark_atom"),
+        ("pipelined", "pipeline.add_modifier"),
+        ("pipelined", "pipeline.set_enabled"),
+        ("blocking", "pipeline.list"),
+    ]
+    assert len(batch) == 5
+    assert batch.results[:3] == [None, None, None]
+    assert added.result() == ModifierInfo(**_MODIFIER)
+    assert [m.id for m in scene._mirror_pipeline] == ["m1"]
+
+
+def test_batch_mirrors_the_pipeline_from_the_last_reply() -> None:
+    disabled = {**_MODIFIER, "enabled": False}
+    transport = _PipelinedTransport(
+        {
+            "pipeline.add_modifier": {"modifier": _MODIFIER, "pipeline": [_MODIFIER]},
+            "pipeline.set_enabled": {"success": True, "pipeline": [disabled]},
+        }
+    )
+    scene = Molvis(name="batch-reply", transport=transport)
+
+    with scene.batch():
+        scene.add_modifier("Slice")
+        scene.set_modifier_enabled("m1", False)
+
+    assert [method for _, method in transport.log] == [
+        "pipeline.add_modifier",
+        "pipeline.set_enabled",
+    ]
+    assert scene._mirror_pipeline == [ModifierInfo(**disabled)]
+
+
+def test_transports_without_nowait_still_batch_and_await() -> None:
+    transport = _BlockingTransport({"frame.info": {"total": 3}})
+    assert isinstance(transport, Transport)
+    assert not isinstance(transport, PipelinedTransport)
+    assert isinstance(_PipelinedTransport({}), PipelinedTransport)
+    scene = Molvis(name="batch-blocking", transport=transport)
+
+    with scene.batch() as batch:
+        info = scene.send_cmd("frame.info", {}, wait_for_response=True)
+        scene.send_cmd("overlay.mark_atom", {})
+
+    assert info.result() == {"total": 3}
+    assert batch.results == [{"total": 3}, None]
+    assert asyncio.run(scene.send_cmd_async("frame.info", {})) == {"total": 3}
+    assert [kind for kind, _ in transport.log] == ["blocking"] * 3
+
+
+def test_batch_waits_for_every_reply_before_returning() -> None:
+    transport = _PipelinedTransport({"camera.get_pose": {"alpha": 1.0}})
+    transport.auto_reply = False
+    scene = Molvis(name="batch-wait", transport=transport)
+
+    with pytest.raises(TimeoutError):
+        with scene.batch(timeout=0.05):
+            scene.send_cmd("camera.get_pose", {}, wait_for_response=True)
+
+    assert [f.cancelled() for _, f in transport.pending] == [True]
+
+
+def test_batch_raises_the_first_frontend_error_after_collecting() -> None:
+    transport = _PipelinedTransport(
+        {"scene.draw_frame": RuntimeError("bad frame"), "frame.info": {"total": 3}}
+    )
+    scene = Molvis(name="batch-error", transport=transport)
+
+    with pytest.raises(MolvisRPCError, match="bad frame"):
+        with scene.batch() as batch:
+            scene.send_cmd("scene.draw_frame", {}, wait_for_response=True)
+            scene.send_cmd("frame.info", {}, wait_for_response=True)
+
+    assert batch.results == [None, {"total": 3}]
+
+
+def test_send_cmd_async_keeps_requests_in_flight_together() -> None:
+    transport = _PipelinedTransport({})
+    transport.auto_reply = False
+    scene = Molvis(name="async", transport=transport)
+
+    async def run() -> list[Any]:
+        calls = asyncio.gather(
+            scene.send_cmd_async("frame.info", {}),
+            scene.send_cmd_async("camera.get_pose", {}),
+        )
+        while len(transport.pending) < 2:
+            await asyncio.sleep(0.001)
+        # Both requests are out, in call order, before either reply arrives.
+        assert [m for m, _ in transport.pending] == ["frame.info", "camera.get_pose"]
+        for i, (_, future) in enumerate(reversed(transport.pending)):
+            future.set_result({"jsonrpc": "2.0", "id": i, "result": i})
+        return await calls
+
+    assert asyncio.run(run()) == [1, 0]
@@ -217,28 +217,18 @@ def test_snapshot_decodes_legacy_data_url():
     assert host.snapshot() == png_bytes
 
 
-def test_render_animation_orchestrates_seek_pose_snapshot(tmp_path: Path, monkeypatch):
+def test_render_animation_sends_frame_and_pose_with_each_snapshot(
+    tmp_path: Path, monkeypatch
+):
     control = import_control_module()
     png_bytes = b"\x89PNG\r\n\x1a\nFRAME"
 
     class Host(control.ControlMixin, FakeViewer):
         pass
 
-    pose_response = {
-        "success": True,
-        "pose": {
-            "alpha": 0.0,
-            "beta": 1.0,
-            "radius": 10.0,
-            "target": [0.0, 0.0, 0.0],
-            "position": [10.0, 0.0, 0.0],
-            "up": [0.0, 0.0, 1.0],
-        },
-    }
     host = Host(
         responses={
             "frame.info": {"current": 0, "total": 3},
-            "camera.set_pose": pose_response,
             "capture.snapshot": {"png_ref": png_bytes},
         }
     )
@@ -279,9 +269,15 @@ def test_render_animation_orchestrates_seek_pose_snapshot(tmp_path: Path, monkey
     assert all(f == png_bytes for f in captured["frames"])
     assert captured["kwargs"]["fps"] == 24
 
-    methods = [c["method"] for c in host.calls]
-    assert methods.count("camera.set_pose") == 3
-    assert methods.count("capture.snapshot") == 3
+    assert [c["method"] for c in host.calls] == ["capture.snapshot"] * 3
+    sent = sorted((c["params"] for c in host.calls), key=lambda p: p["frameIndex"])
+    assert [p["camera"]["alpha"] for p in sent] == [0.0, 1.0, 2.0]
+    assert sent[0]["camera"] == {
+        "alpha": 0.0,
+        "beta": 1.0,
+        "radius": 10.0,
+        "target": [0.0, 0.0, 0.0],
+    }
 
 
 def test_render_animation_rejects_mismatched_lengths():
@@ -298,3 +294,174 @@ def test_render_animation_rejects_mismatched_lengths():
         host.render_animation(
             "out.mp4", frame_indices=[0, 1, 2], camera_path=[None, None]
         )
+
+
+def test_render_animation_keeps_snapshots_in_flight_and_orders_them(
+    tmp_path: Path, monkeypatch
+):
+    import threading
+
+    control = import_control_module()
+    second_started = threading.Event()
+
+    def capture(params: dict[str, Any]) -> dict[str, Any]:
+        index = params["frameIndex"]
+        if index == 1:
+            second_started.set()
+        if index == 0:
+            # Only finishes if frame 1 was requested before frame 0 returned.
+            assert second_started.wait(timeout=5.0)
+        return {"png_ref": f"frame-{index}".encode()}
+
+    class Host(control.ControlMixin, FakeViewer):
+        pass
+
+    host = Host(responses={"capture.snapshot": capture})
+    captured: dict[str, Any] = {}
+
+    def fake_write_video(frames, path, **kwargs):
+        captured["frames"] = list(frames)
+        return Path(path)
+
+    import molvis.video as video_mod
+
+    monkeypatch.setattr(video_mod, "write_video", fake_write_video)
+
+    host.render_animation(tmp_path / "out.mp4", frame_indices=[0, 1, 2, 3], prefetch=3)
+
+    assert captured["frames"] == [f"frame-{i}".encode() for i in range(4)]
+    assert sorted(c["params"]["frameIndex"] for c in host.calls) == [0, 1, 2, 3]
+
+    import pytest
+
+    with pytest.raises(ValueError, match="prefetch"):
+        host.render_animation(tmp_path / "out.mp4", frame_indices=[0], prefetch=0)
+
+
+def test_snapshot_rgba_returns_checked_raw_pixels():
+    control = import_control_module()
+    pixels = np.arange(2 * 3 * 4, dtype=np.uint8)
+
+    class Host(control.ControlMixin, FakeViewer):
+        pass
+
+    host = Host(
+        responses={
+            "capture.snapshot": lambda params: {
+                "format": params.get("format", "png"),
+                "width": 2,
+                "height": params["height"],
+                "rgba_ref": pixels,
+            }
+        }
+    )
+
+    assert host.snapshot(width=2, height=3, format="rgba") == pixels.tobytes()
+    assert host.calls[0]["params"]["format"] == "rgba"
+
+    import pytest
+
+    with pytest.raises(ValueError, match="expected 32"):
+        host.snapshot(width=2, height=4, format="rgba")
+    with pytest.raises(ValueError, match="auto_crop"):
+        host.snapshot(format="rgba", auto_crop=True)
+
+
+def test_rgba_frames_must_match_the_requested_size(tmp_path: Path, monkeypatch):
+    control = import_control_module()
+    written: list[bytes] = []
+
+    def fake_write_video(frames, path, **kwargs):
+        written.extend(frames)
+        return Path(path)
+
+    import molvis.video as video_mod
+
+    monkeypatch.setattr(video_mod, "write_video", fake_write_video)
+
+    class Host(control.ControlMixin, FakeViewer):
+        pass
+
+    # The page resized the canvas: a self-consistent 3x2 capture.
+    host = Host(
+        responses={
+            "capture.snapshot": lambda params: {
+                "format": "rgba",
+                "width": 3,
+                "height": 2,
+                "rgba_ref": np.zeros(3 * 2 * 4, dtype=np.uint8),
+            }
+        }
+    )
+
+    import pytest
+
+    with pytest.raises(ValueError, match="3x2, requested 2x3"):
+        host.snapshot(width=2, height=3, format="rgba")
+    assert len(host.snapshot(format="rgba")) == 24
+    with pytest.raises(ValueError, match="requested 2x3"):
+        host.render_animation(
+            tmp_path / "out.mp4",
+            frame_indices=[0, 1],
+            width=2,
+            height=3,
+            frame_format="rgba",
+        )
+    assert written == []
+    with pytest.raises(ValueError, match="does not match"):
+        host.render_animation(
+            tmp_path / "out.mp4",
+            frame_indices=[0],
+            width=3,
+            height=2,
+            frame_format="rgba",
+            size=(2, 3),
+        )
+
+
+def test_write_video_pipes_rgba_as_rawvideo(tmp_path: Path, monkeypatch):
+    import io
+    import subprocess
+
+    import pytest
+
+    import molvis.video as video_mod
+
+    launched: dict[str, Any] = {}
+
+    class Sink:
+        closed = False
+
+        def write(self, data):
+            launched.setdefault("written", b"")
+            launched["written"] += bytes(data)
+
+        def close(self):
+            self.closed = True
+
+    class FakeProc:
+        def __init__(self, cmd, stdin, stderr):
+            launched["cmd"] = cmd
+            self.stdin = Sink()
+            self.stderr = io.BytesIO()
+
+        def wait(self):
+            return 0
+
+    monkeypatch.setattr(video_mod, "_find_ffmpeg_executable", lambda: "ffmpeg")
+    monkeypatch.setattr(subprocess, "Popen", FakeProc)
+
+    frames = [bytes([i]) * 16 for i in range(3)]
+    video_mod.write_video(
+        frames, tmp_path / "out.mp4", frame_format="rgba", size=(2, 2)
+    )
+
+    cmd = launched["cmd"]
+    assert cmd[cmd.index("-f") + 1] == "rawvideo"
+    assert cmd[cmd.index("-pix_fmt") + 1] == "rgba"
+    assert cmd[cmd.index("-s") + 1] == "2x2"
+    assert "image2pipe" not in cmd
+    assert launched["written"] == b"".join(frames)
+
+    with pytest.raises(ValueError, match="requires size"):
+        video_mod.write_video(frames, tmp_path / "out.mp4", frame_format="rgba")
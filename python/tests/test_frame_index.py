@@ -0,0 +1,155 @@
+"""Tests for the ``.molidx`` frame index used by ``molvis open``.
+
+The sidecar layout must stay byte-compatible with the frontend codec in
+``core/src/io/cache/molidx_codec.ts``; these tests pin that layout and
+check that indexed frames match what the molpy readers produce.
+"""
+
+from __future__ import annotations
+
+import struct
+from pathlib import Path
+
+import molpy as mp
+import numpy as np
+import pytest
+
+from molvis.cli import _open_trajectory
+from molvis.frame_index import (
+    IndexedTrajectoryReader,
+    build_frame_index,
+    decode_molidx,
+    encode_molidx,
+    open_indexed_trajectory,
+)
+
+_DUMP_FRAME = """\
+ITEM: TIMESTEP
+{step}
+ITEM: NUMBER OF ATOMS
+2
+ITEM: BOX BOUNDS pp pp pp
+0 10
+0 10
+0 10
+ITEM: ATOMS id type x y z
+1 1 {x} 0.0 0.0
+2 2 1.0 1.0 1.0
+"""
+
+
+def _write_dump(path: Path, n: int) -> None:
+    path.write_text(
+        "".join(_DUMP_FRAME.format(step=i * 10, x=float(i)) for i in range(n))
+    )
+
+
+def test_molidx_layout_matches_frontend_codec(tmp_path: Path) -> None:
+    path = tmp_path / "run.lammpstrj"
+    _write_dump(path, 3)
+
+    index = build_frame_index(path, "lammps-dump")
+    data = encode_molidx(index)
+
+    magic, version, format_id, reserved, nframes, total, source = struct.unpack_from(
+        "<IIIIIQQ", data
+    )
+    assert (magic, version, format_id, reserved) == (0x5849444D, 1, 1, 0)
+    assert nframes == 3
+    assert total == source == path.stat().st_size
+    assert len(data) == 36 + 3 * 12
+
+    decoded = decode_molidx(data)
+    assert decoded is not None
+    assert decoded.offsets.tolist() == index.offsets.tolist()
+    assert decoded.lengths.tolist() == index.lengths.tolist()
+    assert decode_molidx(data[:-1]) is None
+
+
+def test_indexed_frames_match_molpy_reader(tmp_path: Path) -> None:
+    path = tmp_path / "run.lammpstrj"
+    _write_dump(path, 4)
+
+    reader = open_indexed_trajectory(path, "lammps-dump")
+    reference = mp.io.read_lammps_trajectory(path)
+
+    assert reader.n_frames == 4
+    for i in (3, 0, 2):
+        ours = reader.read_frame(i).to_dict()
+        theirs = reference.read_frame(i).to_dict()
+        assert ours["meta"] == theirs["meta"]
+        assert set(ours["blocks"]["atoms"]) == set(theirs["blocks"]["atoms"])
+        for name, column in theirs["blocks"]["atoms"].items():
+            np.testing.assert_array_equal(ours["blocks"]["atoms"][name], column)
+    reader.close()
+
+
+def test_sidecar_is_reused_until_the_trajectory_changes(tmp_path: Path) -> None:
+    path = tmp_path / "run.xyz"
+    path.write_text("1\nfirst\nO 0 0 0\n1\nsecond\nH 1 0 0\n")
+
+    with open_indexed_trajectory(path, "xyz") as reader:
+        assert reader.n_frames == 2
+        assert reader.read_frame(1).meta["comment"] == "second"
+    sidecar = tmp_path / "run.xyz.molidx"
+    written = sidecar.stat().st_mtime_ns
+
+    with open_indexed_trajectory(path, "xyz") as reader:
+        assert reader.n_frames == 2
+    assert sidecar.stat().st_mtime_ns == written
+
+    with path.open("a") as fh:
+        fh.write("1\nthird\nC 2 0 0\n")
+    with open_indexed_trajectory(path, "xyz") as reader:
+        assert reader.n_frames == 3
+        assert reader.read_frame(-1).meta["comment"] == "third"
+
+
+_EXTXYZ_FRAME = """\
+2
+Lattice="10.0 0.0 0.0 0.0 11.0 0.0 0.0 0.0 12.0" Properties=species:S:1:pos:R:3:forces:R:3:tag:I:1 energy={energy} pbc="T T T"
+O {x} 0.1 0.2 1.0 2.0 3.0 7
+H 0.9 0.0 0.0 -1.0 -2.0 -3.0 8
+"""
+
+
+@pytest.mark.parametrize("suffix", [".extxyz", ".xyz"])
+def test_extended_xyz_keeps_every_column(tmp_path: Path, suffix: str) -> None:
+    path = tmp_path / f"run{suffix}"
+    path.write_text(
+        "".join(_EXTXYZ_FRAME.format(energy=-i, x=float(i)) for i in range(3))
+    )
+
+    reader = _open_trajectory(path)
+    reference = mp.io.read_xyz_trajectory(path)
+
+    assert not isinstance(reader, IndexedTrajectoryReader)
+    for i in (2, 0):
+        ours, theirs = reader.read_frame(i), reference.read_frame(i)
+        assert ours.to_dict()["meta"] == theirs.to_dict()["meta"]
+        ours_atoms = ours.to_dict()["blocks"]["atoms"]
+        theirs_atoms = theirs.to_dict()["blocks"]["atoms"]
+        assert {"forces_1", "tag"} <= set(theirs_atoms)
+        assert set(ours_atoms) == set(theirs_atoms)
+        for name, column in theirs_atoms.items():
+            np.testing.assert_array_equal(ours_atoms[name], column)
+        np.testing.assert_array_equal(ours.box.matrix, theirs.box.matrix)
+
+    with open_indexed_trajectory(path, "xyz") as indexed:
+        with pytest.raises(ValueError, match="extended XYZ"):
+            indexed.read_frame(0)
+
+
+def test_plain_xyz_is_indexed_and_matches_molpy(tmp_path: Path) -> None:
+    path = tmp_path / "run.xyz"
+    path.write_text("2\nstep 0\nO 0 0 0\nH 1 0 0\n2\nstep 1\nO 0 1 0\nH 1 1 0\n")
+
+    reader = _open_trajectory(path)
+    reference = mp.io.read_xyz_trajectory(path)
+
+    assert isinstance(reader, IndexedTrajectoryReader)
+    ours, theirs = reader.read_frame(1).to_dict(), reference.read_frame(1).to_dict()
+    assert ours["meta"] == theirs["meta"]
+    for name, column in theirs["blocks"]["atoms"].items():
+        np.testing.assert_array_equal(ours["blocks"]["atoms"][name], column)
+    reader.close()
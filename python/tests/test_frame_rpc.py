@@ -0,0 +1,185 @@
+"""Unit tests for the trajectory commands in ``FrameCommandsMixin``.
+
+Like ``test_pipeline_rpc.py`` these stub ``send_cmd`` and assert on the
+JSON-RPC payloads; no frontend is booted.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import molpy as mp
+import numpy as np
+import pytest
+
+from molvis import Molvis
+
+
+@pytest.fixture(autouse=True)
+def _reset_registry() -> None:
+    Molvis._scene_registry.clear()
+    yield
+    Molvis._scene_registry.clear()
+
+
+def _wire_send_cmd(scene: Molvis) -> list[dict[str, Any]]:
+    calls: list[dict[str, Any]] = []
+
+    def stub(method, params, buffers=None, wait_for_response=False, timeout=10.0):
+        calls.append({"method": method, "params": params})
+        if method == "pipeline.list":
+            return {"modifiers": []}
+        return {"success": True}
+
+    scene.send_cmd = stub  # type: ignore[method-assign]
+    return calls
+
+
+def _frame(x: float) -> mp.Frame:
+    atoms = {
+        "element": np.array(["O"]),
+        "x": np.array([x]),
+        "y": np.array([0.0]),
+        "z": np.array([0.0]),
+    }
+    return mp.Frame(blocks={"atoms": atoms})
+
+
+def test_set_trajectory_streams_chunks_from_a_generator() -> None:
+    scene = Molvis(name="traj-stream")
+    calls = _wire_send_cmd(scene)
+
+    scene.set_trajectory((_frame(float(i)) for i in range(5)), chunk_size=2)
+
+    trajectory_calls = [c for c in calls if c["method"] != "pipeline.list"]
+    assert [c["method"] for c in trajectory_calls] == [
+        "scene.set_trajectory",
+        "scene.append_frames",
+        "scene.append_frames",
+    ]
+    assert [len(c["params"]["frames"]) for c in trajectory_calls] == [2, 2, 1]
+    assert "boxes" not in trajectory_calls[0]["params"]
+    assert len(scene._mirror_trajectory) == 5
+    assert scene._mirror_boxes is None
+
+
+def test_set_trajectory_stream_rejects_empty_input() -> None:
+    scene = Molvis(name="traj-stream-empty")
+    _wire_send_cmd(scene)
+
+    with pytest.raises(ValueError):
+        scene.set_trajectory(iter(()), chunk_size=4)
+    with pytest.raises(ValueError):
+        scene.set_trajectory([_frame(0.0)], chunk_size=0)
+
+
+@pytest.mark.parametrize("policy", ["disk", "none"])
+def test_set_trajectory_stream_keeps_a_bounded_mirror(tmp_path, policy) -> None:
+    scene = Molvis(name=f"traj-stream-{policy}")
+    _wire_send_cmd(scene)
+    scene.set_mirror_policy(policy, directory=tmp_path, hot_frames=2)
+
+    scene.set_trajectory((_frame(float(i)) for i in range(50)), chunk_size=4)
+
+    store = scene._mirror_trajectory
+    if policy == "none":
+        assert store is None
+    else:
+        assert len(store) == 50
+        # Only the hot frames stay resident; the rest live in the spill file.
+        assert len(store._hot) == 2
+    scene.close()
+
+
+def test_set_trajectory_rejects_boxes_that_do_not_match_the_frames() -> None:
+    scene = Molvis(name="traj-boxes")
+    calls = _wire_send_cmd(scene)
+    box = mp.Box(np.eye(3) * 10.0)
+    frames = [_frame(float(i)) for i in range(5)]
+
+    with pytest.raises(ValueError, match="got 4 for 5"):
+        scene.set_trajectory(frames, [box] * 4)
+    with pytest.raises(ValueError, match="got 6 for 5"):
+        scene.set_trajectory(frames, [box] * 6, chunk_size=2)
+    assert calls == []
+
+    with pytest.raises(ValueError, match="got 3 for 4"):
+        scene.set_trajectory(iter(frames), iter([box] * 3), chunk_size=2)
+    with pytest.raises(ValueError, match="more than 5"):
+        scene.set_trajectory(iter(frames), iter([box] * 6), chunk_size=2)
+
+
+class _FakeReader:
+    """Minimal molpy-style trajectory reader that counts reads."""
+
+    def __init__(self, n: int) -> None:
+        self.n_frames = n
+        self.reads: list[int] = []
+
+    def read_frame(self, index: int) -> mp.Frame:
+        if index >= self.n_frames:
+            raise IndexError(index)
+        self.reads.append(index)
+        return _frame(float(index))
+
+
+def test_attach_trajectory_sends_only_the_frame_count() -> None:
+    scene = Molvis(name="traj-attach")
+    calls = _wire_send_cmd(scene)
+    reader = _FakeReader(1000)
+
+    scene.attach_trajectory(reader)
+
+    assert calls[0] == {
+        "method": "scene.attach_trajectory",
+        "params": {"n_frames": 1000},
+    }
+    assert reader.reads == []
+    assert scene._mirror_trajectory is None
+    assert scene._attached_reader() is reader
+
+
+def test_frame_request_is_answered_with_provide_frame() -> None:
+    scene = Molvis(name="traj-attach-serve")
+    # float64 leaves coordinates unconverted, so only the worker's copy
+    # separates them from the reader's molrs storage.
+    scene.coordinate_precision = "float64"
+    _wire_send_cmd(scene)
+    reader = _FakeReader(3)
+    scene.attach_trajectory(reader)
+
+    sent: list[dict[str, Any]] = []
+
+    def capture(method, params, *, buffers=None, wait_for_response=False, timeout=10.0):
+        sent.append({"method": method, "params": params})
+
+    scene._transport.send_request = capture  # type: ignore[method-assign]
+
+    scene._handle_frame_request({"index": 2})
+    scene._handle_frame_request({"index": 7})
+    scene._frame_executor().shutdown(wait=True)
+
+    assert reader.reads == [2]
+    assert [c["method"] for c in sent] == ["scene.provide_frame"] * 2
+    first, second = (c["params"] for c in sent)
+    assert first["index"] == 2
+    atoms = first["frame"]["blocks"]["atoms"]
+    assert atoms["element"].tolist() == ["O"]
+    assert atoms["x"].tolist() == [2.0]
+    assert all(col.flags.owndata for col in atoms.values())
+    assert second == {"index": 7, "error": "IndexError: 7"}
+
+
+def test_trajectory_coordinates_follow_the_scene_precision() -> None:
+    scene = Molvis(name="traj-precision")
+    calls = _wire_send_cmd(scene)
+
+    scene.set_trajectory([_frame(0.0)])
+    assert calls[0]["params"]["frames"][0]["blocks"]["atoms"]["x"].dtype == np.float32
+
+    scene.coordinate_precision = "float64"
+    scene.set_trajectory([_frame(0.0)])
+    assert calls[-2]["params"]["frames"][0]["blocks"]["atoms"]["x"].dtype == np.float64
+
+    with pytest.raises(ValueError):
+        scene.coordinate_precision = "float8"  # type: ignore[assignment]
@@ -0,0 +1,147 @@
+"""Mirror policies: where the frames kept for reconnect replay live."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import molpy as mp
+import numpy as np
+import pytest
+
+from molvis import Molvis
+from molvis.mirror import DiskFrameStore, MemoryFrameStore, _FrameStore
+from molvis.transport._codec import QuantizedArray
+
+
+@pytest.fixture(autouse=True)
+def _reset_registry() -> None:
+    Molvis._scene_registry.clear()
+    yield
+    Molvis._scene_registry.clear()
+
+
+def _frames(n: int) -> list[mp.Frame]:
+    return [
+        mp.Frame(
+            blocks={
+                "atoms": {
+                    "element": np.array(["O", "H", "H"]),
+                    "x": np.array([0.0, 0.96, -0.24]) + i,
+                    "y": np.array([0.0, 0.0, 0.93]),
+                    "z": np.zeros(3),
+                }
+            }
+        )
+        for i in range(n)
+    ]
+
+
+def _assert_same_frames(ours: list[dict], theirs: list[dict]) -> None:
+    assert len(ours) == len(theirs)
+    for a, b in zip(ours, theirs):
+        assert a.get("delta") == b.get("delta")
+        assert a["blocks"].keys() == b["blocks"].keys()
+        for name, cols in b["blocks"].items():
+            assert a["blocks"][name].keys() == cols.keys()
+            for key, value in cols.items():
+                got = a["blocks"][name][key]
+                if isinstance(value, QuantizedArray):
+                    assert (got.scale, got.offset) == (value.scale, value.offset)
+                    got, value = got.values, value.values
+                np.testing.assert_array_equal(got, value)
+                assert got.dtype == value.dtype
+
+
+def test_disk_store_spills_arrays_and_keeps_only_hot_frames(tmp_path: Path) -> None:
+    frames = [
+        {
+            "blocks": {
+                "atoms": {
+                    "element": np.array(["C", "Cl"]),
+                    "x": np.arange(5, dtype=np.float32) + i,
+                    "y": QuantizedArray(np.arange(5, dtype=np.int16), 0.5, 1.0),
+                }
+            },
+            **({"delta": True} if i else {}),
+        }
+        for i in range(4)
+    ]
+    store = DiskFrameStore(tmp_path, hot_frames=1)
+    store.extend(frames[:2])
+    store.extend(frames[2:])
+
+    assert len(store) == 4
+    assert list(store._hot) == [3]
+    replayed = list(store)
+    _assert_same_frames(replayed, frames)
+    assert isinstance(replayed[0]["blocks"]["atoms"]["x"], np.memmap)
+    assert store.nbytes >= 4 * (5 * 4 + 5 * 2)
+
+    assert store[0]["blocks"]["atoms"]["element"].tolist() == ["C", "Cl"]
+    assert list(store._hot) == [0]
+
+    in_memory = MemoryFrameStore()
+    in_memory.extend(frames)
+    assert store.digests() == in_memory.digests()
+    assert len(set(store.digests())) == 4
+
+    store.close()
+    # Views handed out before close keep the spill file readable.
+    _assert_same_frames(replayed, frames)
+    assert store.path.exists()
+    del replayed
+    assert not store.path.exists()
+
+
+def test_abstract_frame_store_cannot_be_instantiated() -> None:
+    with pytest.raises(TypeError):
+        _FrameStore()  # type: ignore[abstract]
+
+
+def test_disk_policy_replays_the_same_payload(tmp_path: Path) -> None:
+    reference = Molvis(name="mirror-memory")
+    reference.coordinate_precision = "int16"
+    reference._record_trajectory(reference._trajectory_params(_frames(5), None))
+
+    scene = Molvis(name="mirror-disk")
+    scene.coordinate_precision = "int16"
+    assert scene.set_mirror_policy("disk", directory=tmp_path, hot_frames=2) is scene
+    params = scene._trajectory_params(_frames(3), None)
+    scene._record_trajectory(params)
+    scene._append_trajectory(scene._trajectory_params(_frames(5)[3:], None))
+
+    assert scene.mirror_policy == "disk"
+    assert len(scene._mirror_trajectory) == 5
+    expected = reference._build_state_payload()["frames"]
+    # Appended chunks restart delta encoding at their first frame.
+    expected[3] = scene._trajectory_params(_frames(5)[3:], None)["frames"][0]
+    _assert_same_frames(scene._build_state_payload()["frames"], expected)
+
+    spill = scene._mirror_trajectory.path
+    scene.close()
+    assert not spill.exists()
+
+
+def test_switching_policy_moves_or_drops_the_mirror(tmp_path: Path) -> None:
+    scene = Molvis(name="mirror-switch")
+    box = mp.Box(np.eye(3) * 10.0)
+    scene._record_trajectory(scene._trajectory_params(_frames(3), [box] * 3))
+    before = scene._build_state_payload()
+
+    scene.set_mirror_policy("disk", directory=tmp_path)
+    after = scene._build_state_payload()
+    _assert_same_frames(after["frames"], before["frames"])
+    assert after["boxes"] == before["boxes"]
+    spill = scene._mirror_trajectory.path
+
+    scene.set_mirror_policy("none")
+    assert not spill.exists()
+    assert scene._build_state_payload()["frames"] is None
+    assert scene._build_state_payload()["boxes"] is None
+
+    scene._record_trajectory(scene._trajectory_params(_frames(2), None))
+    scene._append_trajectory(scene._trajectory_params(_frames(2), None))
+    assert scene._mirror_trajectory is None
+
+    with pytest.raises(ValueError, match="mirror policy"):
+        scene.set_mirror_policy("zarr")  # type: ignore[arg-type]
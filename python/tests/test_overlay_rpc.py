@@ -0,0 +1,91 @@
+"""Overlay commands that carry bulk data as binary buffers."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from molvis import Molvis
+from molvis.transport import BinaryPayloadEncoder
+
+
+def _capture(molvis: Molvis, response=None) -> list[tuple[str, dict]]:
+    calls: list[tuple[str, dict]] = []
+
+    def mock_send_cmd(method, params, buffers=None, wait_for_response=False, timeout=10.0):
+        calls.append((method, params))
+        return response if wait_for_response else None
+
+    molvis.send_cmd = mock_send_cmd
+    return calls
+
+
+def test_draw_vector_field_sends_float32_buffers():
+    molvis = Molvis(name="vfield")
+    calls = _capture(molvis, {"id": "vfield_1"})
+    positions = np.arange(12, dtype=np.float64).reshape(4, 3)
+    vectors = np.ones((4, 3), dtype=np.float32)
+
+    overlay_id = molvis.draw_vector_field(positions, vectors, wait_for_response=True)
+
+    method, params = calls[0]
+    assert overlay_id == "vfield_1"
+    assert method == "overlay.add"
+    assert params["positions"].dtype == np.float32
+    assert params["vectors"].shape == (12,)
+    encoder = BinaryPayloadEncoder()
+    encoded = encoder.encode(params)
+    assert encoded["vectors"]["__molvis_buffer__"] is True
+    assert [buf.nbytes for buf in encoder.buffers] == [48, 48]
+
+
+@pytest.mark.parametrize("reply", [{"success": True}, {"id": ""}, None])
+def test_draw_vector_field_raises_when_the_reply_has_no_id(reply):
+    molvis = Molvis(name="vfield-no-id")
+    _capture(molvis, reply)
+
+    with pytest.raises(ValueError, match="no overlay id"):
+        molvis.draw_vector_field(
+            np.zeros((2, 3)), np.ones((2, 3)), wait_for_response=True
+        )
+
+
+def test_update_vector_field_sends_only_the_vectors():
+    molvis = Molvis(name="vfield-update")
+    calls = _capture(molvis)
+
+    molvis.update_vector_field("vfield_1", np.zeros((4, 3)))
+
+    method, params = calls[0]
+    assert method == "overlay.update_vectors"
+    assert set(params) == {"id", "vectors"}
+    assert params["vectors"].dtype == np.float32
+    assert params["vectors"].shape == (12,)
+
+
+def test_mark_atoms_sends_one_request_and_returns_every_id():
+    molvis = Molvis(name="marks")
+    calls = _capture(molvis, {"ids": ["mark_atom_1", "mark_atom_2", "mark_atom_3"]})
+
+    ids = molvis.mark_atoms(
+        np.array([4, 7, 9]), labels=["a", None, "c"], colors="#00ff00"
+    )
+
+    assert ids == ["mark_atom_1", "mark_atom_2", "mark_atom_3"]
+    assert len(calls) == 1
+    method, params = calls[0]
+    assert method == "overlay.mark_atoms"
+    assert params["anchorAtomIds"].dtype == np.uint32
+    assert params["labels"] == ["a", None, "c"]
+    assert params["colors"] == ["#00ff00"] * 3
+
+
+def test_mark_atoms_rejects_mismatched_labels_and_negative_ids():
+    molvis = Molvis(name="marks-invalid")
+    calls = _capture(molvis)
+
+    with pytest.raises(ValueError, match="one entry per atom"):
+        molvis.mark_atoms([1, 2], labels=["only one"])
+    with pytest.raises(ValueError, match="non-negative"):
+        molvis.mark_atoms([-1])
+    assert calls == []
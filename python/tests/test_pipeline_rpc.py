@@ -5,9 +5,10 @@ arguments into the correct JSON-RPC payload and decodes responses into
 the typed dataclasses. They don't boot a frontend — the router itself is
 covered in the core test suite.
 
-Every mutator (add/remove/reorder/set_enabled/set_selection_scope/clear) now also
-triggers a follow-up ``pipeline.list`` call that refreshes the
-Python-side mirror used for state sync on WS reconnect. The tests assert
+Every mutator (add/remove/reorder/set_enabled/set_selection_scope/clear)
+also refreshes the Python-side mirror used for state sync on WS
+reconnect: from the ``pipeline`` its reply carries, or, for replies
+without one, from a follow-up ``pipeline.list`` call. The tests assert
 both the mutation RPC **and** the mirror refresh.
 """
 
@@ -15,10 +16,12 @@ from __future__ import annotations
 
 from typing import Any
 
+import molpy as mp
+import numpy as np
 import pytest
 
 from molvis import Molvis
-from molvis.commands import AvailableModifier, ModifierInfo
+from molvis.commands import AvailableModifier, ModifierInfo, ModifierSpec
 
 
 @pytest.fixture(autouse=True)
@@ -185,6 +188,111 @@ def test_add_modifier_omits_unset_params() -> None:
     assert calls[0]["params"] == {"name": "Slice"}
 
 
+def test_mutation_reply_pipeline_skips_the_list_round_trip() -> None:
+    scene = Molvis(name="pipeline-reply")
+    modifier = {
+        "id": "slice-1",
+        "name": "Slice",
+        "category": "Geometry",
+        "enabled": False,
+        "selection_scope_id": None,
+        "source_owner_id": None,
+    }
+    calls = _wire_send_cmd(
+        scene,
+        {
+            "pipeline.add_modifier": {"modifier": modifier, "pipeline": [modifier]},
+            "pipeline.set_enabled": {"success": True, "pipeline": []},
+            "scene.draw_frame": {"success": True, "pipeline": [modifier]},
+        },
+    )
+
+    info = scene.add_modifier("Slice")
+    assert scene._mirror_pipeline == [info]
+    scene.set_modifier_enabled("slice-1", True)
+    assert scene._mirror_pipeline == []
+    scene.draw_frame(mp.Frame(blocks={"atoms": {"x": np.zeros(2)}}))
+
+    assert [c["method"] for c in calls] == [
+        "pipeline.add_modifier",
+        "pipeline.set_enabled",
+        "scene.draw_frame",
+    ]
+    assert [m.id for m in scene._mirror_pipeline] == ["slice-1"]
+
+
+def test_set_pipeline_flattens_the_spec_tree_into_one_call() -> None:
+    scene = Molvis(name="pipeline-set")
+    created = [
+        {
+            "id": mod_id,
+            "name": name,
+            "category": "Selection",
+            "enabled": True,
+            "selection_scope_id": scope,
+            "source_owner_id": None,
+        }
+        for mod_id, name, scope in [
+            ("alpha", "Expression Select", None),
+            ("bravo", "Hide Selection", "alpha"),
+            ("charlie", "Hide Hydrogens", None),
+        ]
+    ]
+    calls = _wire_send_cmd(
+        scene,
+        {"pipeline.set": {"modifiers": created, "pipeline": created}},
+    )
+
+    result = scene.set_pipeline(
+        [
+            ModifierSpec(
+                "Expression Select",
+                children=({"name": "Hide Selection", "enabled": False},),
+            ),
+            "Hide Hydrogens",
+        ],
+        replace=False,
+    )
+
+    assert [c["method"] for c in calls] == ["pipeline.set"]
+    assert calls[0]["params"] == {
+        "modifiers": [
+            {"name": "Expression Select", "ref": "#0"},
+            {"name": "Hide Selection", "enabled": False, "selection_scope": "#0"},
+            {"name": "Hide Hydrogens"},
+        ],
+        "replace": False,
+    }
+    assert [m.id for m in result] == ["alpha", "bravo", "charlie"]
+    assert scene._mirror_pipeline == result
+
+
+def test_set_pipeline_keeps_explicit_refs_and_links() -> None:
+    scene = Molvis(name="pipeline-set-refs")
+    calls = _wire_send_cmd(scene, {"pipeline.set": {"modifiers": [], "pipeline": []}})
+
+    scene.set_pipeline(
+        [
+            {"name": "Expression Select", "ref": "sel", "source_owner": "ds-1"},
+            {"name": "Hide Selection", "selection_scope": "sel"},
+        ]
+    )
+
+    assert calls[0]["params"]["replace"] is True
+    assert calls[0]["params"]["modifiers"] == [
+        {"name": "Expression Select", "ref": "sel", "source_owner": "ds-1"},
+        {"name": "Hide Selection", "selection_scope": "sel"},
+    ]
+    with pytest.raises(TypeError, match="ModifierSpec"):
+        scene.set_pipeline([42])  # type: ignore[list-item]
+    # "#0" would collide with the ref generated for the first parent.
+    with pytest.raises(ValueError, match="reserved"):
+        scene.set_pipeline(
+            [{"name": "Expression Select", "ref": "#0", "children": ["Hide Selection"]}]
+        )
+    assert len(calls) == 1
+
+
 def test_remove_modifier_returns_cascade_ids() -> None:
     scene = Molvis(name="pipeline-remove")
     calls = _wire_send_cmd(
@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import inspect
 
+import numpy as np
 import pytest
 
 from molvis import DisplaySurface, Molvis
@@ -194,7 +195,12 @@ def test_fire_and_forget_returns_self_for_chaining() -> None:
 
 
 def test_visual_style_is_global_not_a_draw_argument() -> None:
-    for method_name in ("draw_frame", "draw_atomistic", "draw_atoms"):
+    for method_name in (
+        "draw_frame",
+        "draw_atomistic",
+        "draw_atoms",
+        "draw_atom_arrays",
+    ):
         parameters = inspect.signature(getattr(Molvis, method_name)).parameters
         for visual_parameter in (
             "style",
@@ -210,6 +216,40 @@ def test_visual_style_is_global_not_a_draw_argument() -> None:
     assert "outline" in style_parameters
 
 
+def test_draw_atom_arrays_sends_table_columns_without_copying() -> None:
+    fake = FakeTransport()
+    scene = Molvis(name="columns", transport=fake)
+    scene.coordinate_precision = "float64"
+    x = np.arange(4, dtype=np.float64)
+    table = {"x": x, "y": x, "z": x, "symbol": np.array(["O", "H", "H", "C"])}
+
+    scene.draw_atom_arrays(table, color="#ff0000")
+
+    method, params, _meta = fake.sent[0]
+    atoms = params["frame"]["blocks"]["atoms"]
+    assert method == "scene.draw_frame"
+    assert np.shares_memory(atoms["x"], x)
+    assert list(atoms["symbol"]) == ["O", "H", "H", "C"]
+    assert list(atoms["color"]) == ["#ff0000"] * 4
+
+
+def test_draw_atom_arrays_splits_positions_and_validates() -> None:
+    fake = FakeTransport()
+    scene = Molvis(name="positions", transport=fake)
+    xyz = np.arange(6, dtype=np.float32).reshape(2, 3)
+
+    scene.draw_atom_arrays(xyz, ["O", "H"])
+
+    atoms = fake.sent[0][1]["frame"]["blocks"]["atoms"]
+    np.testing.assert_array_equal(atoms["y"], [1.0, 4.0])
+    with pytest.raises(ValueError, match="non-finite"):
+        scene.draw_atom_arrays(np.array([[0.0, np.nan, 0.0]]))
+    with pytest.raises(ValueError, match="one entry per atom"):
+        scene.draw_atom_arrays(xyz, ["O"])
+    with pytest.raises(ValueError, match="shape"):
+        scene.draw_atom_arrays(np.zeros((2, 2)))
+
+
 def test_global_style_serializes_optional_outline() -> None:
     fake = FakeTransport()
     scene = Molvis(name="outlined", transport=fake)
@@ -361,3 +401,20 @@ def test_close_stops_transport_and_drops_registry() -> None:
     scene.close()
     assert fake.stopped is True
     assert "close-test" not in Molvis.list_scenes()
+
+
+def test_scenes_on_a_hub_get_their_own_session() -> None:
+    from molvis import TransportHub
+
+    hub = TransportHub()
+    a = Molvis(name="hub-a", transport=hub, display_surface=DisplaySurface.HEADLESS)
+    b = Molvis(name="hub-b", transport=hub, gui=False)
+
+    assert a._transport.hub is hub and b._transport.hub is hub
+    assert (a._transport.session, b._transport.session) == ("hub-a", "hub-b")
+    assert a._transport._event_bus is a._events
+    assert sorted(hub.sessions) == ["hub-a", "hub-b"]
+    assert Molvis(name="hub-a", transport=hub) is a
+
+    a.close()
+    assert hub.sessions == ["hub-b"]
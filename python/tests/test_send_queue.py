@@ -0,0 +1,88 @@
+"""Outbound queue high-water marks and overflow policies."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from molvis.transport import SendQueueStats, WebSocketTransport
+from molvis.transport.websocket import _Client, _Outgoing, _settle
+
+_CLIENT = _Client(id="client-1", ws=None, session="s")
+
+
+def _transport(**kwargs) -> WebSocketTransport:
+    return WebSocketTransport(open_browser=False, **kwargs)
+
+
+def _item(method: str, nbytes: int = 10, *, expects_reply: bool = False) -> _Outgoing:
+    return _Outgoing(
+        method=method,
+        expects_reply=expects_reply,
+        nbytes=nbytes,
+        targets=[_CLIENT],
+        json_bytes=b"{}",
+        buffers={None: []},
+        owner=None,
+    )
+
+
+def test_drop_discards_fire_and_forget_requests_over_the_mark() -> None:
+    tport = _transport(max_queued_messages=2, overflow="drop")
+    first, second, third = _item("a"), _item("b"), _item("c")
+
+    assert tport._enqueue(first, None) and tport._enqueue(second, None)
+    assert tport._enqueue(third, None) is False
+    assert third.sent.result(timeout=0) is None
+    with pytest.raises(TimeoutError, match="Send queue still full"):
+        tport._enqueue(_item("d", expects_reply=True), 0.05)
+
+    _settle([first], None)
+    stats = tport.send_queue
+    assert isinstance(stats, SendQueueStats)
+    assert (stats.depth, stats.bytes_in_flight) == (1, 10)
+    assert (stats.sent, stats.dropped, stats.coalesced) == (1, 1, 0)
+    assert stats.max_drain_latency >= stats.drain_latency > 0
+
+
+def test_coalesce_replaces_the_queued_request_with_the_same_method() -> None:
+    tport = _transport(max_queued_bytes=25, overflow="coalesce")
+    frame, style, newer = _item("scene.draw_frame"), _item("scene.set_style"), _item(
+        "scene.draw_frame"
+    )
+
+    for item in (frame, style, newer):
+        assert tport._enqueue(item, None)
+
+    assert tport._outbox == [style, newer]
+    assert frame.sent.done() and frame.superseded
+    stats = tport.send_queue
+    assert (stats.depth, stats.bytes_in_flight, stats.coalesced) == (2, 20, 1)
+    assert stats.sent == 0
+
+
+def test_block_waits_until_the_queue_drains() -> None:
+    tport = _transport(max_queued_bytes=15)
+    first = _item("a")
+    assert tport._enqueue(first, None)
+    # A single request larger than the mark is still accepted when alone.
+    assert _transport(max_queued_bytes=1)._enqueue(_item("big", 100), None)
+
+    admitted = threading.Event()
+    worker = threading.Thread(
+        target=lambda: tport._enqueue(_item("b"), None) and admitted.set()
+    )
+    worker.start()
+    assert not admitted.wait(timeout=0.1)
+    _settle([first], ConnectionError("closed"))
+    assert admitted.wait(timeout=2)
+    worker.join()
+    assert tport.send_queue.sent == 0
+
+
+def test_invalid_queue_options_are_rejected() -> None:
+    with pytest.raises(ValueError, match="overflow"):
+        _transport(overflow="spill")
+    with pytest.raises(ValueError, match="max_queued_messages"):
+        _transport(max_queued_messages=0)
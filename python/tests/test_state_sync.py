@@ -87,8 +87,7 @@ def test_payload_carries_pipeline_and_frames() -> None:
         ),
     ]
     frame = _water_frame()
-    scene._mirror_trajectory = [frame]
-    scene._mirror_boxes = None
+    scene._record_trajectory(scene._trajectory_params([frame], None))
     calls = _capture_send_request(scene)
 
     scene._send_state_sync_snapshot()
@@ -102,6 +101,135 @@ def test_payload_carries_pipeline_and_frames() -> None:
     assert params["boxes"] is None
 
 
+def test_replay_resends_the_recorded_payload_without_reserializing(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    scene = Molvis(name="sync-cached")
+    params = scene._trajectory_params([_water_frame(), _water_frame()], None)
+    scene._record_trajectory(params)
+    calls = _capture_send_request(scene)
+
+    def fail(self):
+        raise AssertionError("state sync re-serialized a mirrored frame")
+
+    monkeypatch.setattr(mp.Frame, "to_dict", fail)
+    scene._send_state_sync_snapshot()
+
+    frames = calls[0]["params"]["frames"]
+    assert len(frames) == 2
+    assert all(a is b for a, b in zip(frames, params["frames"]))
+
+
+def _frames(n: int) -> list[mp.Frame]:
+    frames = []
+    for i in range(n):
+        frame = _water_frame()
+        frame["atoms"]["x"] = frame["atoms"]["x"] + i
+        frames.append(frame)
+    return frames
+
+
+def _resumable_scene(
+    monkeypatch: pytest.MonkeyPatch, name: str, have: Any
+) -> tuple[Molvis, list[dict[str, Any]]]:
+    """Scene with 5 mirrored frames in chunks of 2 and one modifier.
+
+    ``have(params)`` picks the hashes the fake page already holds from the
+    ``scene.state_manifest`` request, or raises to simulate a failed exchange.
+    """
+    monkeypatch.setattr("molvis.scene.SYNC_CHUNK_FRAMES", 2)
+    scene = Molvis(name=name)
+    scene._mirror_pipeline = [
+        ModifierInfo(
+            id="m1",
+            name="Slice",
+            category="Geometry",
+            enabled=True,
+            selection_scope_id=None,
+            source_owner_id=None,
+        )
+    ]
+    scene._record_trajectory(scene._trajectory_params(_frames(5), None))
+    calls: list[dict[str, Any]] = []
+
+    def stub(method, params, *, buffers=None, wait_for_response=False, timeout=10.0):
+        calls.append({"method": method, "params": params})
+        if method != "scene.state_manifest":
+            return None
+        held = set(have(params))
+        missing = [k for k in params["chunks"] + params["modifiers"] if k not in held]
+        return {"jsonrpc": "2.0", "id": 1, "result": {"missing": missing}}
+
+    scene._transport.send_request = stub  # type: ignore[method-assign]
+    return scene, calls
+
+
+def test_resumable_sync_sends_only_missing_chunks_and_modifiers(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    scene, calls = _resumable_scene(
+        monkeypatch,
+        "sync-resume",
+        lambda params: [params["chunks"][0], params["chunks"][2], *params["modifiers"]],
+    )
+    full = scene._build_state_payload()
+
+    scene._send_state_sync_snapshot(resume=True)
+
+    assert [c["method"] for c in calls] == ["scene.state_manifest", "scene.apply_state"]
+    manifest = calls[0]["params"]
+    assert manifest["scope"] == "sync-resume"
+    assert len(manifest["chunks"]) == 3 and len(set(manifest["chunks"])) == 3
+    params = calls[1]["params"]
+    assert params["scope"] == "sync-resume"
+    assert params["pipeline"] == [{"hash": manifest["modifiers"][0]}]
+    chunks = params["chunks"]
+    assert [c["hash"] for c in chunks] == manifest["chunks"]
+    assert set(chunks[0]) == set(chunks[2]) == {"hash"}
+    assert chunks[1]["frames"] == full["frames"][2:4]
+
+
+def test_resumable_sync_resends_everything_when_the_manifest_fails(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def fail(params):
+        raise RuntimeError("page went away")
+
+    scene, calls = _resumable_scene(monkeypatch, "sync-resume-fallback", fail)
+    full = scene._build_state_payload()
+    scene._send_state_sync_snapshot(resume=True)
+
+    params = calls[-1]["params"]
+    assert [e["id"] for e in params["pipeline"]] == ["m1"]
+    frames = [f for c in params["chunks"] for f in c["frames"]]
+    assert frames == full["frames"]
+    # Hashes depend only on content, so a second sync asks about the same keys.
+    scene._send_state_sync_snapshot(resume=True)
+    assert calls[-1]["params"]["chunks"][0]["hash"] == params["chunks"][0]["hash"]
+
+
+def test_resumable_sync_hashes_frames_once_outside_the_mirror_lock(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from molvis import mirror
+
+    scene, _ = _resumable_scene(monkeypatch, "sync-resume-lock", lambda params: [])
+    hashed: list[bool] = []
+
+    def digest(frame: dict[str, Any]) -> bytes:
+        hashed.append(scene._mirror_lock.locked())
+        return mirror.frame_digest(frame)
+
+    monkeypatch.setattr("molvis.scene.frame_digest", digest)
+    scene._send_state_sync_snapshot(resume=True)
+    assert hashed == [False] * 5
+    store = scene._mirror_trajectory
+    assert store.known_digests() == store.digests()
+
+    scene._send_state_sync_snapshot(resume=True)
+    assert len(hashed) == 5
+
+
 def test_event_bus_dispatch_triggers_send(monkeypatch: pytest.MonkeyPatch) -> None:
     scene = Molvis(name="sync-event")
     scene._mirror_pipeline = [
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import json
+import struct
+
 import numpy as np
 
 from molvis.transport import BinaryPayloadDecoder, BinaryPayloadEncoder
@@ -43,3 +46,159 @@ def test_binary_frame_round_trip() -> None:
     assert decoded_json == json_payload
     assert decoded_buffers[0] == buffer_a
     assert decoded_buffers[1] == buffer_b
+
+
+def test_binary_frame_parts_are_zero_copy_views() -> None:
+    from molvis.transport import encode_binary_frame, encode_binary_frame_parts
+
+    coords = np.arange(12, dtype=np.float64).reshape(4, 3)
+    ids = np.array([1, 2, 3], dtype=np.uint32)
+    json_payload = {"jsonrpc": "2.0", "method": "ping", "params": {}, "id": 1}
+
+    parts = encode_binary_frame_parts(
+        json_payload, [memoryview(coords), memoryview(ids)]
+    )
+
+    assert len(parts) == 3
+    assert parts[1].nbytes == coords.nbytes
+    assert np.shares_memory(np.frombuffer(parts[1], dtype=np.float64), coords)
+    assert b"".join(parts) == encode_binary_frame(
+        json_payload, [coords.tobytes(), ids.tobytes()]
+    )
+
+
+def test_binary_frame_v2_round_trip_is_auto_detected() -> None:
+    from molvis.transport import decode_binary_frame, encode_binary_frame
+    from molvis.transport._codec import FRAME_VERSION_V2
+
+    buffer_a = np.arange(6, dtype=np.float32).tobytes()
+    json_payload = {"jsonrpc": "2.0", "method": "ping", "params": {}, "id": 3}
+
+    frame = encode_binary_frame(json_payload, [buffer_a], version=FRAME_VERSION_V2)
+    decoded_json, decoded_buffers = decode_binary_frame(frame)
+
+    assert frame[:4] == b"MVB2"
+    assert decoded_json == json_payload
+    assert decoded_buffers == [buffer_a]
+
+
+def test_frame_deltas_send_repeated_columns_once() -> None:
+    from molvis.transport import encode_frame_deltas
+
+    element = np.array(["O", "H", "H"])
+    bonds = {
+        "i": np.array([0, 0], dtype=np.uint32),
+        "j": np.array([1, 2], dtype=np.uint32),
+    }
+
+    def blocks(x: float) -> dict:
+        return {
+            "atoms": {
+                "element": element.copy(),
+                "x": np.array([x, 1.0, 2.0]),
+                "y": np.zeros(3),
+                "z": np.zeros(3),
+            },
+            "bonds": dict(bonds),
+        }
+
+    first, second, third = blocks(0.0), blocks(0.5), blocks(0.5)
+    encoded = encode_frame_deltas([first, second, third])
+
+    assert "delta" not in encoded[0]
+    assert set(encoded[0]["blocks"]["atoms"]) == {"element", "x", "y", "z"}
+    assert encoded[1]["delta"] is True
+    assert list(encoded[1]["blocks"]) == ["atoms"]
+    assert list(encoded[1]["blocks"]["atoms"]) == ["x"]
+    assert encoded[2] == {"blocks": {}, "delta": True}
+
+    # A layout change (new column) resets to a full frame.
+    fourth = blocks(0.5)
+    fourth["atoms"]["charge"] = np.zeros(3)
+    assert "delta" not in encode_frame_deltas([third, fourth])[1]
+
+
+def test_coordinate_precision_narrows_only_coordinate_columns() -> None:
+    from molvis.transport import QuantizedArray, apply_coordinate_precision
+
+    x = np.linspace(-12.0, 40.0, 7)
+    blocks = {"atoms": {"x": x, "y": x, "z": x, "charge": x.copy()}}
+
+    f32 = apply_coordinate_precision(blocks, "float32")
+    assert f32["atoms"]["x"].dtype == np.float32
+    assert f32["atoms"]["charge"].dtype == np.float64
+    assert blocks["atoms"]["x"].dtype == np.float64
+    assert apply_coordinate_precision(blocks, "float16")["atoms"]["y"].dtype == np.float16
+
+    quantized = apply_coordinate_precision(blocks, "int16")["atoms"]["z"]
+    assert isinstance(quantized, QuantizedArray)
+    assert quantized.values.dtype == np.int16
+    np.testing.assert_allclose(quantized.dequantize(), x, atol=quantized.scale)
+
+    encoder = BinaryPayloadEncoder()
+    encoded = encoder.encode({"z": quantized})
+    assert encoded["z"]["dtype"] == "<i2"
+    assert encoded["z"]["scale"] == quantized.scale
+    decoded = BinaryPayloadDecoder().decode(encoded, encoder.buffers)
+    np.testing.assert_allclose(decoded["z"], x, atol=quantized.scale)
+
+
+def test_binary_frame_v3_flags_compressed_buffers() -> None:
+    from molvis.transport import decode_binary_frame, encode_binary_frame
+    from molvis.transport._codec import FRAME_VERSION_V3
+
+    compressible = np.zeros(4096, dtype=np.float64).tobytes()
+    small = np.arange(4, dtype=np.uint32).tobytes()
+    noisy = np.random.default_rng(0).bytes(8192)
+    json_payload = {"jsonrpc": "2.0", "method": "ping", "params": {}, "id": 4}
+
+    frame = encode_binary_frame(
+        json_payload,
+        [compressible, small, noisy],
+        version=FRAME_VERSION_V3,
+        codec="deflate",
+    )
+    codecs = [
+        struct.unpack_from("<QQI", frame, 8 + 20 * i)[2] for i in range(3)
+    ]
+
+    assert frame[:4] == b"MVB3"
+    # Small and incompressible buffers stay raw.
+    assert codecs == [1, 0, 0]
+    assert len(frame) < len(compressible)
+    decoded_json, decoded_buffers = decode_binary_frame(frame)
+    assert decoded_json == json_payload
+    assert decoded_buffers == [compressible, small, noisy]
+
+
+def test_rpc_batch_offsets_each_message_into_the_shared_buffers() -> None:
+    from molvis.transport import (
+        decode_binary_frame,
+        encode_binary_frame,
+        join_rpc_batch,
+    )
+
+    first = np.arange(3, dtype=np.float32)
+    second = np.arange(2, dtype=np.uint32)
+    decoder = BinaryPayloadDecoder()
+    messages = []
+    for request_id, params in enumerate(({"x": first}, {}, {"y": second}), 1):
+        encoder = BinaryPayloadEncoder()
+        request = {"jsonrpc": "2.0", "method": "m", "id": request_id}
+        request["params"] = encoder.encode(params)
+        messages.append((json.dumps(request).encode(), encoder.buffers))
+
+    json_bytes, buffers = join_rpc_batch(messages)
+    batch, frame_buffers = decode_binary_frame(
+        encode_binary_frame(json_bytes, buffers)
+    )
+
+    assert [entry.get("buffer_offset") for entry in batch] == [None, None, 1]
+    assert len(frame_buffers) == 2
+    decoded = [
+        decoder.decode(entry["params"], frame_buffers[entry.get("buffer_offset", 0) :])
+        for entry in batch
+    ]
+    np.testing.assert_array_equal(decoded[0]["x"], first)
+    assert decoded[1] == {}
+    np.testing.assert_array_equal(decoded[2]["y"], second)